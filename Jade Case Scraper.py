@@ -19,19 +19,46 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.common.by import By
 from bs4 import BeautifulSoup
-from urllib.parse import quote_plus
+try:
+    import lxml.html as lxml_html
+except ImportError:  # Fall back to BeautifulSoup's pure-Python parser
+    lxml_html = None
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # Download tracking falls back to scanning the folder
+    Observer = None
+    FileSystemEventHandler = object
+try:
+    from pypdf import PdfReader
+except ImportError:  # PDF validation skips the full parse
+    PdfReader = None
+from urllib.parse import quote_plus, urlparse, urljoin, unquote
+import urllib3
+import aiohttp
+import asyncio
 import platform
+import sys
 import os
 import re
 import time
 import logging
 import threading
+import queue
 import tempfile
+import shutil
 import json
+import csv
+import hashlib
+import heapq
+import random
+import base64
 import psutil
-from datetime import datetime, timedelta
-from dataclasses import dataclass
-from typing import List, Optional, Set, Tuple, Callable, Dict
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, date
+from dataclasses import dataclass, replace, asdict, fields
+from typing import List, Optional, Set, Tuple, Callable, Dict, Iterable, Iterator, Union
 
 # Configure logging for debugging
 logging.basicConfig(
@@ -366,11 +393,158 @@ COURTS = [
     "All Legislation",
 ]
 
+
+def build_court_groups(courts: List[str]) -> Dict[str, List[str]]:
+    """Group the flat COURTS list into parent entries and their child courts"""
+    groups: Dict[str, List[str]] = {}
+    parent = None
+    for court in courts:
+        if court.startswith("All "):
+            parent = court
+            groups.setdefault(parent, [])
+        elif parent and court not in groups[parent]:
+            groups[parent].append(court)
+    return groups
+
+
+# Parent entries ("All ...") mapped to their child court filters
+COURT_GROUPS = build_court_groups(COURTS)
+
+
+def expand_court_filter(court_name: Optional[str]) -> List[str]:
+    """Expand a parent court entry into its child journalGroupName filters"""
+    # Map actual names (e.g. NSW) back to their display entry
+    display_name = next(
+        (display for display, actual in COURT_DISPLAY_MAPPING.items() if actual == court_name),
+        court_name or "All Courts")
+
+    if display_name in ("All Courts", "All Legislation"):
+        legislation = display_name == "All Legislation"
+        children = []
+        for group, members in COURT_GROUPS.items():
+            if group in ("All Courts", "All Legislation") or ("Legislation" in group) != legislation:
+                continue
+            children.extend(court for court in members if court not in children)
+        return children
+
+    return list(COURT_GROUPS.get(display_name, []))
+
 # Default timeout values
 DEFAULT_WAIT_TIME = 5
 DEFAULT_PAGE_LOAD_TIMEOUT = 60
 MAX_RETRY_ATTEMPTS = 3
 
+# Event-driven wait settings for the download choreography
+STEP_WAIT_TIMEOUT = 3
+STEP_POLL_INTERVAL = 0.1
+DEFAULT_SEARCH_WORKERS = 1
+DEFAULT_DOWNLOAD_WORKERS = 1
+
+# Search page fetch modes: 'browser' drives Chrome for every page, 'http' pulls
+# pages over a pooled HTTP client and falls back to Chrome when needed, 'async'
+# fetches pages and PDFs concurrently with aiohttp and falls back the same way
+FETCH_MODES = ["browser", "http", "async"]
+DEFAULT_FETCH_MODE = "browser"
+
+# Result extraction modes: 'script' pulls a compact JSON payload out of the page
+# with one execute_script call, 'html' transfers and parses the full page source
+EXTRACTION_MODES = ["script", "html"]
+DEFAULT_EXTRACTION_MODE = "script"
+
+# PDF download modes: 'direct' streams the PDF endpoint over HTTP once its URL pattern
+# has been learned from a UI download, 'browser' always clicks through Print and Export
+PDF_DOWNLOAD_MODES = ["direct", "browser"]
+DEFAULT_PDF_DOWNLOAD_MODE = "direct"
+MAX_DIRECT_PDF_FAILURES = 3  # Consecutive direct failures before reverting to the UI path
+
+# Download completion tracking: Chrome DevTools download events from the performance
+# log first, then filesystem events (inotify via watchdog), then folder scans
+DOWNLOAD_WAIT_TIMEOUT = 60
+CDP_DOWNLOAD_START_GRACE = 5  # Seconds to wait for downloadWillBegin before falling back
+
+# Runs inside the results page and returns only the case hrefs and pager numbers
+EXTRACT_RESULTS_SCRIPT = """
+var links = [];
+var anchors = document.querySelectorAll('a.gwt-Hyperlink.alcina-NoHistory');
+for (var i = 0; i < anchors.length; i++) {
+    var href = anchors[i].getAttribute('href');
+    if (href) { links.push(href); }
+}
+var pager = document.evaluate("//*[contains(text(), 'You are on page')]", document, null,
+                              XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+var text = pager ? pager.textContent : (document.body ? document.body.textContent : '');
+var match = /You are on page (\\d+) of (\\d+)/.exec(text);
+return JSON.stringify({
+    links: links,
+    page: match ? parseInt(match[1], 10) : null,
+    total: match ? parseInt(match[2], 10) : null
+});
+"""
+
+# Async engine limits
+DEFAULT_ASYNC_CONCURRENCY = 16
+DEFAULT_HOST_RATE_LIMIT = 4.0  # Requests per second per host
+
+# Earliest date used when sharding a query that has no start date
+SHARD_EARLIEST_DATE = "1900-01-01"
+
+# Pipelined mode: links waiting for the download worker before the search blocks
+DEFAULT_PIPELINE_QUEUE_SIZE = 200
+
+# Incremental mode: per-query indexes of article IDs seen by earlier runs
+SEEN_INDEX_DIR = "jade_scraper_index"
+
+# On-disk cache of extracted search pages (disabled while the TTL is 0)
+SEARCH_CACHE_DIR = "jade_scraper_cache"
+DEFAULT_CACHE_TTL_HOURS = 0.0
+DEFAULT_CACHE_MAX_ENTRIES = 5000
+
+# Dry-run planning: measured timings from earlier runs, with fallbacks until there are some
+TIMING_HISTORY_FILE = "jade_scraper_timings.json"
+DEFAULT_PLAN_PAGE_SECONDS = 6.0  # Worker-seconds per search results page
+DEFAULT_PLAN_DOWNLOAD_SECONDS = 15.0  # Seconds per PDF download
+
+# Per-folder index of finished downloads, used to skip cases already on disk
+DOWNLOAD_INDEX_FILE = ".jade_download_index.json"
+DOWNLOAD_INDEX_SAVE_INTERVAL = 25  # Save the index after this many new files
+
+# Shared content-addressed PDF store, created inside the base download folder
+PDF_STORE_DIR = ".jade_pdf_store"
+
+# Checks applied to every finished download before it counts as saved
+MIN_PDF_SIZE = 1024  # Bytes; error pages saved as .pdf are smaller
+PDF_TRAILER_WINDOW = 2048  # Bytes at the end of the file searched for %%EOF
+DEFAULT_VALIDATION_WORKERS = 2
+
+# Retry scheduling for failed downloads
+MAX_DOWNLOAD_ATTEMPTS = 5  # Attempts before a failure is parked instead of retried automatically
+RETRY_BASE_DELAY = 10.0  # Seconds before the first retry of a transient failure
+RETRY_THROTTLED_BASE_DELAY = 60.0  # Seconds before the first retry after the site pushed back
+RETRY_MAX_DELAY = 600.0
+THROTTLED_HTTP_STATUSES = (429, 503)
+PERMANENT_HTTP_STATUSES = (401, 403, 404, 410)
+GONE_HTTP_STATUSES = (404, 410)  # The case itself is missing, so the UI path would fail too
+
+# Circuit breaker: pause all workers when jade.io stops responding
+BREAKER_FAILURE_THRESHOLD = 8  # Consecutive page or download failures that trip the breaker
+BREAKER_WINDOW_SECONDS = 300  # ...if they all happened within this many seconds
+BREAKER_PROBE_URL = "https://jade.io/"
+BREAKER_PROBE_BASE_DELAY = 15.0  # Seconds before the first health probe
+BREAKER_PROBE_MAX_DELAY = 300.0
+
+# Browser recycling: replace a browser when it grows too large or keeps failing
+BROWSER_MEMORY_LIMIT_MB = 2048  # RSS of chromedriver plus all its Chrome processes
+BROWSER_ERROR_WINDOW = 20  # Recent page loads and downloads considered for the error rate
+BROWSER_ERROR_RATE_LIMIT = 0.5
+BROWSER_SPARE_THRESHOLD = 0.8  # Start warming a spare at this share of either limit
+BROWSER_MEMORY_CHECK_INTERVAL = 30.0  # Seconds between memory samples of the main browser
+
+# Adaptive worker concurrency (additive increase, multiplicative decrease)
+AIMD_WINDOW = 10  # Jobs observed between adjustments
+AIMD_MAX_ERROR_RATE = 0.2  # Back off when more than this share of a window fails
+AIMD_LATENCY_FACTOR = 2.0  # Back off when the median job time exceeds the baseline by this factor
+AIMD_DECREASE_FACTOR = 0.5
+
 
 @dataclass
 class SearchConfig:
@@ -389,6 +563,24 @@ class SearchConfig:
     generate_report: bool = False
     auto_retry_failed: bool = False
     resume_from_save: bool = False
+    search_workers: int = DEFAULT_SEARCH_WORKERS
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS
+    fetch_mode: str = DEFAULT_FETCH_MODE
+    async_concurrency: int = DEFAULT_ASYNC_CONCURRENCY
+    host_rate_limit: float = DEFAULT_HOST_RATE_LIMIT
+    shard_max_pages: int = 0  # Split into date windows above this many pages (0 = off)
+    fan_out_courts: bool = False  # Query each child court of a parent entry separately
+    extraction_mode: str = DEFAULT_EXTRACTION_MODE
+    pipeline_downloads: bool = False  # Download links while pagination is still running
+    pipeline_queue_size: int = DEFAULT_PIPELINE_QUEUE_SIZE
+    incremental: bool = False  # Only return cases not seen by earlier runs of this query
+    cache_ttl_hours: float = DEFAULT_CACHE_TTL_HOURS  # Reuse cached search pages this fresh
+    cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES
+    pdf_download_mode: str = DEFAULT_PDF_DOWNLOAD_MODE
+    adaptive_concurrency: bool = False  # Tune active workers (up to the configured counts) to site health
+    skip_existing: bool = True  # Skip cases whose PDF is already in the download folder
+    shared_store: bool = True  # Reuse PDFs downloaded by any earlier query
+    pdf_store_dir: Optional[str] = None
 
 
 @dataclass
@@ -398,6 +590,69 @@ class FailedDownload:
     error_message: str
     timestamp: str
     attempt_count: int = 1
+    error_class: str = "transient"  # transient, throttled or permanent
+    http_status: Optional[int] = None  # Set when the failure was an HTTP error response
+
+
+def classify_download_error(http_status: Optional[int]) -> str:
+    """Sort a download failure into 'transient', 'throttled' or 'permanent' by its HTTP status"""
+    if http_status in PERMANENT_HTTP_STATUSES:
+        return "permanent"
+    if http_status in THROTTLED_HTTP_STATUSES:
+        return "throttled"
+    return "transient"
+
+
+class RetryScheduler:
+    """Priority queue of failed downloads, ordered by when each is next due for a retry"""
+
+    def __init__(self):
+        self.heap: List[Tuple[float, int, FailedDownload]] = []
+        self.counter = 0  # Tie-breaker so equal due times keep their scheduling order
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def retry_delay(failed: FailedDownload) -> float:
+        """Exponential backoff with jitter, so downloads that failed together retry apart"""
+        base = RETRY_THROTTLED_BASE_DELAY if failed.error_class == "throttled" else RETRY_BASE_DELAY
+        delay = min(RETRY_MAX_DELAY, base * 2 ** (max(1, failed.attempt_count) - 1))
+        return delay * random.uniform(0.5, 1.5)
+
+    def schedule(self, failed: FailedDownload, since: Optional[float] = None,
+                 capped: bool = True) -> bool:
+        """Queue a failure for retry; returns False if it is parked instead"""
+        failed.error_class = classify_download_error(failed.http_status)
+        if failed.error_class == "permanent" or (capped and failed.attempt_count >= MAX_DOWNLOAD_ATTEMPTS):
+            failed.attempt_count = min(failed.attempt_count, MAX_DOWNLOAD_ATTEMPTS)
+            return False
+
+        due = (time.time() if since is None else since) + self.retry_delay(failed)
+        with self.lock:
+            heapq.heappush(self.heap, (due, self.counter, failed))
+            self.counter += 1
+        return True
+
+    def pop_due(self) -> Optional[FailedDownload]:
+        """Take the most overdue retry, if any is due"""
+        with self.lock:
+            if self.heap and self.heap[0][0] <= time.time():
+                return heapq.heappop(self.heap)[2]
+        return None
+
+    def seconds_until_due(self) -> Optional[float]:
+        """Time until the next retry is due, or None if nothing is scheduled"""
+        with self.lock:
+            return max(0.0, self.heap[0][0] - time.time()) if self.heap else None
+
+    def take_all(self) -> List[FailedDownload]:
+        """Remove and return every scheduled retry"""
+        with self.lock:
+            pending, self.heap = [item[2] for item in sorted(self.heap)], []
+        return pending
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.heap)
 
 
 @dataclass
@@ -425,31 +680,586 @@ class TimingInfo:
             return f"{seconds}s"
 
 
+class LinkStore:
+    """Ordered, deduplicated store of case links backed by packed article-ID arrays"""
+
+    ARTICLE_ID_PATTERN = re.compile(r'^(.*/)(\d+)/?$')
+    MAX_PACKED_ID = 2 ** 32 - 1  # IDs are packed as unsigned 32-bit integers
+    MAX_BITMAP_ID = 2 ** 28  # Larger IDs use the fallback set instead of the bitmap
+    EXTRA_MARKER = 255  # Prefix slot marking a link without a numeric article ID
+
+    def __init__(self, links: Optional[Iterable[str]] = None):
+        self._prefixes: List[str] = []
+        self._prefix_slots: Dict[str, int] = {}
+        self._slots = array('B')  # Prefix slot per link
+        self._ids = array('I')  # Article ID (or index into _extra) per link
+        self._bitmap = bytearray()  # Membership bit per article ID
+        self._large_ids: Set[int] = set()
+        self._extra: List[str] = []
+        self._extra_set: Set[str] = set()
+        if links:
+            self.extend(links)
+
+    def _split(self, link: str) -> Tuple[Optional[str], Optional[int]]:
+        """Split a link into its path prefix and article ID"""
+        match = self.ARTICLE_ID_PATTERN.match(link)
+        if not match:
+            return None, None
+        article_id = int(match.group(2))
+        if article_id > self.MAX_PACKED_ID:
+            return None, None
+        return match.group(1), article_id
+
+    def _has_id(self, article_id: int) -> bool:
+        if article_id >= self.MAX_BITMAP_ID:
+            return article_id in self._large_ids
+        byte = article_id >> 3
+        return byte < len(self._bitmap) and bool(self._bitmap[byte] & (1 << (article_id & 7)))
+
+    def _mark_id(self, article_id: int):
+        if article_id >= self.MAX_BITMAP_ID:
+            self._large_ids.add(article_id)
+            return
+        byte = article_id >> 3
+        if byte >= len(self._bitmap):
+            # Grow geometrically to keep appends cheap
+            self._bitmap.extend(bytes(max(byte + 1 - len(self._bitmap), len(self._bitmap))))
+        self._bitmap[byte] |= 1 << (article_id & 7)
+
+    def __contains__(self, link: str) -> bool:
+        prefix, article_id = self._split(link)
+        if article_id is None:
+            return link in self._extra_set
+        return self._has_id(article_id)
+
+    def append(self, link: str) -> bool:
+        """Add a link; returns False if the case is already stored"""
+        prefix, article_id = self._split(link)
+        if article_id is not None and self._has_id(article_id):
+            return False
+
+        if article_id is not None and prefix not in self._prefix_slots:
+            if len(self._prefixes) < self.EXTRA_MARKER:
+                self._prefix_slots[prefix] = len(self._prefixes)
+                self._prefixes.append(prefix)
+            else:
+                # Out of prefix slots: store the link verbatim but still mark its ID as seen
+                self._mark_id(article_id)
+                article_id = None
+
+        if article_id is None:
+            if link in self._extra_set:
+                return False
+            self._extra_set.add(link)
+            self._slots.append(self.EXTRA_MARKER)
+            self._ids.append(len(self._extra))
+            self._extra.append(link)
+            return True
+
+        self._mark_id(article_id)
+        self._slots.append(self._prefix_slots[prefix])
+        self._ids.append(article_id)
+        return True
+
+    def extend(self, links: Iterable[str]):
+        """Add links, skipping cases that are already stored"""
+        for link in links:
+            self.append(link)
+
+    update = extend
+
+    def remove(self, link: str) -> bool:
+        """Drop the stored link for a case; returns False if it was not stored.
+        Rebuilds the arrays, so it is meant for the occasional rejected download"""
+        if link not in self:
+            return False
+        article_id = self._split(link)[1]
+        if article_id is None:
+            kept = [stored for stored in self if stored != link]
+        else:
+            kept = [stored for stored in self if self._split(stored)[1] != article_id]
+        self.__init__(kept)
+        return True
+
+    def copy(self) -> 'LinkStore':
+        return LinkStore.from_dict(self.to_dict())
+
+    def _link_at(self, index: int) -> str:
+        slot = self._slots[index]
+        if slot == self.EXTRA_MARKER:
+            return self._extra[self._ids[index]]
+        return f"{self._prefixes[slot]}{self._ids[index]}"
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self._ids)):
+            yield self._link_at(index)
+
+    def __getitem__(self, index: int) -> str:
+        return self._link_at(range(len(self._ids))[index])
+
+    @staticmethod
+    def _pack(values: array) -> str:
+        packed = array(values.typecode, values)
+        if sys.byteorder == 'big':
+            packed.byteswap()  # Always store little-endian
+        return base64.b64encode(packed.tobytes()).decode('ascii')
+
+    @staticmethod
+    def _unpack(typecode: str, data: str) -> array:
+        values = array(typecode)
+        values.frombytes(base64.b64decode(data))
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+    def to_dict(self) -> Dict:
+        """Serialise to a compact JSON-friendly dictionary"""
+        return {
+            'prefixes': self._prefixes,
+            'slots': self._pack(self._slots),
+            'ids': self._pack(self._ids),
+            'extra': self._extra
+        }
+
+    @classmethod
+    def from_dict(cls, data: Union[Dict, List[str], None]) -> 'LinkStore':
+        """Load from to_dict() output or from a plain list of links (older progress files)"""
+        if not data:
+            return cls()
+        if isinstance(data, list):
+            return cls(data)
+
+        store = cls()
+        store._prefixes = list(data['prefixes'])
+        store._prefix_slots = {prefix: slot for slot, prefix in enumerate(store._prefixes)}
+        store._slots = cls._unpack('B', data['slots'])
+        store._ids = cls._unpack('I', data['ids'])
+        store._extra = list(data['extra'])
+        store._extra_set = set(store._extra)
+        for slot, article_id in zip(store._slots, store._ids):
+            if slot != cls.EXTRA_MARKER:
+                store._mark_id(article_id)
+        for link in store._extra:
+            _, article_id = store._split(link)
+            if article_id is not None:
+                store._mark_id(article_id)
+        return store
+
+
+@dataclass
+class CaseLinkRecord:
+    """A case link yielded by the streaming search API"""
+    link: str
+    page: int
+    position: int
+    article_id: Optional[int] = None
+
+    @classmethod
+    def from_link(cls, link: str, page: int, position: int) -> 'CaseLinkRecord':
+        match = LinkStore.ARTICLE_ID_PATTERN.match(link)
+        absolute = link if link.startswith('http') else f"https://jade.io{link}"
+        return cls(link=absolute, page=page, position=position,
+                   article_id=int(match.group(2)) if match else None)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class LinkSink:
+    """Base class for incremental case link writers"""
+
+    def __init__(self, path: str, append: bool = False):
+        self.path = path
+        # Line buffering puts every record on disk as soon as it is written
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8', newline='', buffering=1)
+        self.count = 0
+
+    def write(self, record: CaseLinkRecord):
+        self._write(record)
+        self.count += 1
+
+    def _write(self, record: CaseLinkRecord):
+        raise NotImplementedError
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonlLinkSink(LinkSink):
+    """Write case link records as JSON Lines"""
+
+    def _write(self, record: CaseLinkRecord):
+        self._file.write(json.dumps(record.to_dict()) + "\n")
+
+
+class CsvLinkSink(LinkSink):
+    """Write case link records as CSV rows"""
+
+    def __init__(self, path: str, append: bool = False):
+        write_header = not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+        super().__init__(path, append)
+        self._writer = csv.DictWriter(self._file, fieldnames=[f.name for f in fields(CaseLinkRecord)])
+        if write_header:
+            self._writer.writeheader()
+
+    def _write(self, record: CaseLinkRecord):
+        self._writer.writerow(record.to_dict())
+
+
+def open_link_sink(path: str, append: bool = False) -> LinkSink:
+    """Open a sink matching the file extension (.csv or JSON Lines otherwise)"""
+    if path.lower().endswith('.csv'):
+        return CsvLinkSink(path, append)
+    return JsonlLinkSink(path, append)
+
+
+class SeenCaseIndex:
+    """Persistent per-query set of cases already returned by earlier runs"""
+
+    def __init__(self, path: str, query_key: str):
+        self.path = path
+        self.query_key = query_key
+        self.links = LinkStore()
+        self.last_run: Optional[str] = None
+
+    @staticmethod
+    def query_key_for(config: SearchConfig) -> str:
+        """Describe the search parameters that identify a query"""
+        return json.dumps([config.query, config.use_and, config.court_name,
+                           config.start_date, config.end_date])
+
+    @classmethod
+    def for_config(cls, config: SearchConfig, index_dir: str = SEEN_INDEX_DIR) -> 'SeenCaseIndex':
+        """Load the index for a query, or start an empty one"""
+        query_key = cls.query_key_for(config)
+        digest = hashlib.sha1(query_key.encode('utf-8')).hexdigest()
+        index = cls(os.path.join(index_dir, f"{digest}.json"), query_key)
+
+        try:
+            if os.path.exists(index.path):
+                with open(index.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                index.links = LinkStore.from_dict(data.get('links'))
+                index.last_run = data.get('last_run')
+        except Exception as e:
+            logging.warning(f"Could not load seen-case index {index.path}, starting fresh: {e}")
+        return index
+
+    def __contains__(self, link: str) -> bool:
+        return link in self.links
+
+    def __len__(self) -> int:
+        return len(self.links)
+
+    def add(self, links: Iterable[str]):
+        self.links.extend(links)
+
+    def save(self):
+        """Write the index atomically so an interrupted save keeps the previous version"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.last_run = datetime.now().isoformat()
+            temp_path = self.path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'query': self.query_key, 'last_run': self.last_run,
+                           'links': self.links.to_dict()}, f)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logging.error(f"Error saving seen-case index: {e}")
+
+
+class DownloadIndex:
+    """Persistent map of article ID to the verified PDF already saved in a download folder"""
+
+    FILE_PATTERN = re.compile(r'^(\d+)_.*\.pdf$', re.IGNORECASE)
+
+    def __init__(self, download_dir: str):
+        self.download_dir = download_dir
+        self.path = os.path.join(download_dir, DOWNLOAD_INDEX_FILE)
+        self.entries: Dict[str, Dict] = {}
+        self.unsaved = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def file_checksum(path: str) -> str:
+        """SHA-256 of a file, read in chunks"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def load(cls, download_dir: str) -> 'DownloadIndex':
+        """Load the folder's index, building it from a scan the first time"""
+        index = cls(download_dir)
+        try:
+            if os.path.exists(index.path):
+                with open(index.path, 'r', encoding='utf-8') as f:
+                    index.entries = json.load(f).get('files', {})
+                return index
+        except Exception as e:
+            logging.warning(f"Could not load download index {index.path}, rebuilding: {e}")
+
+        index.scan()
+        index.save()
+        return index
+
+    def scan(self):
+        """Index every numbered PDF in the folder"""
+        if not os.path.isdir(self.download_dir):
+            return
+        start_time = time.time()
+        with os.scandir(self.download_dir) as entries:
+            for entry in entries:
+                match = self.FILE_PATTERN.match(entry.name)
+                if match and entry.is_file():
+                    # Broken files from earlier runs are left unindexed so they are fetched again
+                    problem = PdfValidator.check(entry.path, parse=False)
+                    if problem:
+                        logging.info(f"Not indexing {entry.name}: {problem}")
+                        continue
+                    self.record(match.group(1), entry.path, autosave=False)
+        logging.info(f"Indexed {len(self.entries)} existing downloads in "
+                     f"{self.download_dir} ({time.time() - start_time:.1f}s)")
+
+    def lookup(self, article_id: str) -> Optional[str]:
+        """Return the saved file for a case if it is still present and intact"""
+        with self.lock:
+            entry = self.entries.get(article_id)
+        if not entry:
+            return None
+
+        path = os.path.join(self.download_dir, entry['file'])
+        try:
+            stat = os.stat(path)
+            if stat.st_size != entry['size']:
+                raise IOError("size changed")
+            # Only re-hash when the file has been touched since it was indexed
+            if stat.st_mtime != entry.get('mtime') and self.file_checksum(path) != entry['sha256']:
+                raise IOError("checksum mismatch")
+        except (OSError, IOError) as e:
+            logging.info(f"Indexed download for {article_id} is no longer valid ({e}), fetching again")
+            with self.lock:
+                self.entries.pop(article_id, None)
+                self.unsaved += 1
+            return None
+        return path
+
+    def entry(self, article_id: str) -> Optional[Dict]:
+        with self.lock:
+            return self.entries.get(article_id)
+
+    def record(self, article_id: str, path: str, autosave: bool = True) -> Optional[Dict]:
+        """Add or replace the file saved for a case"""
+        try:
+            stat = os.stat(path)
+            entry = {'file': os.path.basename(path), 'size': stat.st_size,
+                     'mtime': stat.st_mtime, 'sha256': self.file_checksum(path)}
+        except OSError as e:
+            logging.warning(f"Could not index downloaded file {path}: {e}")
+            return None
+
+        with self.lock:
+            self.entries[article_id] = entry
+            self.unsaved += 1
+            due = autosave and self.unsaved >= DOWNLOAD_INDEX_SAVE_INTERVAL
+        if due:
+            self.save()
+        return entry
+
+    def save(self):
+        """Write the index atomically so an interrupted save keeps the previous version"""
+        with self.lock:
+            if not self.unsaved and os.path.exists(self.path):
+                return
+            try:
+                os.makedirs(self.download_dir, exist_ok=True)
+                temp_path = self.path + ".tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'updated': datetime.now().isoformat(), 'files': self.entries}, f)
+                os.replace(temp_path, self.path)
+                self.unsaved = 0
+            except Exception as e:
+                logging.error(f"Error saving download index: {e}")
+
+
+class PdfValidator:
+    """Checks finished downloads on a worker pool, off the download threads"""
+
+    def __init__(self, on_valid: Callable[[str, str], None],
+                 on_invalid: Callable[[Optional[str], str, str], None],
+                 workers: int = DEFAULT_VALIDATION_WORKERS):
+        self.on_valid = on_valid
+        self.on_invalid = on_invalid
+        self.executor = ThreadPoolExecutor(max_workers=workers,
+                                           thread_name_prefix="pdf-validate")
+        self.pending = []
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def check(path: str, parse: bool = True) -> Optional[str]:
+        """Return why a file is not a usable PDF, or None if it is"""
+        try:
+            size = os.path.getsize(path)
+            if size < MIN_PDF_SIZE:
+                return f"file too small ({size} bytes)"
+            with open(path, 'rb') as f:
+                if f.read(5) != b'%PDF-':
+                    return "missing PDF header"
+                f.seek(max(0, size - PDF_TRAILER_WINDOW))
+                if b'%%EOF' not in f.read():
+                    return "missing %%EOF trailer, file is truncated"
+        except OSError as e:
+            return f"cannot read file: {e}"
+
+        if parse and PdfReader is not None:
+            try:
+                if not len(PdfReader(path).pages):
+                    return "PDF has no pages"
+            except Exception as e:
+                return f"PDF does not parse: {str(e)[:80]}"
+        return None
+
+    def submit(self, link: Optional[str], url_number: str, path: str):
+        """Queue a finished download for validation"""
+        future = self.executor.submit(self.validate, link, url_number, path)
+        with self.lock:
+            self.pending = [f for f in self.pending if not f.done()]
+            self.pending.append(future)
+
+    def validate(self, link: Optional[str], url_number: str, path: str):
+        problem = self.check(path)
+        try:
+            if problem:
+                self.on_invalid(link, path, problem)
+            else:
+                self.on_valid(url_number, path)
+        except Exception as e:
+            logging.error(f"Error handling validation result for {path}: {e}")
+
+    def drain(self):
+        """Wait until every queued file has been checked"""
+        with self.lock:
+            pending, self.pending = self.pending, []
+        for future in pending:
+            future.result()
+
+    def close(self):
+        self.drain()
+        self.executor.shutdown(wait=True)
+
+
+class PdfStore(DownloadIndex):
+    """Content-addressed PDF store shared by all query folders under one base folder"""
+
+    def __init__(self, store_dir: str):
+        super().__init__(store_dir)
+        self.path = os.path.join(store_dir, "index.json")
+
+    @classmethod
+    def load(cls, store_dir: str) -> 'PdfStore':
+        """Load the store index; a missing index starts an empty store"""
+        store = cls(store_dir)
+        try:
+            if os.path.exists(store.path):
+                with open(store.path, 'r', encoding='utf-8') as f:
+                    store.entries = json.load(f).get('files', {})
+        except Exception as e:
+            logging.warning(f"Could not load PDF store index {store.path}, starting fresh: {e}")
+        return store
+
+    @staticmethod
+    def link_or_copy(source: str, target: str):
+        """Hard link a file, copying it where the filesystem cannot link"""
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    def add(self, article_id: str, path: str, entry: Dict):
+        """Keep a verified download in the store under its article ID and content hash"""
+        current = self.entry(article_id)
+        if current and current['sha256'] == entry['sha256']:
+            return
+
+        store_name = f"{article_id}_{entry['sha256'][:16]}.pdf"
+        store_path = os.path.join(self.download_dir, store_name)
+        try:
+            os.makedirs(self.download_dir, exist_ok=True)
+            if not os.path.exists(store_path):
+                self.link_or_copy(path, store_path)
+            stat = os.stat(store_path)
+        except OSError as e:
+            logging.warning(f"Could not add {path} to the PDF store: {e}")
+            return
+
+        # Remember the name the case was saved under so other queries reuse it
+        original_name = re.sub(rf'^{re.escape(article_id)}_', '', os.path.basename(path))
+        with self.lock:
+            self.entries[article_id] = {'file': store_name, 'size': stat.st_size,
+                                        'mtime': stat.st_mtime, 'sha256': entry['sha256'],
+                                        'name': original_name}
+            self.unsaved += 1
+            due = self.unsaved >= DOWNLOAD_INDEX_SAVE_INTERVAL
+        if due:
+            self.save()
+
+
 @dataclass
 class ProgressState:
     """Class to store scraper progress state for resuming"""
     search_config: Dict
-    all_links: List[str]
+    all_links: LinkStore
     processed_pages: int
     total_pages: int
-    downloaded_links: List[str]
+    downloaded_links: LinkStore
     failed_downloads: List[Dict]
-    current_phase: str  # 'search' or 'download'
+    current_phase: str  # 'search', 'search+download' (pipelined) or 'download'
     timestamp: str
     search_completed: bool = False
+    completed_pages: List[int] = None
+
+    def __post_init__(self):
+        if self.completed_pages is None:
+            # Older progress files only record a high-water mark
+            self.completed_pages = list(range(self.processed_pages))
+
+        # Links are held in compact stores; older files contain plain lists
+        if not isinstance(self.all_links, LinkStore):
+            self.all_links = LinkStore.from_dict(self.all_links)
+        if not isinstance(self.downloaded_links, LinkStore):
+            self.downloaded_links = LinkStore.from_dict(self.downloaded_links)
+
+    def pending_pages(self) -> List[int]:
+        """Return the pages that still need to be fetched"""
+        completed = set(self.completed_pages)
+        return [page for page in range(self.total_pages) if page not in completed]
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
         return {
             'search_config': self.search_config,
-            'all_links': self.all_links,
+            'all_links': LinkStore(self.all_links).to_dict()
+            if not isinstance(self.all_links, LinkStore) else self.all_links.to_dict(),
             'processed_pages': self.processed_pages,
             'total_pages': self.total_pages,
-            'downloaded_links': self.downloaded_links,
+            'downloaded_links': self.downloaded_links.to_dict(),
             'failed_downloads': self.failed_downloads,
             'current_phase': self.current_phase,
             'timestamp': self.timestamp,
-            'search_completed': self.search_completed
+            'search_completed': self.search_completed,
+            'completed_pages': sorted(self.completed_pages)
         }
     
     @classmethod
@@ -458,6 +1268,83 @@ class ProgressState:
         return cls(**data)
 
 
+class TimingHistory:
+    """Running totals of measured search and download timings, used to estimate crawl cost"""
+
+    def __init__(self, path: str = TIMING_HISTORY_FILE):
+        self.path = path
+        self.search_pages = 0
+        self.search_worker_seconds = 0.0
+        self.downloads = 0
+        self.download_seconds = 0.0
+        self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.search_pages = data.get('search_pages', 0)
+                self.search_worker_seconds = data.get('search_worker_seconds', 0.0)
+                self.downloads = data.get('downloads', 0)
+                self.download_seconds = data.get('download_seconds', 0.0)
+        except Exception as e:
+            logging.warning(f"Could not load timing history: {e}")
+
+    def save(self):
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'search_pages': self.search_pages,
+                    'search_worker_seconds': self.search_worker_seconds,
+                    'downloads': self.downloads,
+                    'download_seconds': self.download_seconds,
+                    'updated': datetime.now().isoformat()
+                }, f, indent=2)
+        except Exception as e:
+            logging.warning(f"Could not save timing history: {e}")
+
+    def record_search(self, pages: int, seconds: float, workers: int = 1):
+        """Add a finished search; wall time is scaled by workers to get per-page worker time"""
+        if pages > 0 and seconds > 0:
+            self.search_pages += pages
+            self.search_worker_seconds += seconds * max(1, workers)
+
+    def record_downloads(self, count: int, seconds: float):
+        if count > 0 and seconds > 0:
+            self.downloads += count
+            self.download_seconds += seconds
+
+    @property
+    def page_seconds(self) -> float:
+        if self.search_pages:
+            return self.search_worker_seconds / self.search_pages
+        return DEFAULT_PLAN_PAGE_SECONDS
+
+    @property
+    def seconds_per_download(self) -> float:
+        if self.downloads:
+            return self.download_seconds / self.downloads
+        return DEFAULT_PLAN_DOWNLOAD_SECONDS
+
+
+@dataclass
+class CrawlPlanJob:
+    """Estimated cost of one query/court/date combination in a dry-run plan"""
+    query: str
+    court_name: Optional[str]
+    start_date: Optional[str]
+    end_date: Optional[str]
+    total_pages: int = 0
+    links_on_first_page: int = 0
+    estimated_links: int = 0
+    estimated_search_seconds: float = 0.0
+    estimated_download_seconds: float = 0.0
+    estimated_total_seconds: float = 0.0
+    over_budget: bool = False
+    error: Optional[str] = None
+
+
 @dataclass
 class ReportData:
     """Class to store report metrics"""
@@ -479,121 +1366,1278 @@ class ReportData:
             self.page_load_times = []
 
 
-class JadeScraper:
-    """Main scraper class for Jade.io case links"""
+@dataclass
+class SearchPageResult:
+    """Class to hold the links extracted from a single search results page"""
+    page: int
+    links: List[str]
+    total_pages: Optional[int] = None
+    loaded: bool = True  # False if the results never appeared (timeout or site down)
+
+
+def merge_page_links(page_links: Dict, seen_links: Optional[LinkStore] = None) -> List[str]:
+    """Merge per-page link lists (keyed by page or (shard, page)) into one ordered, deduplicated list"""
+    merged = LinkStore()
+    for page in sorted(page_links):
+        for link in page_links[page]:
+            if seen_links is None or link not in seen_links:
+                merged.append(link)
+    return list(merged)
+
+
+def normalise_search_url(url: str) -> str:
+    """Reduce a search URL to a canonical form so equivalent parameter orders share a cache key"""
+    parsed = urlparse(url)
+    _, _, params = parsed.path.partition('/search/')
+    parts = sorted(part for part in params.split(':') if part and part != 'page=0')
+    return f"{parsed.netloc.lower()}/search/{':'.join(parts)}"
+
+
+class SearchPageCache:
+    """On-disk cache of extracted search pages with a TTL and least-recently-used eviction"""
+
+    def __init__(self, cache_dir: str = SEARCH_CACHE_DIR, ttl_hours: float = 24.0,
+                 max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entry_count: Optional[int] = None
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha1(normalise_search_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, url: str, want_total: bool = False) -> Optional[Tuple[List[str], Optional[int]]]:
+        """Return cached (links, total_pages) for a URL, or None if missing or expired"""
+        path = self._path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
 
-    def __init__(self):
-        self.driver = None
-        self.wait = None
-        self.search_timer = None
-        self.download_timers = {}
-        self.total_timer = None
-        self.browser_start_time = None
-        self.browser_restart_interval = 1800  # 1 half hour in seconds
-        self.cancelled = False
-        self.failed_downloads_file = "failed_downloads.json"
-        self.error_log_file = "jade_scraper_errors.log"
-        self.progress_save_file = "jade_scraper_progress.json"
-        self.report_data = None
-        self.page_load_times = []
-        self.download_times = []
-        self.progress_state = None
-        self.save_interval = 10  # Save progress every 10 operations
-        self.operation_count = 0
+        if time.time() - entry.get('fetched_at', 0) > self.ttl_seconds or \
+                (want_total and entry.get('total_pages') is None):
+            self.misses += 1
+            return None
 
-    def get_default_profile_dir(self) -> str:
-        """Get the default Chrome profile directory based on OS"""
-        home = os.path.expanduser("~")
-        system = platform.system()
+        # Access time drives eviction, so refresh it on every hit
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry['links'], entry.get('total_pages')
+
+    def put(self, url: str, links: List[str], total_pages: Optional[int] = None):
+        """Store the extracted payload for a URL"""
+        path = self._path(url)
+        entry = {
+            'url': normalise_search_url(url),
+            'links': links,
+            'total_pages': total_pages,
+            'fetched_at': time.time()
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            existed = os.path.exists(path)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write search cache entry: {e}")
+            return
 
-        profile_paths = {
-            'Windows': os.path.join(home, 'AppData', 'Local', 'Google', 'Chrome', 'User Data'),
-            'Darwin': os.path.join(home, 'Library', 'Application Support', 'Google', 'Chrome'),
-            'Linux': os.path.join(home, '.config', 'google-chrome')
+        with self._lock:
+            if self._entry_count is None:
+                self._entry_count = len(self._entries())
+            elif not existed:
+                self._entry_count += 1
+            if self._entry_count > self.max_entries:
+                self._evict()
+
+    def _entries(self) -> List[str]:
+        try:
+            return [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                    if name.endswith('.json')]
+        except OSError:
+            return []
+
+    def _evict(self):
+        """Drop least recently used entries down to 90% of the limit"""
+        entries = []
+        for path in self._entries():
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        entries.sort()
+
+        target = int(self.max_entries * 0.9)
+        excess = max(0, len(entries) - target)
+        for _, path in entries[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._entry_count = len(entries) - excess
+        logging.debug(f"Evicted {excess} search cache entries")
+
+
+class SearchPageParser:
+    """Single-pass parser for search result pages, using lxml when it is installed"""
+
+    LINK_XPATH = (
+        "//a[contains(concat(' ', normalize-space(@class), ' '), ' gwt-Hyperlink ')"
+        " and contains(concat(' ', normalize-space(@class), ' '), ' alcina-NoHistory ')]/@href"
+    )
+    PAGER_XPATH = "//*[contains(text(), 'You are on page')]"
+    PAGER_PATTERN = re.compile(r"You are on page \d+ of (\d+)")
+
+    def __init__(self, backend: Optional[str] = None):
+        self.backend = backend or ("lxml" if lxml_html else "html.parser")
+        if self.backend == "lxml" and lxml_html is None:
+            raise ValueError("lxml backend requested but lxml is not installed")
+
+    def parse(self, html: str) -> Tuple[List[str], Optional[int]]:
+        """Return the raw case hrefs and total page count from one parse of the page"""
+        if self.backend == "lxml":
+            return self._parse_lxml(html)
+        return self._parse_html_parser(html)
+
+    def _parse_lxml(self, html: str) -> Tuple[List[str], Optional[int]]:
+        tree = lxml_html.fromstring(html)
+        hrefs = [href for href in tree.xpath(self.LINK_XPATH) if href]
+        pager = tree.xpath(self.PAGER_XPATH)
+        return hrefs, self._total_from_text(pager[0].text_content() if pager else "")
+
+    def _parse_html_parser(self, html: str) -> Tuple[List[str], Optional[int]]:
+        soup = BeautifulSoup(html, 'html.parser')
+        hrefs = [
+            a.get('href') for a in soup.find_all('a', class_='gwt-Hyperlink alcina-NoHistory')
+            if a.get('href')
+        ]
+        # Only read the pager element's text instead of the whole document
+        pager = soup.find(string=re.compile("You are on page"))
+        return hrefs, self._total_from_text(pager.parent.get_text() if pager else "")
+
+    def _total_from_text(self, text: str) -> Optional[int]:
+        match = self.PAGER_PATTERN.search(text)
+        return int(match.group(1)) if match else None
+
+
+def benchmark_parsers(fixture_paths: List[str], iterations: int = 20,
+                      progress_callback: Optional[Callable[[str], None]] = None) -> Dict[str, float]:
+    """Time each available parser backend on saved result pages (ms per page)"""
+    pages = []
+    for path in fixture_paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append(f.read())
+
+    if not pages:
+        logging.warning("No fixture files given")
+        return {}
+
+    backends = ["html.parser"] + (["lxml"] if lxml_html else [])
+    results = {}
+    for backend in backends:
+        parser = SearchPageParser(backend)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for html in pages:
+                parser.parse(html)
+        results[backend] = (time.perf_counter() - start) * 1000 / (iterations * len(pages))
+
+    # The previous implementation parsed twice and scanned the whole document text
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for html in pages:
+            BeautifulSoup(html, 'html.parser').find_all('a', class_='gwt-Hyperlink alcina-NoHistory')
+            re.search(r"You are on page \d+ of (\d+)", BeautifulSoup(html, 'html.parser').get_text())
+    results["legacy double parse"] = (time.perf_counter() - start) * 1000 / (iterations * len(pages))
+
+    for name, ms_per_page in results.items():
+        message = f"{name:>20}: {ms_per_page:.2f} ms/page"
+        logging.info(message)
+        if progress_callback:
+            progress_callback(message)
+    return results
+
+
+def filename_from_disposition(disposition: str) -> str:
+    """Return the filename from a Content-Disposition header, or an empty string"""
+    match = re.search(r"filename\*=UTF-8''([^;]+)|filename=\"?([^\";]+)\"?", disposition or "")
+    return os.path.basename(unquote(match.group(1) or match.group(2)).strip()) if match else ""
+
+
+class HttpStatusError(IOError):
+    """An HTTP error response, keeping the status code for retry classification"""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+
+
+class JadeHttpClient:
+    """Pooled keep-alive HTTP client that reuses a browser session's cookies"""
+
+    def __init__(self, driver, pool_size: int = 10, timeout: float = DEFAULT_PAGE_LOAD_TIMEOUT):
+        # Copy the session cookies and user agent once from the browser
+        cookies = driver.get_cookies()
+        cookie_header = "; ".join(
+            f"{cookie['name']}={cookie['value']}" for cookie in cookies)
+        user_agent = driver.execute_script("return navigator.userAgent")
+
+        headers = {
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-AU,en;q=0.9",
+            "Connection": "keep-alive"
         }
+        if cookie_header:
+            headers["Cookie"] = cookie_header
+
+        self.pool = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=pool_size,
+            block=True,
+            headers=headers,
+            timeout=urllib3.Timeout(connect=10, read=timeout),
+            retries=urllib3.Retry(total=2, backoff_factor=0.5,
+                                  status_forcelist=[502, 503, 504])
+        )
+        logging.info(f"HTTP client created with {len(cookies)} session cookies")
 
-        return profile_paths.get(system, profile_paths['Linux'])
+    def request(self, method: str, url: str, **kwargs):
+        """Send a request through the shared connection pool"""
+        return self.pool.request(method, url, **kwargs)
 
-    def format_date_for_jade(self, date_str: str) -> Optional[str]:
-        """Convert YYYY-MM-DD format to Jade.io date format"""
-        if not date_str:
+    def get_text(self, url: str) -> Optional[str]:
+        """Fetch a URL and return the decoded body, or None on a non-200 response"""
+        response = self.request("GET", url)
+        if response.status != 200:
+            logging.warning(f"HTTP {response.status} for {url}")
             return None
+        return response.data.decode("utf-8", errors="replace")
 
+    @staticmethod
+    def load_partial(path: str, url: str) -> Optional[Dict]:
+        """Return the sidecar record of an earlier partial download of url, if it can be resumed"""
         try:
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            return dt.strftime("%Y%m%dT000000000+0800")
-        except ValueError as e:
-            logging.warning(f"Invalid date format: {date_str} - {e}")
+            with open(path + ".json", 'r', encoding='utf-8') as f:
+                partial = json.load(f)
+            partial['bytes'] = os.path.getsize(path)
+        except (OSError, ValueError):
             return None
+        return partial if partial.get('url') == url and partial['bytes'] > 0 else None
 
-    def build_search_url(self, config: SearchConfig, page: int = 0) -> str:
-        """Build the search URL with all parameters"""
-        # Encode search terms
-        encoded_terms = [quote_plus(term) for term in config.query.split()]
-        query_part = '+AND+'.join(
-            encoded_terms) if config.use_and else '+'.join(encoded_terms)
-
-        # Build date filter
-        date_part = ""
-        if config.start_date and config.end_date:
-            since = self.format_date_for_jade(config.start_date)
-            until = self.format_date_for_jade(config.end_date)
-            if since and until:
-                date_part = f":effective.since={since}:effective.until={until}"
-        else:
-            date_part = f":order1.effectivedateasc=desc"
+    @staticmethod
+    def discard_partial(path: str):
+        """Remove a partial download and its sidecar record"""
+        for leftover in (path, path + ".json"):
+            try:
+                os.remove(leftover)
+            except OSError:
+                pass
+
+    def download_to_file(self, url: str, path: str, chunk_size: int = 64 * 1024) -> str:
+        """Stream a response body to path, resuming an earlier partial download where the
+        server supports ranges; returns the server's suggested filename, if any"""
+        partial = self.load_partial(path, url)
+        headers = dict(self.pool.headers)
+        if partial:
+            headers["Range"] = f"bytes={partial['bytes']}-"
+            # Only accept the range if the file has not changed since the first attempt
+            validator = partial.get('etag') or partial.get('last_modified')
+            if validator:
+                headers["If-Range"] = validator
+
+        response = self.request("GET", url, headers=headers, preload_content=False)
+        try:
+            if response.status == 206 and partial:
+                match = re.match(r"bytes (\d+)-\d+/(\d+|\*)",
+                                 response.headers.get("Content-Range", ""))
+                if not match or int(match.group(1)) != partial['bytes']:
+                    raise IOError(f"Unexpected Content-Range for {url}")
+                total = int(match.group(2)) if match.group(2) != '*' else None
+                mode = 'ab'
+                logging.info(f"Resuming download at byte {partial['bytes']}: {url}")
+            elif response.status == 200:
+                # Fresh download, or the server ignored the range and sent the whole file
+                length = response.headers.get("Content-Length")
+                total = int(length) if length and length.isdigit() else None
+                mode = 'wb'
+            else:
+                if response.status == 416:
+                    self.discard_partial(path)
+                raise HttpStatusError(response.status, url)
+
+            suggested_name = filename_from_disposition(
+                response.headers.get("Content-Disposition", "")) or (partial or {}).get('filename', "")
+
+            # Record enough to resume this download if the transfer is cut short
+            record = {'url': url, 'etag': response.headers.get("ETag"),
+                      'last_modified': response.headers.get("Last-Modified"),
+                      'total': total, 'filename': suggested_name}
+            if mode == 'ab':
+                record = {**partial, **{k: v for k, v in record.items() if v}}
+                record.pop('bytes', None)
+            with open(path + ".json", 'w', encoding='utf-8') as f:
+                json.dump(record, f)
+
+            # Keep whatever arrives before a dropped connection; the size check below
+            # reports the download as incomplete
+            response.enforce_content_length = False
+            with open(path, mode) as f:
+                for chunk in response.stream(chunk_size):
+                    f.write(chunk)
+
+            size = os.path.getsize(path)
+            if total is not None and size != total:
+                raise IOError(f"Incomplete download ({size} of {total} bytes) for {url}")
+            os.remove(path + ".json")
+            return suggested_name
+        finally:
+            response.release_conn()
+
+    def close(self):
+        """Close all pooled connections"""
+        self.pool.clear()
+
+
+class TokenBucket:
+    """Asyncio token bucket that limits the request rate to a single host"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens +
+                                  (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
 
-        # Build page parameter
-        page_part = f"page={page}" if page > 0 else ""
 
-        # Build court filter
-        court_part = f":collection.journalGroupName={config.court_name}" if config.court_name else ""
+class AsyncCrawlEngine:
+    """Asyncio HTTP engine with bounded concurrency and per-host rate limits"""
 
-        # Combine all parts
-        url = f"https://jade.io/search/{page_part}{court_part}{date_part}:text={query_part}"
-        return url
+    def __init__(self, cookies: Dict[str, str], headers: Dict[str, str],
+                 max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+                 host_rate_limit: float = DEFAULT_HOST_RATE_LIMIT,
+                 timeout: float = DEFAULT_PAGE_LOAD_TIMEOUT):
+        self.cookies = cookies
+        self.headers = headers
+        self.max_concurrency = max(1, max_concurrency)
+        self.host_rate_limit = host_rate_limit
+        self.timeout = timeout
+        self.session = None
+        self._semaphore = None
+        self._buckets: Dict[str, TokenBucket] = {}
 
-    def setup_driver(self, config: SearchConfig) -> bool:
-        """Initialize and configure the Chrome driver"""
-        try:
-            opts = Options()
-
-            # Basic Chrome options
-            chrome_options = [
-                '--disable-gpu',
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-extensions',
-                '--disable-plugins',
-                '--disable-images',  # Speed up loading
-                "--blink-settings=imagesEnabled=false"
-            ]
+    @classmethod
+    def from_driver(cls, driver, **kwargs) -> 'AsyncCrawlEngine':
+        """Create an engine that reuses the cookies of a browser session"""
+        cookies = {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
+        headers = {
+            "User-Agent": driver.execute_script("return navigator.userAgent"),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-AU,en;q=0.9"
+        }
+        return cls(cookies, headers, **kwargs)
+
+    async def __aenter__(self) -> 'AsyncCrawlEngine':
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            cookies=self.cookies,
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        self.session = None
+
+    def _bucket_for(self, url: str) -> TokenBucket:
+        """Return the rate limiter for the URL's host"""
+        host = urlparse(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.host_rate_limit)
+        return self._buckets[host]
+
+    async def fetch_text(self, url: str) -> Optional[str]:
+        """Fetch a URL and return the body text, or None on a non-200 response"""
+        async with self._semaphore:
+            await self._bucket_for(url).acquire()
+            async with self.session.get(url) as response:
+                if response.status != 200:
+                    logging.warning(f"HTTP {response.status} for {url}")
+                    return None
+                return await response.text(errors="replace")
+
+    async def fetch_to_file(self, url: str, path: str, chunk_size: int = 65536) -> str:
+        """Stream a URL to path, removing the partial file on any failure;
+        returns the server's suggested filename, if any"""
+        async with self._semaphore:
+            await self._bucket_for(url).acquire()
+            try:
+                async with self.session.get(url) as response:
+                    if response.status != 200:
+                        raise HttpStatusError(response.status, url)
+                    with open(path, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(chunk_size):
+                            f.write(chunk)
+                    return filename_from_disposition(
+                        response.headers.get("Content-Disposition", ""))
+            except BaseException:
+                # Includes cancellation, so an interrupted run leaves nothing behind
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                raise
+
+
+class _PdfFileEventHandler(FileSystemEventHandler):
+    """Collect PDFs that appear in a folder (Chrome renames .crdownload files when done)"""
+
+    def __init__(self, completed: queue.Queue):
+        super().__init__()
+        self.completed = completed
+
+    def on_created(self, event):
+        if not event.is_directory and event.src_path.endswith('.pdf'):
+            self.completed.put(os.path.basename(event.src_path))
+
+    def on_moved(self, event):
+        if not event.is_directory and event.dest_path.endswith('.pdf'):
+            self.completed.put(os.path.basename(event.dest_path))
+
+
+class DownloadWatcher:
+    """Wait for a browser download to finish without polling the download folder"""
+
+    def __init__(self, driver, watch_dir: str):
+        self.driver = driver
+        self.watch_dir = watch_dir
+        self.mode = None
+        self.started_at = time.time()
+        self._existing: Set[str] = set()  # Files in watch_dir before this download began
+        self._observer = None
+        self._completed: queue.Queue = queue.Queue()
+
+    def start(self) -> 'DownloadWatcher':
+        """Arm the watcher; call before clicking the download button"""
+        self.started_at = time.time()
+        try:
+            self._existing = set(os.listdir(self.watch_dir))
+        except OSError:
+            self._existing = set()
+        try:
+            # Drain buffered entries so only events from this download are seen
+            self.driver.get_log("performance")
+            self.mode = "cdp"
+        except Exception:
+            self._start_filesystem_watch()
+        return self
+
+    def _start_filesystem_watch(self):
+        if Observer is not None:
+            try:
+                self._observer = Observer()
+                self._observer.schedule(_PdfFileEventHandler(self._completed), self.watch_dir)
+                self._observer.start()
+                self.mode = "inotify"
+                return
+            except Exception as e:
+                logging.debug(f"Filesystem events unavailable, scanning folder instead: {e}")
+                self._observer = None
+        self.mode = "scan"
+
+    def wait(self, timeout: float = DOWNLOAD_WAIT_TIMEOUT) -> Optional[str]:
+        """Return the name of the finished PDF in watch_dir, or None on timeout or cancel"""
+        deadline = self.started_at + timeout
+        try:
+            if self.mode == "cdp":
+                filename = self._wait_cdp(deadline)
+                if filename is not False:
+                    return filename
+                # No download events arrived; this Chrome does not report them
+                self._start_filesystem_watch()
+                filename = self._find_recent_pdf()
+                if filename:
+                    return filename
+            if self.mode == "inotify":
+                return self._wait_inotify(deadline)
+            return self._wait_scan(deadline)
+        finally:
+            self.close()
+
+    def _wait_cdp(self, deadline: float):
+        """Follow Page.download* events; returns False if none arrive within the grace period"""
+        names: Dict[str, str] = {}
+        grace_deadline = self.started_at + CDP_DOWNLOAD_START_GRACE
+        while time.time() < deadline:
+            for entry in self.driver.get_log("performance"):
+                try:
+                    message = json.loads(entry["message"])["message"]
+                except (KeyError, ValueError):
+                    continue
+                method = message.get("method", "")
+                params = message.get("params", {})
+                if method.endswith(".downloadWillBegin"):
+                    names[params.get("guid")] = params.get("suggestedFilename", "")
+                elif method.endswith(".downloadProgress") and params.get("guid") in names:
+                    if params.get("state") == "completed":
+                        return self._resolve_name(names[params["guid"]])
+                    if params.get("state") == "canceled":
+                        logging.warning("Browser reported the download as cancelled")
+                        return None
+
+            if not names and time.time() > grace_deadline:
+                return False
+            time.sleep(STEP_POLL_INTERVAL)
+        return None
+
+    def _resolve_name(self, suggested: str) -> Optional[str]:
+        """Find the file Chrome saved, allowing for its ' (n)' de-duplication suffix"""
+        if self._is_new(suggested):
+            return suggested
+        stem, ext = os.path.splitext(suggested)
+        for counter in range(1, 100):
+            candidate = f"{stem} ({counter}){ext}"
+            if self._is_new(candidate):
+                return candidate
+        return self._find_recent_pdf()
+
+    def _wait_inotify(self, deadline: float) -> Optional[str]:
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            try:
+                name = self._completed.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            if self._is_new(name):
+                return name
+
+    def _wait_scan(self, deadline: float) -> Optional[str]:
+        while time.time() < deadline:
+            filename = self._find_recent_pdf()
+            if filename:
+                return filename
+            time.sleep(1)
+        return None
+
+    def _is_new(self, name: str) -> bool:
+        """Whether a file exists in watch_dir that was not there when the watcher was armed"""
+        return name not in self._existing and os.path.exists(os.path.join(self.watch_dir, name))
+
+    def _find_recent_pdf(self) -> Optional[str]:
+        """Return a completed PDF that appeared since the watcher was armed"""
+        try:
+            with os.scandir(self.watch_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.pdf') and entry.name not in self._existing:
+                        return entry.name
+        except OSError:
+            pass
+        return None
+
+    def close(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=2)
+            self._observer = None
+
+
+class CircuitBreaker:
+    """Pauses all workers after a run of failures and probes the site until it recovers"""
+
+    def __init__(self, probe: Callable[[], bool], threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 window: float = BREAKER_WINDOW_SECONDS):
+        self.probe = probe
+        self.threshold = threshold
+        self.window = window
+        self.failures: List[float] = []  # Times of the current run of consecutive failures
+        self.open = False
+        self.probing = False
+        self.trips = 0
+        self.condition = threading.Condition()
+
+    def record(self, ok: bool):
+        """Count a page load or download outcome"""
+        with self.condition:
+            if ok:
+                self.failures = []
+                return
+            now = time.time()
+            self.failures = [t for t in self.failures if now - t <= self.window] + [now]
+            if not self.open and len(self.failures) >= self.threshold:
+                self.open = True
+                self.trips += 1
+                logging.warning(f"{len(self.failures)} consecutive failures, pausing all workers "
+                                f"until {BREAKER_PROBE_URL} responds")
+
+    def wait_until_closed(self, should_stop: Callable[[], bool]) -> bool:
+        """Block while the breaker is open, with one caller probing the site;
+        returns False if should_stop() became true first"""
+        with self.condition:
+            while self.open and self.probing:
+                if should_stop():
+                    return False
+                self.condition.wait(timeout=1)
+            if not self.open:
+                return True
+            self.probing = True
+
+        try:
+            delay = BREAKER_PROBE_BASE_DELAY
+            while not should_stop():
+                deadline = time.time() + delay
+                while time.time() < deadline and not should_stop():
+                    time.sleep(min(1.0, deadline - time.time()))
+                if should_stop():
+                    break
+
+                try:
+                    healthy = self.probe()
+                except Exception as e:
+                    logging.debug(f"Site probe failed: {e}")
+                    healthy = False
+                if healthy:
+                    with self.condition:
+                        self.open = False
+                        self.failures = []
+                    logging.info("Site is responding again, resuming work")
+                    return True
+
+                delay = min(BREAKER_PROBE_MAX_DELAY, delay * 2)
+                logging.info(f"Site still unavailable, next probe in {delay:.0f}s")
+            return False
+        finally:
+            with self.condition:
+                self.probing = False
+                self.condition.notify_all()
+
+
+class BrowserRecycler:
+    """Watches the main browser's memory and error rate and keeps a warm spare ready to swap in"""
+
+    def __init__(self, memory_limit_mb: float = BROWSER_MEMORY_LIMIT_MB,
+                 error_rate_limit: float = BROWSER_ERROR_RATE_LIMIT):
+        self.memory_limit_mb = memory_limit_mb
+        self.error_rate_limit = error_rate_limit
+        self.outcomes: List[bool] = []
+        self.memory_mb: Optional[float] = None
+        self.last_sample = 0.0
+        self.spare = None
+        self.spare_thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def process_tree_rss_mb(driver) -> Optional[float]:
+        """Resident memory of a driver's chromedriver process and every Chrome process under it"""
+        try:
+            root = psutil.Process(driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+        except (AttributeError, psutil.Error):
+            return None
+
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass  # Renderer exited while we were sampling
+        return total / (1024 * 1024)
+
+    def over_memory(self, driver) -> bool:
+        memory_mb = self.process_tree_rss_mb(driver)
+        return memory_mb is not None and memory_mb >= self.memory_limit_mb
+
+    def record(self, ok: bool):
+        with self.lock:
+            self.outcomes = (self.outcomes + [ok])[-BROWSER_ERROR_WINDOW:]
+
+    def reset_outcomes(self):
+        with self.lock:
+            self.outcomes = []
+
+    def reset(self):
+        """Forget the measurements of a browser that has been replaced"""
+        self.reset_outcomes()
+        self.memory_mb = None
+        self.last_sample = 0.0
+
+    def check(self, driver) -> Tuple[Optional[str], bool]:
+        """Return why the browser should be recycled (None if it is healthy) and whether a
+        spare is worth warming up"""
+        now = time.time()
+        if now - self.last_sample >= BROWSER_MEMORY_CHECK_INTERVAL:
+            self.memory_mb = self.process_tree_rss_mb(driver)
+            self.last_sample = now
+        with self.lock:
+            outcomes = list(self.outcomes)
+
+        memory_mb = self.memory_mb or 0.0
+        error_rate = outcomes.count(False) / len(outcomes) \
+            if len(outcomes) >= BROWSER_ERROR_WINDOW else 0.0
+        if memory_mb >= self.memory_limit_mb:
+            return f"memory {memory_mb:.0f} MB", True
+        if error_rate >= self.error_rate_limit:
+            return f"error rate {error_rate:.0%}", True
+        return None, (memory_mb >= self.memory_limit_mb * BROWSER_SPARE_THRESHOLD or
+                      error_rate >= self.error_rate_limit * BROWSER_SPARE_THRESHOLD)
+
+    def prepare_spare(self, factory: Callable[[], object]):
+        """Start a browser in the background so the next swap does not wait for a cold start"""
+        with self.lock:
+            if self.spare_thread is not None:
+                return
+
+            def build():
+                try:
+                    driver = factory()
+                except Exception as e:
+                    logging.warning(f"Could not start a spare browser: {e}")
+                    driver = None
+                with self.lock:
+                    self.spare = driver
+
+            self.spare_thread = threading.Thread(target=build, name="spare-browser", daemon=True)
+            self.spare_thread.start()
+            logging.info("Warming up a spare browser")
+
+    def take_spare(self, timeout: float = DEFAULT_PAGE_LOAD_TIMEOUT):
+        """Return the spare browser (waiting for one that is still starting), or None"""
+        thread = self.spare_thread
+        if thread is None:
+            return None
+        thread.join(timeout)
+        with self.lock:
+            if thread.is_alive():
+                return None
+            spare, self.spare, self.spare_thread = self.spare, None, None
+        return spare
+
+    def discard_spare(self):
+        spare = self.take_spare()
+        if spare is not None:
+            try:
+                spare.quit()
+            except Exception as e:
+                logging.warning(f"Error closing spare browser: {e}")
+
+
+class ConcurrencyController:
+    """AIMD limit on how many workers may run a job at once, driven by job time and failures"""
+
+    def __init__(self, max_workers: int, adaptive: bool = False, name: str = "workers"):
+        self.max_workers = max(1, max_workers)
+        self.adaptive = adaptive
+        self.name = name
+        # Adaptive pools start at half strength and earn the rest while the site keeps up
+        self.limit = max(1, self.max_workers // 2) if adaptive else self.max_workers
+        self.active = 0
+        self.samples: List[Tuple[float, bool]] = []
+        self.baseline: Optional[float] = None
+        self.condition = threading.Condition()
+
+    def acquire(self, should_stop: Callable[[], bool]) -> bool:
+        """Wait for a free slot; returns False if should_stop() becomes true first"""
+        with self.condition:
+            while self.active >= self.limit:
+                if should_stop():
+                    return False
+                self.condition.wait(timeout=1)
+            self.active += 1
+            return True
 
-            for option in chrome_options:
-                opts.add_argument(option)
+    def release(self, seconds: Optional[float] = None, ok: bool = True):
+        """Free a slot and record how the job went (nothing is recorded if no job ran)"""
+        with self.condition:
+            self.active -= 1
+            self.condition.notify()
+            if self.adaptive and seconds is not None:
+                self.samples.append((seconds, ok))
+                if len(self.samples) >= AIMD_WINDOW:
+                    self._adjust()
+
+    def _adjust(self):
+        """Apply one AIMD step from the window of recent jobs"""
+        times = sorted(seconds for seconds, _ in self.samples)
+        median = times[len(times) // 2]
+        error_rate = sum(1 for _, ok in self.samples if not ok) / len(self.samples)
+        self.samples = []
+
+        if self.baseline is None:
+            self.baseline = median
+        if error_rate > AIMD_MAX_ERROR_RATE or median > self.baseline * AIMD_LATENCY_FACTOR:
+            new_limit = max(1, int(self.limit * AIMD_DECREASE_FACTOR))
+        else:
+            # Only healthy windows move the baseline, so an overloaded site cannot raise it
+            self.baseline = 0.8 * self.baseline + 0.2 * median
+            new_limit = min(self.max_workers, self.limit + 1)
+
+        if new_limit != self.limit:
+            logging.info(f"Adjusting active {self.name} {self.limit} -> {new_limit} "
+                         f"(median {median:.1f}s, baseline {self.baseline:.1f}s, "
+                         f"errors {error_rate:.0%})")
+            self.limit = new_limit
+            self.condition.notify_all()
+
+
+class BrowserPool:
+    """Pool of WebDriver workers that process jobs concurrently"""
+
+    def __init__(self, scraper: 'JadeScraper', config: SearchConfig, size: int,
+                 shared_driver=None, driver_factory: Optional[Callable[[int], object]] = None):
+        self.scraper = scraper
+        self.config = config
+        self.size = max(1, size)
+        self.shared_driver = shared_driver
+        self.driver_factory = driver_factory or (
+            lambda index: scraper.create_worker_driver(config))
+        self.controller = ConcurrencyController(
+            self.size, config.adaptive_concurrency, "browser workers")
+        self._lock = threading.Lock()
+
+    def _start_driver(self, index: int):
+        """Start (or reuse) the driver for a worker"""
+        if index == 0 and self.shared_driver is not None:
+            return self.shared_driver
+        try:
+            return self.driver_factory(index)
+        except Exception as e:
+            logging.error(f"Worker {index + 1} failed to start browser: {e}")
+            self.scraper.log_error(
+                "BROWSER_INIT_ERROR", str(e), f"Pool worker {index + 1}")
+            return None
 
-            # Headless mode
-            if config.headless:
-                opts.add_argument("--headless=new")
+    def _stop_driver(self, index: int, driver):
+        """Quit a driver owned by the pool"""
+        if driver is None or driver is self.shared_driver:
+            return
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Error closing worker {index + 1} driver: {e}")
+
+    def run(self, jobs: List, handler: Callable, on_result: Optional[Callable] = None,
+            succeeded: Optional[Callable[[object], bool]] = None,
+            retry_unsuccessful: bool = False) -> Tuple[Dict, List]:
+        """Run handler(driver, wait, job) for every job; return results keyed by job and failed jobs.
+        succeeded(result) tells the concurrency controller whether a returned result was a failure;
+        with retry_unsuccessful, such a result is retried like an exception instead of returned"""
+        job_queue = queue.Queue()
+        for job in jobs:
+            job_queue.put((job, 1))
+
+        results = {}
+        failed = []
+
+        def retry_or_fail(job, attempt: int):
+            if attempt < MAX_RETRY_ATTEMPTS:
+                job_queue.put((job, attempt + 1))
             else:
-                opts.add_argument("--start-maximized")
+                with self._lock:
+                    failed.append(job)
+
+        def worker(index: int):
+            driver = self._start_driver(index)
+            if driver is None:
+                return
+
+            wait = WebDriverWait(driver, self.config.wait_time)
+            try:
+                while not self.scraper.cancelled:
+                    if not self.controller.acquire(lambda: self.scraper.cancelled):
+                        return
+                    try:
+                        job, attempt = job_queue.get_nowait()
+                    except queue.Empty:
+                        self.controller.release()
+                        return
+
+                    job_start = time.time()
+                    try:
+                        result = handler(driver, wait, job)
+                    except Exception as e:
+                        self.controller.release(time.time() - job_start, False)
+                        logging.warning(
+                            f"Worker {index + 1} failed job {job} (attempt {attempt}): {e}")
+                        retry_or_fail(job, attempt)
+
+                        # A broken session is replaced before taking the next job
+                        if isinstance(e, WebDriverException) and driver is not self.shared_driver:
+                            self._stop_driver(index, driver)
+                            driver = self._start_driver(index)
+                            if driver is None:
+                                return
+                            wait = WebDriverWait(driver, self.config.wait_time)
+                        continue
+
+                    ok = succeeded(result) if succeeded else True
+                    self.controller.release(time.time() - job_start, ok)
+                    if retry_unsuccessful and not ok:
+                        logging.warning(
+                            f"Worker {index + 1} got no result for job {job} (attempt {attempt})")
+                        retry_or_fail(job, attempt)
+                        continue
+                    with self._lock:
+                        results[job] = result
+                    if on_result:
+                        on_result(job, result)
+
+                    # Replace a worker browser that has grown too large, between jobs
+                    if driver is not self.shared_driver and \
+                            self.scraper.browser_recycler.over_memory(driver):
+                        logging.info(f"Worker {index + 1} browser is over its memory limit, replacing it")
+                        self._stop_driver(index, driver)
+                        driver = self._start_driver(index)
+                        if driver is None:
+                            return
+                        wait = WebDriverWait(driver, self.config.wait_time)
+            finally:
+                self._stop_driver(index, driver)
+
+        threads = [
+            threading.Thread(target=worker, args=(index,), daemon=True)
+            for index in range(self.size)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Anything left in the queue was never processed (cancelled or no workers started)
+        while not job_queue.empty():
+            job, _ = job_queue.get_nowait()
+            failed.append(job)
+
+        return results, failed
+
+
+class DownloadPipeline:
+    """Download links on dedicated browsers while the search phase is still producing them"""
+
+    def __init__(self, scraper: 'JadeScraper', config: SearchConfig,
+                 queue_size: int = DEFAULT_PIPELINE_QUEUE_SIZE):
+        self.scraper = scraper
+        self.config = config
+        # Bounded so a slow download worker holds back pagination instead of buffering everything
+        self.queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self.published = LinkStore()
+        self.attempted = LinkStore()
+        self.failed_downloads: List[str] = []
+        self.failed_download_objects: List[FailedDownload] = []
+        self.failed = False  # Set if no worker could start a browser, or every worker died
+        self._stopped = False
+        self.worker_count = max(1, config.download_workers)
+        self._start_failures = 0
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self.controller = ConcurrencyController(
+            self.worker_count, config.adaptive_concurrency, "download workers")
+
+    def start(self):
+        for index in range(self.worker_count):
+            thread = threading.Thread(
+                target=self._consume, args=(index,), name=f"download-pipeline-{index + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def publish(self, links: Iterable[str]):
+        """Queue newly found links for download, blocking while the queue is full"""
+        with self.scraper.progress_lock:
+            new_links = [link for link in links if self.published.append(link)]
+
+        for link in new_links:
+            while not (self.scraper.cancelled or self.failed or self._stopped):
+                if not any(thread.is_alive() for thread in self._threads):
+                    # Nothing will ever drain the queue; the links are downloaded after the search
+                    logging.error("All download workers have exited, stopping pipelined downloads")
+                    self.failed = True
+                    break
+                try:
+                    self.queue.put(link, timeout=1)
+                    break
+                except queue.Full:
+                    continue
+
+    def finish(self) -> List[str]:
+        """Signal the end of the search phase and wait for the queued downloads to drain"""
+        # One end marker per worker; stop offering them once no worker is left to take one
+        sentinels = len(self._threads)
+        while sentinels and any(thread.is_alive() for thread in self._threads):
+            try:
+                self.queue.put(None, timeout=1)
+                sentinels -= 1
+            except queue.Full:
+                continue
+        for thread in self._threads:
+            thread.join()
+        return self.failed_downloads
+
+    def stop(self):
+        """Abandon queued downloads and wait for the workers to exit"""
+        self._stopped = True
+        for thread in self._threads:
+            thread.join()
+
+    def _consume(self, worker_index: int):
+        scraper, config = self.scraper, self.config
+        try:
+            driver, staging_dir = scraper.create_download_worker(config, worker_index)
+        except Exception as e:
+            logging.error(f"Download worker {worker_index + 1} could not start a browser: {e}")
+            # Compared with the configured count, as start() may still be launching threads
+            with self._lock:
+                self._start_failures += 1
+                if self._start_failures == self.worker_count:
+                    self.failed = True
+            return
+
+        wait = WebDriverWait(driver, config.wait_time)
+        try:
+            stopping = lambda: scraper.cancelled or self._stopped
+            while not stopping():
+                if not self.controller.acquire(stopping):
+                    break
+                try:
+                    link = self.queue.get(timeout=1)
+                except queue.Empty:
+                    self.controller.release()
+                    continue
+                if link is None:
+                    self.controller.release()
+                    break
+
+                with scraper.progress_lock:
+                    self.attempted.append(link)
+                    index = len(self.attempted)
+                download_start = time.time()
+                success, result_msg = scraper.download_pdf(
+                    link, config, index, len(self.published), driver=driver, wait=wait,
+                    staging_dir=staging_dir)
+                self.controller.release(time.time() - download_start, success)
+                scraper.record_download_result(
+                    link, index, success, result_msg,
+                    self.failed_downloads, self.failed_download_objects,
+                    retry=config.auto_retry_failed)
+                scraper.run_due_retries(config, self.failed_downloads, self.failed_download_objects,
+                                        driver, wait, staging_dir)
+
+                if scraper.browser_recycler.over_memory(driver):
+                    logging.info(f"Download worker {worker_index + 1} browser is over its memory "
+                                 f"limit, replacing it")
+                    # Start the replacement first so a failed launch leaves the worker running
+                    try:
+                        new_driver = scraper.create_worker_driver(config, staging_dir)
+                    except Exception as e:
+                        logging.error(f"Download worker {worker_index + 1} could not start a "
+                                      f"replacement browser, keeping the old one: {e}")
+                        scraper.log_error("BROWSER_INIT_ERROR", str(e),
+                                          f"Download worker {worker_index + 1} recycle")
+                    else:
+                        scraper.quit_driver(driver)
+                        driver = new_driver
+                        wait = WebDriverWait(driver, config.wait_time)
+        except Exception as e:
+            # publish() notices once no worker is left and hands the links back to the caller
+            logging.error(f"Download worker {worker_index + 1} stopped unexpectedly: {e}")
+            scraper.log_error("DOWNLOAD_ERROR", str(e), f"Download worker {worker_index + 1}")
+        finally:
+            try:
+                driver.quit()
+            except Exception as e:
+                logging.warning(f"Error closing download worker {worker_index + 1} driver: {e}")
+            scraper.release_staging_dir(staging_dir, config.download_dir)
+
+
+class JadeScraper:
+    """Main scraper class for Jade.io case links"""
+
+    def __init__(self):
+        self.driver = None
+        self.wait = None
+        self.search_timer = None
+        self.download_timers = {}
+        self.total_timer = None
+        self.browser_start_time = None
+        self.browser_recycler = BrowserRecycler()
+        self.recycle_reason: Optional[str] = None
+        self.cancelled = False
+        self.failed_downloads_file = "failed_downloads.json"
+        self.error_log_file = "jade_scraper_errors.log"
+        self.progress_save_file = "jade_scraper_progress.json"
+        self.report_data = None
+        self.page_load_times = []
+        self.download_times = []
+        self.wait_step_times: Dict[str, List[float]] = {}
+        self.progress_state = None
+        self.save_interval = 10  # Save progress every 10 operations
+        self.operation_count = 0
+        self.failed_search_pages: List[int] = []  # Pages the last parallel search could not fetch
+        self.failed_subqueries: List[str] = []  # Court or date sub-queries with pages missing
+        self.search_pages_fetched = 0  # Pages loaded from the site (not the cache) this run
+        self.pdfs_downloaded = 0  # PDFs actually fetched (not skipped) this run
+        self.progress_lock = threading.RLock()
+        self.download_pipeline: Optional[DownloadPipeline] = None
+        self.search_cache: Optional[SearchPageCache] = None
+        self.timing_history = TimingHistory()
+        self.pdf_url_template: Optional[str] = None  # e.g. https://jade.io/.../{article_id}/...
+        self.pdf_http_client: Optional[JadeHttpClient] = None
+        self.direct_pdf_failures = 0
+        self.download_lock = threading.Lock()  # Serialises naming and moving finished files
+        self.download_index: Optional[DownloadIndex] = None
+        self.pdf_store: Optional[PdfStore] = None
+        self.pdf_validator: Optional[PdfValidator] = None
+        self.retry_scheduler = RetryScheduler()
+        self.circuit_breaker = CircuitBreaker(self.probe_site)
+        self.probe_pool: Optional[urllib3.PoolManager] = None
+        self.invalid_downloads: List[FailedDownload] = []
+        self.download_attempts: Dict[str, int] = {}  # Attempt number of each retried link
+        self.download_http_statuses: Dict[str, int] = {}  # HTTP status of each link's last failure
+        self.http_client = None
+        self.page_parser = SearchPageParser()
+
+    def get_default_profile_dir(self) -> str:
+        """Get the default Chrome profile directory based on OS"""
+        home = os.path.expanduser("~")
+        system = platform.system()
+
+        profile_paths = {
+            'Windows': os.path.join(home, 'AppData', 'Local', 'Google', 'Chrome', 'User Data'),
+            'Darwin': os.path.join(home, 'Library', 'Application Support', 'Google', 'Chrome'),
+            'Linux': os.path.join(home, '.config', 'google-chrome')
+        }
+
+        return profile_paths.get(system, profile_paths['Linux'])
+
+    def format_date_for_jade(self, date_str: str) -> Optional[str]:
+        """Convert YYYY-MM-DD format to Jade.io date format"""
+        if not date_str:
+            return None
+
+        try:
+            dt = datetime.strptime(date_str, "%Y-%m-%d")
+            return dt.strftime("%Y%m%dT000000000+0800")
+        except ValueError as e:
+            logging.warning(f"Invalid date format: {date_str} - {e}")
+            return None
+
+    def build_search_url(self, config: SearchConfig, page: int = 0) -> str:
+        """Build the search URL with all parameters"""
+        # Encode search terms
+        encoded_terms = [quote_plus(term) for term in config.query.split()]
+        query_part = '+AND+'.join(
+            encoded_terms) if config.use_and else '+'.join(encoded_terms)
+
+        # Build date filter
+        date_part = ""
+        if config.start_date and config.end_date:
+            since = self.format_date_for_jade(config.start_date)
+            until = self.format_date_for_jade(config.end_date)
+            if since and until:
+                date_part = f":effective.since={since}:effective.until={until}"
+        else:
+            date_part = f":order1.effectivedateasc=desc"
+
+        # Build page parameter
+        page_part = f"page={page}" if page > 0 else ""
+
+        # Build court filter
+        court_part = f":collection.journalGroupName={config.court_name}" if config.court_name else ""
+
+        # Combine all parts
+        url = f"https://jade.io/search/{page_part}{court_part}{date_part}:text={query_part}"
+        return url
+
+    def build_chrome_options(self, config: SearchConfig, download_dir: Optional[str] = None,
+                             download_events: bool = True) -> Options:
+        """Build Chrome options, optionally configured to save PDFs into download_dir
+        (reporting download events to DownloadWatcher unless download_events is False)"""
+        opts = Options()
+
+        # Basic Chrome options
+        chrome_options = [
+            '--disable-gpu',
+            '--no-sandbox',
+            '--disable-dev-shm-usage',
+            '--disable-blink-features=AutomationControlled',
+            '--disable-extensions',
+            '--disable-plugins',
+            '--disable-images',  # Speed up loading
+            "--blink-settings=imagesEnabled=false"
+        ]
+
+        for option in chrome_options:
+            opts.add_argument(option)
+
+        # Headless mode
+        if config.headless:
+            opts.add_argument("--headless=new")
+        else:
+            opts.add_argument("--start-maximized")
+
+        # PDF download configuration
+        if download_dir:
+            prefs = {
+                "plugins.always_open_pdf_externally": True,
+                "download.prompt_for_download": False,
+                "download.default_directory": os.path.abspath(download_dir)
+            }
+            opts.add_experimental_option("prefs", prefs)
+
+            if download_events:
+                # Expose DevTools download events through the performance log. They are page
+                # events; network events would make up most of the log and are never read
+                opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+                opts.add_experimental_option(
+                    "perfLoggingPrefs", {"enableNetwork": False, "enablePage": True})
+
+        return opts
+
+    def setup_driver(self, config: SearchConfig) -> bool:
+        """Initialize and configure the Chrome driver"""
+        try:
+            download_dir = None
 
             # PDF download configuration
             if config.download_pdfs and config.download_dir:
                 # Create search query folder within download directory
-                query_folder = self.create_query_folder(
+                download_dir = self.create_query_folder(
                     config.download_dir, config.query)
 
-                prefs = {
-                    "plugins.always_open_pdf_externally": True,
-                    "download.prompt_for_download": False,
-                    "download.default_directory": os.path.abspath(query_folder)
-                }
-                opts.add_experimental_option("prefs", prefs)
+                # The shared PDF store sits beside the query folders
+                if config.shared_store and not config.pdf_store_dir:
+                    config.pdf_store_dir = os.path.join(config.download_dir, PDF_STORE_DIR)
 
                 # Update config to use the new folder path
-                config.download_dir = query_folder
+                config.download_dir = download_dir
+
+            opts = self.build_chrome_options(
+                config, download_dir, self.main_browser_downloads(config))
 
             # Try to use existing Chrome profile first
             try:
@@ -606,112 +2650,797 @@ class JadeScraper:
                 self.log_error(
                     "BROWSER_SETUP", f"Primary Chrome setup failed: {e}", "Using fallback options")
 
-                fallback_opts = Options()
-                for option in chrome_options:
-                    fallback_opts.add_argument(option)
+                fallback_opts = self.build_chrome_options(
+                    config, download_dir, self.main_browser_downloads(config))
+                self.driver = webdriver.Chrome(options=fallback_opts)
+
+            # Set timeouts
+            self.driver.set_page_load_timeout(DEFAULT_PAGE_LOAD_TIMEOUT)
+            self.wait = WebDriverWait(self.driver, config.wait_time)
+            self.browser_start_time = datetime.now()
+            return True
+
+        except Exception as e:
+            error_msg = f"Failed to initialize Chrome driver: {e}"
+            logging.error(error_msg)
+            self.log_error("BROWSER_INIT_ERROR", str(
+                e), f"Headless: {config.headless}")
+            return False
+
+    @staticmethod
+    def main_browser_downloads(config: SearchConfig) -> bool:
+        """Whether the main browser does the downloads itself; with download workers it only
+        handles the occasional retry, which DownloadWatcher can follow on the filesystem"""
+        return config.download_workers <= 1 and not config.pipeline_downloads
+
+    def create_worker_driver(self, config: SearchConfig, download_dir: Optional[str] = None,
+                             download_events: bool = True):
+        """Create an additional Chrome driver for a pool worker"""
+        opts = self.build_chrome_options(config, download_dir, download_events)
+        opts.add_argument(f"--user-data-dir={tempfile.mkdtemp()}")
+        driver = webdriver.Chrome(options=opts)
+        driver.set_page_load_timeout(DEFAULT_PAGE_LOAD_TIMEOUT)
+        return driver
+
+    def create_download_worker(self, config: SearchConfig, index: int) -> Tuple[object, str]:
+        """Start a download browser with a private staging folder inside the query folder"""
+        # Staging inside the query folder keeps the final move on one filesystem (atomic)
+        os.makedirs(config.download_dir, exist_ok=True)
+        staging_dir = tempfile.mkdtemp(prefix=f".staging_{index + 1}_", dir=config.download_dir)
+        try:
+            return self.create_worker_driver(config, staging_dir), staging_dir
+        except Exception:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+    def get_download_index(self, download_dir: Optional[str]) -> Optional[DownloadIndex]:
+        """Return the download index for a folder, loading it on first use"""
+        if not download_dir:
+            return None
+        with self.progress_lock:
+            if self.download_index is None or self.download_index.download_dir != download_dir:
+                if self.download_index:
+                    self.download_index.save()
+                self.download_index = DownloadIndex.load(download_dir)
+            return self.download_index
+
+    def get_pdf_store(self, config: SearchConfig) -> Optional[PdfStore]:
+        """Return the shared PDF store for this run, loading it on first use"""
+        if not (config.shared_store and config.pdf_store_dir):
+            return None
+        with self.progress_lock:
+            if self.pdf_store is None or self.pdf_store.download_dir != config.pdf_store_dir:
+                if self.pdf_store:
+                    self.pdf_store.save()
+                self.pdf_store = PdfStore.load(config.pdf_store_dir)
+            return self.pdf_store
+
+    def index_download(self, download_dir: str, url_number: str, path: str):
+        """Record a finished download so later runs and other queries can skip the case"""
+        index = self.get_download_index(download_dir)
+        entry = index.record(url_number, path) if index else None
+        if entry and self.pdf_store:
+            self.pdf_store.add(url_number, path, entry)
+
+    def validate_download(self, link: Optional[str], url_number: str, path: str):
+        """Check a finished download in the background; it is indexed once it passes"""
+        with self.progress_lock:
+            if self.pdf_validator is None:
+                self.pdf_validator = PdfValidator(
+                    lambda number, saved: self.index_download(
+                        os.path.dirname(saved), number, saved),
+                    self.reject_download)
+            validator = self.pdf_validator
+        validator.submit(link, url_number, path)
+
+    def reject_download(self, link: Optional[str], path: str, problem: str):
+        """Delete a download that failed validation and queue its case for retry"""
+        logging.warning(f"Downloaded file {os.path.basename(path)} is not a valid PDF: {problem}")
+        try:
+            os.remove(path)
+        except OSError as e:
+            logging.warning(f"Could not remove invalid download {path}: {e}")
+        if not link:
+            return
+
+        error_message = f"Invalid PDF: {problem}"
+        with self.progress_lock:
+            self.invalid_downloads.append(FailedDownload(
+                link=link, error_message=error_message, timestamp=datetime.now().isoformat(),
+                attempt_count=self.download_attempts.get(link, 1)))
+            if self.progress_state:
+                # Validation runs after the download was recorded, so take it back out
+                self.progress_state.downloaded_links.remove(link)
+                self.progress_state.failed_downloads.append({
+                    'link': link,
+                    'error_message': error_message,
+                    'timestamp': datetime.now().isoformat()
+                })
+
+    def take_invalid_downloads(self) -> List[FailedDownload]:
+        """Wait for pending validations and return the downloads that failed since the last call"""
+        if self.pdf_validator:
+            self.pdf_validator.drain()
+        with self.progress_lock:
+            invalid, self.invalid_downloads = self.invalid_downloads, []
+        return invalid
+
+    def link_from_store(self, store: PdfStore, url_number: str, download_dir: str) -> Optional[str]:
+        """Place a stored copy of a case in the query folder; returns its path"""
+        stored_file = store.lookup(url_number)
+        if not stored_file:
+            return None
+        try:
+            os.makedirs(download_dir, exist_ok=True)
+            with self.download_lock:
+                target = self.numbered_download_path(
+                    download_dir, url_number, store.entry(url_number).get('name') or "case.pdf")
+                store.link_or_copy(stored_file, target)
+        except (OSError, AttributeError) as e:
+            logging.warning(f"Could not reuse stored PDF for {url_number}: {e}")
+            return None
+        self.get_download_index(download_dir).record(url_number, target)
+        return target
+
+    def release_staging_dir(self, staging_dir: str, download_dir: str):
+        """Move any PDFs that finished late into the query folder and remove the staging folder"""
+        try:
+            for name in os.listdir(staging_dir):
+                if name.endswith('.pdf'):
+                    with self.download_lock:
+                        match = re.match(r'(\d+)_', name)
+                        target = self.numbered_download_path(
+                            download_dir, match.group(1), name[match.end():]) if match \
+                            else os.path.join(download_dir, name)
+                        os.replace(os.path.join(staging_dir, name), target)
+                    if match:
+                        self.validate_download(None, match.group(1), target)
+        except OSError as e:
+            logging.warning(f"Error emptying staging folder {staging_dir}: {e}")
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def filter_links(self, links: List[str]) -> List[str]:
+        """Filter out unwanted links based on excluded patterns and remove query parameters"""
+        filtered_links = []
+        for link in links:
+            if link and not any(re.search(pat, link) for pat in EXCLUDED_PATTERNS):
+                # Remove query parameters (everything after ?)
+                clean_link = link.split('?')[0]
+                filtered_links.append(clean_link)
+        return filtered_links
+
+    def dismiss_popup_if_present(self, driver=None):
+        """Check for and dismiss the 'No Thanks' popup if it exists"""
+        driver = driver or self.driver
+        try:
+            # Look for the "No Thanks" link popup
+            no_thanks_link = driver.find_element(
+                By.CSS_SELECTOR, 'a.link-no-underline[href="#"]')
+            if no_thanks_link and no_thanks_link.text.strip() == "No Thanks":
+                logging.info("Found 'No Thanks' popup, dismissing it")
+                no_thanks_link.click()
+                # Wait for the popup to close rather than sleeping
+                try:
+                    self.timed_wait("popup_close", EC.invisibility_of_element(no_thanks_link),
+                                    driver, timeout=1)
+                except TimeoutException:
+                    logging.debug("Popup still visible after dismissal")
+                return True
+        except NoSuchElementException:
+            # No popup found, which is normal
+            pass
+        except Exception as e:
+            logging.warning(f"Error checking for popup: {e}")
+        return False
+
+    def parse_page_html(self, html: str) -> Tuple[List[str], Optional[int]]:
+        """Parse results HTML once and return filtered links and the total page count"""
+        raw_links, total_pages = self.page_parser.parse(html)
+        return self.filter_links(raw_links), total_pages
+
+    def extract_links_from_html(self, html: str) -> List[str]:
+        """Extract case links from search results HTML"""
+        return self.parse_page_html(html)[0]
+
+    def extract_total_pages_from_html(self, html: str) -> Optional[int]:
+        """Extract the total page count from search results HTML, or None if absent"""
+        return self.parse_page_html(html)[1]
+
+    def extract_links_from_page(self, driver=None) -> List[str]:
+        """Extract case links from current page"""
+        driver = driver or self.driver
+        try:
+            # First, check for and dismiss any popups
+            self.dismiss_popup_if_present(driver)
+
+            return self.extract_links_from_html(driver.page_source)
+        except Exception as e:
+            logging.error(f"Error extracting links: {e}")
+            return []
+
+    def get_total_pages(self, driver=None) -> int:
+        """Extract total number of pages from search results"""
+        driver = driver or self.driver
+        try:
+            return self.extract_total_pages_from_html(driver.page_source) or 1
+        except Exception as e:
+            logging.error(f"Error getting total pages: {e}")
+            return 1
+
+    def wait_for_search_results(self, wait: WebDriverWait, page: int = 0) -> bool:
+        """Wait for the document and the search result list to be loaded; False on timeout"""
+        try:
+            wait.until(
+                lambda driver: driver.execute_script(
+                    "return document.readyState") == "complete"
+            )
+            # Wait for search results to be present
+            wait.until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "div.result.no-alt"))
+            )
+            return True
+        except TimeoutException:
+            logging.warning(
+                f"Page {page + 1} content may not be fully loaded after timeout")
+            return False
+
+    def probe_site(self) -> bool:
+        """Cheap health check of jade.io over plain HTTP, without a browser"""
+        if self.probe_pool is None:
+            self.probe_pool = urllib3.PoolManager(num_pools=1, maxsize=1)
+        response = self.probe_pool.request(
+            "HEAD", BREAKER_PROBE_URL, retries=False, redirect=False,
+            timeout=urllib3.Timeout(connect=5, read=10))
+        return response.status < 500 and response.status != 429
+
+    def record_site_result(self, ok: bool, driver=None):
+        """Feed a page load or download outcome to the circuit breaker and, for the main
+        browser, to the recycler"""
+        self.circuit_breaker.record(ok)
+        if self.circuit_breaker.open:
+            # Failures during an outage say nothing about the browser itself
+            self.browser_recycler.reset_outcomes()
+        elif driver is None or driver is self.driver:
+            self.browser_recycler.record(ok)
+
+    def wait_for_site(self, config: SearchConfig) -> bool:
+        """Hold a worker while the circuit breaker is open; returns False if cancelled meanwhile"""
+        if self.circuit_breaker.open and config.progress_callback:
+            config.progress_callback("jade.io is not responding, pausing until it recovers...")
+        return self.circuit_breaker.wait_until_closed(lambda: self.cancelled)
+
+    def start_http_client(self, config: SearchConfig) -> bool:
+        """Create the direct HTTP client from the current browser session"""
+        if self.http_client:
+            return True
+        try:
+            # Cookies are only visible once the browser is on a jade.io page
+            if not (self.driver.current_url or "").startswith("https://jade.io"):
+                self.driver.get("https://jade.io/")
+            self.http_client = JadeHttpClient(
+                self.driver, pool_size=max(config.search_workers, 4))
+            if config.progress_callback:
+                config.progress_callback("Direct HTTP search mode enabled")
+            return True
+        except Exception as e:
+            logging.warning(f"Could not start HTTP client, using browser only: {e}")
+            self.log_error("HTTP_CLIENT_ERROR", str(e), f"Query: {config.query}")
+            self.http_client = None
+            return False
+
+    def get_search_cache(self, config: SearchConfig) -> Optional[SearchPageCache]:
+        """Return the search page cache, or None when caching is disabled"""
+        if config.cache_ttl_hours <= 0:
+            return None
+        with self.progress_lock:
+            if self.search_cache is None:
+                self.search_cache = SearchPageCache(
+                    SEARCH_CACHE_DIR, config.cache_ttl_hours, config.cache_max_entries)
+            else:
+                self.search_cache.ttl_seconds = config.cache_ttl_hours * 3600
+                self.search_cache.max_entries = max(1, config.cache_max_entries)
+        return self.search_cache
+
+    def cached_search_page(self, config: SearchConfig, page: int,
+                           want_total: bool = False) -> Optional[SearchPageResult]:
+        """Return a search page from the cache if a fresh copy exists"""
+        cache = self.get_search_cache(config)
+        if not cache:
+            return None
+        cached = cache.get(self.build_search_url(config, page), want_total)
+        if cached is None:
+            return None
+        links, total_pages = cached
+        logging.debug(f"Search cache hit for page {page + 1}")
+        return SearchPageResult(page=page, links=links,
+                                total_pages=(total_pages or 1) if want_total else None)
+
+    def store_search_page(self, config: SearchConfig, result: Optional[SearchPageResult]):
+        """Cache an extracted search page; empty pages are not cached as they may be transient"""
+        cache = self.get_search_cache(config)
+        if cache and result is not None and result.links:
+            cache.put(self.build_search_url(config, result.page), result.links, result.total_pages)
+
+    def fetch_search_page_http(self, config: SearchConfig, page: int,
+                               want_total: bool = False) -> Optional[SearchPageResult]:
+        """Fetch a search results page over HTTP; None means it needs JavaScript rendering"""
+        url = self.build_search_url(config, page)
+        try:
+            page_load_start = time.time()
+            html = self.http_client.get_text(url)
+            if config.generate_report:
+                self.page_load_times.append(time.time() - page_load_start)
+        except Exception as e:
+            logging.warning(f"HTTP fetch failed for page {page + 1}: {e}")
+            return None
+
+        if not html:
+            return None
+        result = self.parse_search_html(html, page, want_total)
+        if result is not None:
+            with self.progress_lock:
+                self.search_pages_fetched += 1
+        self.store_search_page(config, result)
+        return result
+
+    def parse_search_html(self, html: str, page: int, want_total: bool = False) -> Optional[SearchPageResult]:
+        """Parse fetched search HTML; None means the page needs JavaScript rendering"""
+        links, total_pages = self.parse_page_html(html)
+        if not links:
+            # The result list is rendered client-side for this page
+            logging.debug(f"Page {page + 1} needs JavaScript rendering, using browser")
+            return None
+
+        total_pages = (total_pages or 1) if want_total else None
+        return SearchPageResult(page=page, links=links, total_pages=total_pages)
+
+    def iter_case_links(self, config: SearchConfig) -> Iterator[CaseLinkRecord]:
+        """Yield case links page by page as the search progresses"""
+        # Only a compact ID set is kept for deduplication, so memory stays flat
+        # regardless of result count; the browser closes when the generator does
+        self.cancelled = False
+        if not self.setup_driver(config):
+            raise RuntimeError("Failed to initialize browser")
+
+        seen_links = LinkStore()
+        seen_index = SeenCaseIndex.for_config(config) if config.incremental else None
+        stop_at_known = seen_index is not None and not (config.start_date and config.end_date)
+        search_incomplete = False
+        try:
+            self.search_timer = TimingInfo(datetime.now())
+            result = self.cached_search_page(config, 0, want_total=True)
+            if result is None:
+                self.load_search_results(config)
+                result = self.extract_search_page(config, 0, want_total=True)
+            elif config.fetch_mode == "http":
+                self.start_http_client(config)
+            total_pages = result.total_pages
+
+            page = 0
+            while True:
+                fresh_links = [link for link in result.links if seen_links.append(link)]
+                new_links = [link for link in fresh_links
+                             if seen_index is None or link not in seen_index]
+                for position, link in enumerate(new_links):
+                    yield CaseLinkRecord.from_link(link, page, position)
+
+                if config.progress_callback:
+                    config.progress_callback(
+                        f"Streamed page {page + 1}/{total_pages} - {len(seen_links)} links")
+
+                page += 1
+                if not fresh_links or page >= total_pages or (stop_at_known and not new_links):
+                    break
+                if self.cancelled:
+                    search_incomplete = True
+                    break
+
+                if self.should_restart_browser(config) and not self.restart_browser(config):
+                    logging.error("Failed to restart browser, stopping pagination")
+                    search_incomplete = True
+                    break
+
+                try:
+                    result = self.fetch_search_page(config, page)
+                    if not result.loaded:
+                        # A timed-out page would otherwise read as the end of the results
+                        logging.warning(f"Page {page + 1} timed out, retrying it")
+                        result = self.fetch_search_page(config, page)
+                    if not result.loaded:
+                        raise TimeoutException("search results did not load")
+                except Exception as e:
+                    logging.warning(f"Error processing page {page + 1}: {e}")
+                    if config.progress_callback:
+                        config.progress_callback(
+                            f"Stream stopped at page {page + 1}/{total_pages}, "
+                            f"results are incomplete: {e}")
+                    search_incomplete = True
+                    break
+
+            if seen_index and not search_incomplete:
+                seen_index.add(seen_links)
+                seen_index.save()
+        finally:
+            self.cleanup()
+
+    def stream_case_links(self, config: SearchConfig, sinks: List[LinkSink]) -> int:
+        """Write streamed case links to every sink; returns the number of links written"""
+        count = 0
+        try:
+            for record in self.iter_case_links(config):
+                for sink in sinks:
+                    sink.write(record)
+                count += 1
+        finally:
+            for sink in sinks:
+                sink.close()
+        return count
+
+    def load_search_results(self, config: SearchConfig):
+        """Open the first search results page, allowing extra time for the initial load"""
+        # Get first page with extended wait for initial load
+        url = self.build_search_url(config)
+
+        if config.progress_callback:
+            config.progress_callback("Starting initial page load...")
+
+        page_load_start = time.time()
+        self.driver.get(url)
+
+        if config.progress_callback:
+            config.progress_callback(
+                "Page requested - waiting for content to load (max 2 minutes)...")
+
+        try:
+            # Wait for page content to be present with 2-minute timeout
+            initial_wait = WebDriverWait(self.driver, 120)  # 2 minutes
+            initial_wait.until(
+                lambda driver: driver.execute_script(
+                    "return document.readyState") == "complete"
+            )
+
+            if config.progress_callback:
+                config.progress_callback(
+                    "Document ready state complete - waiting for search results...")
+
+            # Wait for at least one search result div to be present
+            initial_wait.until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "div.result.no-alt"))
+            )
+
+            page_load_time = time.time() - page_load_start
+            if config.progress_callback:
+                config.progress_callback(
+                    f"Initial page loaded successfully with search results in {page_load_time:.1f} seconds")
+
+        except TimeoutException:
+            page_load_time = time.time() - page_load_start
+            if config.progress_callback:
+                config.progress_callback(
+                    f"Initial page load timeout after {page_load_time:.1f} seconds - search results may not be fully loaded")
+            logging.warning(
+                "Initial page load timeout after 2 minutes - search results may not be available")
+
+        if config.generate_report:
+            self.page_load_times.append(page_load_time)
+
+        # Wait for page content to be fully loaded
+        try:
+            self.wait.until(
+                lambda driver: driver.execute_script(
+                    "return document.readyState") == "complete"
+            )
+            # Wait for search results to be present
+            self.wait.until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "div.result.no-alt"))
+            )
+        except TimeoutException:
+            logging.warning(
+                "Page content may not be fully loaded after timeout")
+
+        # Check for and dismiss any popups on the first page
+        self.dismiss_popup_if_present()
+
+        # Reuse the session cookies for direct HTTP fetching of later pages
+        if config.fetch_mode == "http":
+            self.start_http_client(config)
+
+    def fetch_search_page(self, config: SearchConfig, page: int, driver=None,
+                          wait: Optional[WebDriverWait] = None, want_total: bool = False,
+                          use_http: bool = True) -> SearchPageResult:
+        """Load a single search results page and extract its links"""
+        cached = self.cached_search_page(config, page, want_total)
+        if cached is not None:
+            return cached
+
+        if self.http_client and use_http:
+            result = self.fetch_search_page_http(config, page, want_total)
+            if result is not None:
+                return result
+
+        driver = driver or self.driver
+        wait = wait or self.wait
+        if not self.wait_for_site(config):
+            return SearchPageResult(page=page, links=[], loaded=False)
+
+        url = self.build_search_url(config, page)
+        page_load_start = time.time()
+        try:
+            driver.get(url)
+            loaded = self.wait_for_search_results(wait, page)
+        except Exception:
+            self.record_site_result(False, driver)
+            raise
+        self.record_site_result(loaded, driver)
+        with self.progress_lock:
+            self.search_pages_fetched += 1
+
+        if config.generate_report:
+            self.page_load_times.append(time.time() - page_load_start)
+
+        result = self.extract_search_page(config, page, driver, want_total)
+        result.loaded = loaded
+        return result
+
+    def extract_search_page(self, config: SearchConfig, page: int, driver=None,
+                            want_total: bool = False) -> SearchPageResult:
+        """Extract links (and optionally the page count) from the loaded results page"""
+        driver = driver or self.driver
 
-                if config.headless:
-                    fallback_opts.add_argument('--headless=new')
+        if config.extraction_mode == "script":
+            try:
+                self.dismiss_popup_if_present(driver)
+                payload = json.loads(driver.execute_script(EXTRACT_RESULTS_SCRIPT))
+                result = SearchPageResult(page=page, links=self.filter_links(payload['links']),
+                                          total_pages=payload.get('total') or 1)
+                self.store_search_page(config, result)
+                if not want_total:
+                    result.total_pages = None
+                return result
+            except Exception as e:
+                logging.warning(f"In-browser extraction failed, parsing page source: {e}")
+
+        # Transfer and parse the page source once for all fields
+        try:
+            self.dismiss_popup_if_present(driver)
+            links, total_pages = self.parse_page_html(driver.page_source)
+        except Exception as e:
+            logging.error(f"Error extracting links: {e}")
+            links, total_pages = [], None
+
+        total_pages = (total_pages or 1) if want_total else None
+        result = SearchPageResult(page=page, links=links, total_pages=total_pages)
+        self.store_search_page(config, result)
+        return result
+
+    def scrape_pages_parallel(self, config: SearchConfig, pages: List[int],
+                              seen_links: LinkStore) -> List[str]:
+        """Fetch search result pages concurrently and return their new links in page order"""
+        page_links: Dict[int, List[str]] = {}
+        base_links = LinkStore(self.progress_state.all_links)
+        total_pages = self.progress_state.total_pages
+
+        def handle(driver, wait, page):
+            return self.fetch_search_page(config, page, driver, wait, use_http=False)
+
+        def on_result(page, result):
+            if not result.loaded:
+                # Left out of completed_pages so the retry pass (or a resume) fetches it again
+                return
+            links = result.links
+            with self.progress_lock:
+                page_links[page] = links
+                self.progress_state.completed_pages.append(page)
+                self.progress_state.processed_pages = len(self.progress_state.completed_pages)
+
+                if config.progress_callback:
+                    config.progress_callback(
+                        f"Processed page {page + 1}/{total_pages} "
+                        f"({self.progress_state.processed_pages}/{total_pages} done)")
+
+                # Save progress periodically
+                self.operation_count += 1
+                if self.operation_count % self.save_interval == 0:
+                    checkpoint = base_links.copy()
+                    checkpoint.extend(merge_page_links(page_links, seen_links))
+                    self.progress_state.all_links = checkpoint
+                    self.save_progress_state()
+
+            # Outside the lock so a full download queue only holds back this worker
+            self.publish_links(link for link in links if link not in seen_links)
+
+        failed_pages = []
+
+        # Serve pages from the search cache before fetching anything
+        if self.get_search_cache(config):
+            uncached_pages = []
+            for page in pages:
+                cached = self.cached_search_page(config, page)
+                if cached is None:
+                    uncached_pages.append(page)
                 else:
-                    fallback_opts.add_argument("--start-maximized")
+                    on_result(page, cached)
+            pages = uncached_pages
 
-                if config.download_pdfs and config.download_dir:
-                    fallback_opts.add_experimental_option("prefs", prefs)
+        if self.http_client and pages:
+            # Pull pages over HTTP first; only pages that need rendering go to browsers
+            if config.progress_callback:
+                config.progress_callback(
+                    f"Fetching {len(pages)} pages over HTTP with {config.search_workers} workers...")
+
+            browser_pages = []
+            with ThreadPoolExecutor(max_workers=config.search_workers) as executor:
+                results = executor.map(
+                    lambda page: (page, self.fetch_search_page_http(config, page)), pages)
+                for page, result in results:
+                    if result is None:
+                        browser_pages.append(page)
+                    else:
+                        on_result(page, result)
+            pages = browser_pages
+
+        if pages and not self.cancelled:
+            if config.progress_callback:
+                config.progress_callback(
+                    f"Fetching {len(pages)} pages with {config.search_workers} browser workers...")
 
-                self.driver = webdriver.Chrome(options=fallback_opts)
+            pool = BrowserPool(self, config, config.search_workers, shared_driver=self.driver)
+            _, failed_pages = pool.run(pages, handle, on_result,
+                                       succeeded=lambda result: result.loaded,
+                                       retry_unsuccessful=True)
 
-            # Set timeouts
-            self.driver.set_page_load_timeout(DEFAULT_PAGE_LOAD_TIMEOUT)
-            self.wait = WebDriverWait(self.driver, config.wait_time)
-            self.browser_start_time = datetime.now()
-            return True
+        # Give pages the pool gave up on one more pass on the main browser
+        if failed_pages and not self.cancelled:
+            if config.progress_callback:
+                config.progress_callback(f"Retrying {len(failed_pages)} failed pages...")
+            retry_pages, failed_pages = sorted(failed_pages), []
+            for page in retry_pages:
+                if self.cancelled:
+                    failed_pages.append(page)
+                    continue
+                try:
+                    result = self.fetch_search_page(config, page, use_http=False)
+                except Exception as e:
+                    logging.warning(f"Retry of page {page + 1} failed: {e}")
+                    failed_pages.append(page)
+                    continue
+                if not result.loaded:
+                    logging.warning(f"Retry of page {page + 1} timed out")
+                    failed_pages.append(page)
+                    continue
+                on_result(page, result)
 
-        except Exception as e:
-            error_msg = f"Failed to initialize Chrome driver: {e}"
-            logging.error(error_msg)
-            self.log_error("BROWSER_INIT_ERROR", str(
-                e), f"Headless: {config.headless}")
-            return False
+        # Unfetched pages stay out of completed_pages, so a resume fetches them
+        self.failed_search_pages = sorted(failed_pages)
+        if failed_pages:
+            logging.warning(f"Failed to fetch pages: {[p + 1 for p in self.failed_search_pages]}")
+            if config.progress_callback:
+                config.progress_callback(
+                    f"{len(failed_pages)} pages could not be fetched and will be retried on resume")
 
-    def filter_links(self, links: List[str]) -> List[str]:
-        """Filter out unwanted links based on excluded patterns and remove query parameters"""
-        filtered_links = []
-        for link in links:
-            if link and not any(re.search(pat, link) for pat in EXCLUDED_PATTERNS):
-                # Remove query parameters (everything after ?)
-                clean_link = link.split('?')[0]
-                filtered_links.append(clean_link)
-        return filtered_links
+        new_links = merge_page_links(page_links, seen_links)
+        seen_links.update(new_links)
+        return new_links
 
-    def dismiss_popup_if_present(self):
-        """Check for and dismiss the 'No Thanks' popup if it exists"""
+    def timed_wait(self, step: str, condition: Callable, driver=None,
+                   timeout: float = STEP_WAIT_TIMEOUT):
+        """Wait for a condition with fast polling and record how long the step took"""
+        driver = driver or self.driver
+        start = time.time()
         try:
-            # Look for the "No Thanks" link popup
-            no_thanks_link = self.driver.find_element(
-                By.CSS_SELECTOR, 'a.link-no-underline[href="#"]')
-            if no_thanks_link and no_thanks_link.text.strip() == "No Thanks":
-                logging.info("Found 'No Thanks' popup, dismissing it")
-                no_thanks_link.click()
-                time.sleep(1)  # Wait for popup to close
-                return True
-        except NoSuchElementException:
-            # No popup found, which is normal
-            pass
-        except Exception as e:
-            logging.warning(f"Error checking for popup: {e}")
-        return False
+            return WebDriverWait(driver, timeout, poll_frequency=STEP_POLL_INTERVAL).until(condition)
+        finally:
+            self.wait_step_times.setdefault(step, []).append(time.time() - start)
 
-    def extract_links_from_page(self) -> List[str]:
-        """Extract case links from current page"""
-        try:
-            # First, check for and dismiss any popups
-            self.dismiss_popup_if_present()
+    def scroll_into_view(self, element, step: str, driver=None):
+        """Scroll an element to the centre of the viewport and wait until it stops moving"""
+        driver = driver or self.driver
+        driver.execute_script(
+            "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", element)
 
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            raw_links = [
-                a.get('href') for a in soup.find_all('a', class_='gwt-Hyperlink alcina-NoHistory')
-                if a.get('href')
-            ]
-            return self.filter_links(raw_links)
-        except Exception as e:
-            logging.error(f"Error extracting links: {e}")
-            return []
+        last_top = [None]
+
+        def scroll_settled(d):
+            top = d.execute_script(
+                "return arguments[0].getBoundingClientRect().top;", element)
+            settled = last_top[0] is not None and abs(top - last_top[0]) < 1
+            last_top[0] = top
+            return settled
 
-    def get_total_pages(self) -> int:
-        """Extract total number of pages from search results"""
         try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            text = soup.get_text()
-            match = re.search(r"You are on page \d+ of (\d+)", text)
-            return int(match.group(1)) if match else 1
-        except Exception as e:
-            logging.error(f"Error getting total pages: {e}")
-            return 1
+            self.timed_wait(step, scroll_settled, driver)
+        except TimeoutException:
+            logging.debug(f"Scroll did not settle for step {step}")
 
-    def download_pdf(self, link: str, config: SearchConfig, index: int = 0, total: int = 0) -> Tuple[bool, str]:
+    def find_existing_download(self, config: SearchConfig, url_number: Optional[str]) -> Optional[str]:
+        """Return the saved PDF for a case when skip_existing is on, linking it from the
+        shared store if another query already fetched it"""
+        if not (config.skip_existing and url_number):
+            return None
+        download_index = self.get_download_index(config.download_dir)
+        pdf_store = self.get_pdf_store(config)
+        existing_file = download_index.lookup(url_number) if download_index else None
+        if existing_file and pdf_store and url_number not in pdf_store.entries:
+            # Files saved before the store existed are shared on first sight
+            pdf_store.add(url_number, existing_file, download_index.entry(url_number))
+        elif not existing_file and pdf_store and download_index:
+            # Another query already fetched this case
+            existing_file = self.link_from_store(pdf_store, url_number, config.download_dir)
+        return existing_file
+
+    def download_pdf(self, link: str, config: SearchConfig, index: int = 0, total: int = 0,
+                     driver=None, wait: Optional[WebDriverWait] = None,
+                     staging_dir: Optional[str] = None) -> Tuple[bool, str]:
         """Download PDF for a single case with timing"""
+        driver = driver or self.driver
+        wait = wait or self.wait
         full_url = link if link.startswith(
             'http') else f"https://jade.io{link}"
 
         # Extract number from URL for filename prefix
         url_number = self.extract_number_from_url(full_url)
 
+        # Skip cases whose PDF is already saved and intact
+        existing_file = self.find_existing_download(config, url_number)
+        if existing_file:
+            if config.progress_callback:
+                config.progress_callback(
+                    f"Skipped {index}/{total} - already downloaded - {full_url}")
+            logging.info(f"Skipped {full_url}, already saved as {existing_file}")
+            return True, "Skipped (already downloaded)"
+
+        # Hold off while the site is down instead of timing out case after case
+        if not self.wait_for_site(config):
+            return False, "Cancelled by user"
+
         # Start timing for this download
         download_timer = TimingInfo(datetime.now())
 
+        # Fast path: stream the PDF endpoint directly once its URL pattern is known
+        if config.pdf_download_mode == "direct" and url_number and self.pdf_url_template:
+            try:
+                saved_file = self.download_pdf_direct(url_number, config.download_dir, driver)
+            except HttpStatusError as e:
+                download_timer.end_time = datetime.now()
+                self.download_times.append(download_timer.elapsed.total_seconds())
+                with self.progress_lock:
+                    self.download_http_statuses[link] = e.status
+                if config.progress_callback:
+                    config.progress_callback(
+                        f"Failed {index}/{total} - HTTP {e.status} - {full_url}")
+                logging.warning(f"Could not download PDF from {full_url}: {e}")
+                # A missing case still means the site is up; throttling counts against it
+                self.record_site_result(e.status not in THROTTLED_HTTP_STATUSES, driver)
+                return False, f"Failed ({download_timer.elapsed_str}): {e}"
+            if saved_file:
+                self.validate_download(link, url_number, saved_file)
+                download_timer.end_time = datetime.now()
+                self.download_times.append(download_timer.elapsed.total_seconds())
+                if config.progress_callback:
+                    config.progress_callback(
+                        f"Downloaded {index}/{total} - {download_timer.elapsed_str} - {full_url}")
+                logging.info(
+                    f"Downloaded PDF directly ({download_timer.elapsed_str}): {full_url}")
+                with self.progress_lock:
+                    self.pdfs_downloaded += 1
+                self.record_site_result(True, driver)
+                return True, f"Success ({download_timer.elapsed_str})"
+
         try:
-            # Get list of files before download to identify new file
+            # Pool workers watch their own staging folder so they never see each other's files
             download_dir = config.download_dir
-            files_before = set(os.listdir(download_dir)) if os.path.exists(
-                download_dir) else set()
+            watch_dir = staging_dir or download_dir
 
             page_load_start = time.time()
-            self.driver.get(full_url)
+            driver.get(full_url)
 
             # Wait for page content to be fully loaded
             try:
-                self.wait.until(
-                    lambda driver: driver.execute_script(
+                wait.until(
+                    lambda d: d.execute_script(
                         "return document.readyState") == "complete"
                 )
             except TimeoutException:
@@ -722,52 +3451,69 @@ class JadeScraper:
             self.page_load_times.append(page_load_time)
 
             # Check for and dismiss any popups before attempting download
-            self.dismiss_popup_if_present()
+            self.dismiss_popup_if_present(driver)
 
             # Wait for and find the Print and Export tab with improved error handling
             tab_xpath = "//button[@role='tab'][.//img[@title='Print and Export']]"
-            tab = self.wait.until(
+            tab = wait.until(
                 EC.presence_of_element_located((By.XPATH, tab_xpath))
             )
 
             # Scroll to the tab element to ensure it's visible
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", tab)
-            time.sleep(1)  # Allow scroll to complete
+            self.scroll_into_view(tab, "tab_scroll", driver)
 
             # Check if element is visible and clickable
-            if not self._is_element_visible_and_clickable(tab):
+            if not self._is_element_visible_and_clickable(tab, driver):
                 raise WebDriverException(
                     "Print and Export tab is not visible or clickable after scrolling")
 
             # Use JavaScript click to bypass UI overlays
-            self.driver.execute_script("arguments[0].click();", tab)
-            time.sleep(2)  # Allow tab to activate
+            driver.execute_script("arguments[0].click();", tab)
 
-            # Wait for and find the PDF download button
+            # Wait for the tab panel to become active
             pdf_button_selector = 'a.button-grey.b-pdf'
-            pdf_button = self.wait.until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, pdf_button_selector))
-            )
+            try:
+                self.timed_wait(
+                    "tab_activate",
+                    lambda d: tab.get_attribute("aria-selected") == "true" or
+                    d.find_elements(By.CSS_SELECTOR, pdf_button_selector), driver)
+            except TimeoutException:
+                logging.debug("Print and Export tab did not report as selected")
+
+            # Wait for the PDF download button to be attached and interactable
+            pdf_button = self.timed_wait(
+                "pdf_button",
+                EC.element_to_be_clickable((By.CSS_SELECTOR, pdf_button_selector)),
+                driver, timeout=config.wait_time)
 
             # Scroll to the PDF button
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", pdf_button)
-            time.sleep(1)  # Allow scroll to complete
+            self.scroll_into_view(pdf_button, "pdf_button_scroll", driver)
 
             # Check if PDF button is visible and clickable
-            if not self._is_element_visible_and_clickable(pdf_button):
+            if not self._is_element_visible_and_clickable(pdf_button, driver):
                 raise WebDriverException(
                     "PDF download button is not visible or clickable after scrolling")
 
+            # Remember where the button points so later cases can skip the UI
+            if config.pdf_download_mode == "direct" and url_number and not self.pdf_url_template:
+                self.learn_pdf_url_template(pdf_button.get_attribute("href"), url_number)
+
+            # Arm download tracking before the click so no event is missed
+            os.makedirs(watch_dir, exist_ok=True)
+            watcher = DownloadWatcher(driver, watch_dir).start()
+
             # Use JavaScript click for PDF button as well
-            self.driver.execute_script("arguments[0].click();", pdf_button)
+            driver.execute_script("arguments[0].click();", pdf_button)
 
             # Wait for download to complete and rename file
             if url_number:
-                self.wait_and_rename_downloaded_file(
-                    download_dir, files_before, url_number)
+                saved_file = self.wait_and_rename_downloaded_file(watcher, url_number, download_dir)
+                if not saved_file:
+                    raise TimeoutException(
+                        f"No PDF download completed within {DOWNLOAD_WAIT_TIMEOUT} seconds")
+                self.validate_download(link, url_number, saved_file)
+            else:
+                watcher.close()
 
             # End timing
             download_timer.end_time = datetime.now()
@@ -780,6 +3526,9 @@ class JadeScraper:
 
             logging.info(
                 f"Downloaded PDF ({download_timer.elapsed_str}): {full_url}")
+            with self.progress_lock:
+                self.pdfs_downloaded += 1
+            self.record_site_result(True, driver)
             return True, f"Success ({download_timer.elapsed_str})"
 
         except (TimeoutException, NoSuchElementException, WebDriverException) as e:
@@ -797,6 +3546,7 @@ class JadeScraper:
 
             logging.warning(
                 f"Could not download PDF ({download_timer.elapsed_str}) from {full_url}: {e}")
+            self.record_site_result(False, driver)
             return False, error_msg
 
     def scrape_case_links(self, config: SearchConfig) -> Tuple[List[str], List[str]]:
@@ -809,6 +3559,7 @@ class JadeScraper:
             self.report_data = ReportData(total_time=timedelta())
             self.page_load_times = []
             self.download_times = []
+            self.wait_step_times = {}
 
         # Start total timer
         self.total_timer = TimingInfo(datetime.now())
@@ -821,6 +3572,9 @@ class JadeScraper:
                     config.progress_callback("Found existing progress - resuming from save point...")
                 return self.resume_scraping(config, progress_state)
 
+        if config.fetch_mode == "async":
+            return asyncio.run(self.scrape_case_links_async(config))
+
         if not self.setup_driver(config):
             error_msg = "Failed to initialize browser"
             error_report_file = self.generate_error_report(
@@ -830,9 +3584,26 @@ class JadeScraper:
                     f"Error report generated: {error_report_file}")
             return [], [error_msg]
 
-        all_links = []
+        # The link store doubles as the seen-set for deduplication
+        all_links = LinkStore()
         failed_downloads = []
-        seen_links: Set[str] = set()
+        seen_links = all_links
+
+        # Incremental runs also treat cases returned by earlier runs as seen
+        seen_index = SeenCaseIndex.for_config(config) if config.incremental else None
+        if seen_index:
+            seen_links = seen_index.links.copy()
+            if config.progress_callback:
+                config.progress_callback(
+                    f"Incremental mode: {len(seen_index)} cases known from earlier runs")
+
+        # Results are newest first unless a date range is set, so the first
+        # page of already-known cases marks the end of anything new
+        stop_at_known = seen_index is not None and not (config.start_date and config.end_date)
+        search_incomplete = False
+        self.failed_search_pages = []
+        self.failed_subqueries = []
+        self.search_pages_fetched = 0
         
         # Initialize progress state for new operation
         self.progress_state = ProgressState(
@@ -858,314 +3629,724 @@ class JadeScraper:
             if self.cancelled:
                 return [], ["Operation cancelled by user"]
 
-            # Get first page with extended wait for initial load
-            url = self.build_search_url(config)
+            # A cached first page lets a rerun skip the initial browser load entirely
+            first_page = self.cached_search_page(config, 0, want_total=True)
+            if first_page is None:
+                self.load_search_results(config)
+
+                # Extract links and total pages for pagination from the first page
+                first_page = self.extract_search_page(config, 0, want_total=True)
+                self.search_pages_fetched += 1
+            elif config.fetch_mode == "http":
+                self.start_http_client(config)
+            links = [link for link in first_page.links if link not in seen_links]
+            all_links.extend(links)
+            seen_links.update(links)
+
+            total_pages = first_page.total_pages
+            logging.info(f"Found {total_pages} pages of results")
 
             if config.progress_callback:
-                config.progress_callback("Starting initial page load...")
+                config.progress_callback(
+                    f"Found {total_pages} pages to process...")
 
-            page_load_start = time.time()
-            self.driver.get(url)
+            # Record the first page as completed
+            self.progress_state.all_links = all_links
+            self.progress_state.total_pages = total_pages
+            self.progress_state.processed_pages = 1
+            self.progress_state.completed_pages = [0]
+
+            # Start downloading while the remaining pages are fetched
+            if config.pipeline_downloads and config.download_pdfs and config.download_dir:
+                self.download_pipeline = DownloadPipeline(self, config, config.pipeline_queue_size)
+                self.download_pipeline.start()
+                self.progress_state.current_phase = 'search+download'
+                if config.progress_callback:
+                    config.progress_callback("Downloading links while the search continues...")
+                self.publish_links(links)
+
+            if stop_at_known and not links:
+                logging.info("First page has only previously seen cases, skipping pagination")
+                if config.progress_callback:
+                    config.progress_callback("No new cases since the last run")
+            elif stop_at_known:
+                # Walk pages in order so the search can stop at the first known page
+                search_incomplete = self.scrape_pages_sequential(
+                    config, total_pages, all_links, seen_links, stop_at_known)
+            elif config.fan_out_courts and expand_court_filter(config.court_name):
+                # Query each child court separately and merge with cross-court deduplication
+                all_links.extend(self.scrape_court_fan_out(config, seen_links))
+                self.progress_state.all_links = all_links
+                search_incomplete = self.search_has_gaps()
+            elif config.shard_max_pages and total_pages > config.shard_max_pages:
+                # Split the query into date windows that paginate concurrently
+                all_links.extend(self.scrape_date_shards(
+                    config, seen_links, SearchPageResult(0, links, total_pages)))
+                self.progress_state.all_links = all_links
+                search_incomplete = self.search_has_gaps()
+            elif config.search_workers > 1 and total_pages > 1:
+                # Fetch the remaining pages concurrently with a browser pool
+                all_links.extend(self.scrape_pages_parallel(
+                    config, list(range(1, total_pages)), seen_links))
+                self.progress_state.all_links = all_links
+                search_incomplete = bool(self.failed_search_pages)
+            else:
+                search_incomplete = self.scrape_pages_sequential(
+                    config, total_pages, all_links, seen_links)
+
+            if self.cancelled:
+                if config.progress_callback:
+                    config.progress_callback(
+                        "Operation cancelled by user")
+                return list(all_links), ["Operation cancelled by user"]
+
+            # End search timer
+            self.search_timer.end_time = datetime.now()
+            if not self.download_pipeline:
+                # Pipelined downloads share the clock, which would inflate page timings;
+                # cached pages cost almost nothing, so only fetched pages are counted
+                self.timing_history.record_search(
+                    self.search_pages_fetched,
+                    self.search_timer.elapsed.total_seconds(), config.search_workers)
+
+            # Remember this run's cases unless pages were skipped after an error
+            if seen_index:
+                if search_incomplete:
+                    logging.warning("Search was cut short, seen-case index not updated")
+                else:
+                    seen_index.add(all_links)
+                    seen_index.save()
+                if config.progress_callback:
+                    config.progress_callback(f"Incremental mode: {len(all_links)} new cases")
+            
+            # Update progress state - search phase completed unless pages are left to resume
+            self.progress_state.search_completed = not self.search_has_gaps()
+            self.progress_state.all_links = all_links
+            if self.progress_state.search_completed:
+                self.progress_state.current_phase = 'download' if config.download_pdfs else 'completed'
+            self.save_progress_state()
 
             if config.progress_callback:
                 config.progress_callback(
-                    "Page requested - waiting for content to load (max 2 minutes)...")
+                    f"Search completed in {self.search_timer.elapsed_str} - Found {len(all_links)} links")
 
-            try:
-                # Wait for page content to be present with 2-minute timeout
-                initial_wait = WebDriverWait(self.driver, 120)  # 2 minutes
-                initial_wait.until(
-                    lambda driver: driver.execute_script(
-                        "return document.readyState") == "complete"
-                )
+            # Download PDFs if requested
+            if self.download_pipeline:
+                failed_downloads = self.finish_pipelined_downloads(config, all_links)
+            elif config.download_pdfs and config.download_dir:
+                download_start = time.time()
+                self.pdfs_downloaded = 0
+                failed_downloads = self.download_links(config, all_links)
+                if not self.cancelled:
+                    # Skipped and failed links are not downloads; their time still counts
+                    self.timing_history.record_downloads(
+                        self.pdfs_downloaded, time.time() - download_start)
+            self.timing_history.save()
 
+        except TimeoutException:
+            error_msg = "Page timed out"
+            self.log_error("TIMEOUT_ERROR", error_msg,
+                           f"Query: {config.query}")
+            error_report_file = self.generate_error_report(
+                config, "TIMEOUT_ERROR", error_msg, f"Query: {config.query}")
+            if config.progress_callback and error_report_file:
+                config.progress_callback(
+                    f"Error report generated: {error_report_file}")
+            return [], [error_msg]
+        except Exception as e:
+            error_msg = f"Unexpected error during scraping: {e}"
+            logging.error(error_msg)
+            self.log_error("SCRAPING_ERROR", str(e), f"Query: {config.query}")
+            error_report_file = self.generate_error_report(
+                config, "SCRAPING_ERROR", str(e), f"Query: {config.query}")
+            if config.progress_callback and error_report_file:
+                config.progress_callback(
+                    f"Error report generated: {error_report_file}")
+            return [], ["Scraper stopped abruptly"]
+        finally:
+            # End total timer and generate report if requested
+            if self.total_timer:
+                self.total_timer.end_time = datetime.now()
                 if config.progress_callback:
                     config.progress_callback(
-                        "Document ready state complete - waiting for search results...")
+                        f"Total operation completed in {self.total_timer.elapsed_str}")
 
-                # Wait for at least one search result div to be present
-                initial_wait.until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, "div.result.no-alt"))
-                )
+                # Generate report if requested
+                if config.generate_report:
+                    self.generate_performance_report(
+                        config, all_links, failed_downloads)
+
+            # Stop the download worker if the search ended early
+            if self.download_pipeline:
+                self.download_pipeline.stop()
+                self.download_pipeline = None
+
+            # Clean up progress file on successful completion; keep it while pages are pending
+            if not self.search_has_gaps():
+                self.cleanup_progress_file()
+            self.cleanup()
+
+        # Convert relative links to absolute URLs
+        absolute_links = [
+            link if link.startswith('http') else f"https://jade.io{link}"
+            for link in all_links
+        ]
+
+        return absolute_links, failed_downloads
+
+    def search_has_gaps(self) -> bool:
+        """True if the last search left pages or sub-queries unfetched, to be picked up on resume"""
+        return bool(self.failed_search_pages or self.failed_subqueries)
+
+    def scrape_pages_sequential(self, config: SearchConfig, total_pages: int, all_links: LinkStore,
+                                seen_links: LinkStore, stop_at_known: bool = False) -> bool:
+        """Fetch the remaining pages one at a time; returns True if pagination was cut short"""
+        # Process remaining pages one at a time
+        for page in range(1, total_pages):
+            try:
+                # Check for cancellation
+                if self.cancelled:
+                    return True
+
+                # Check if browser needs restart
+                if self.should_restart_browser(config):
+                    if not self.restart_browser(config):
+                        logging.error(
+                            "Failed to restart browser, stopping pagination")
+                        return True
 
-                page_load_time = time.time() - page_load_start
                 if config.progress_callback:
+                    elapsed = TimingInfo(
+                        self.search_timer.start_time).elapsed_str
                     config.progress_callback(
-                        f"Initial page loaded successfully with search results in {page_load_time:.1f} seconds")
+                        f"Processing page {page + 1}/{total_pages} - {elapsed} elapsed")
+
+                result = self.fetch_search_page(config, page)
+                if not result.loaded:
+                    # An empty timed-out page is not the end of the results; try once more
+                    logging.warning(f"Page {page + 1} timed out, retrying it")
+                    result = self.fetch_search_page(config, page)
+                if not result.loaded:
+                    logging.warning(f"Page {page + 1} did not load, stopping pagination")
+                    if config.progress_callback:
+                        config.progress_callback(
+                            f"Page {page + 1} did not load - search is incomplete")
+                    self.save_progress_state()
+                    return True
 
-            except TimeoutException:
-                page_load_time = time.time() - page_load_start
+                fresh_links = [
+                    link for link in result.links if link not in all_links]
+
+                if not fresh_links:
+                    logging.info(
+                        f"No new links found on page {page + 1}, stopping pagination")
+                    break
+
+                # In incremental mode seen_links also holds cases from earlier runs
+                new_links = [
+                    link for link in fresh_links if link not in seen_links]
+
+                if stop_at_known and not new_links:
+                    logging.info(
+                        f"Page {page + 1} has only previously seen cases, stopping pagination")
+                    break
+
+                all_links.extend(new_links)
+                seen_links.update(new_links)
+                self.publish_links(new_links)
+            
+                # Update progress state
+                self.progress_state.all_links = all_links
+                self.progress_state.processed_pages = page + 1
+                self.progress_state.completed_pages.append(page)
+            
+                # Save progress periodically
+                self.operation_count += 1
+                if self.operation_count % self.save_interval == 0:
+                    self.save_progress_state()
+                    if config.progress_callback:
+                        config.progress_callback(f"Progress saved (page {page + 1})")
+
+                logging.info(
+                    f"Processed page {page + 1}/{total_pages}, found {len(new_links)} new links")
+
+            except Exception as e:
+                logging.warning(f"Error processing page {page + 1}: {e}")
+                # Save progress before breaking
+                self.save_progress_state()
+                return True
+
+        return False
+
+    def plan_crawl(self, configs: List[SearchConfig],
+                   max_job_hours: Optional[float] = None) -> Dict:
+        """Load only the first result page of each job and estimate the cost of crawling it"""
+        self.cancelled = False
+        if not configs:
+            return {'jobs': []}
+
+        # Parent court entries are planned per child court when fan-out is enabled
+        jobs: List[SearchConfig] = []
+        for config in configs:
+            courts = expand_court_filter(config.court_name) if config.fan_out_courts else []
+            if courts:
+                jobs.extend(replace(config, court_name=court, fan_out_courts=False) for court in courts)
+            else:
+                jobs.append(config)
+
+        if not self.setup_driver(replace(configs[0], download_pdfs=False)):
+            raise RuntimeError("Failed to initialize browser")
+
+        history = self.timing_history
+        planned: List[CrawlPlanJob] = []
+        try:
+            for index, config in enumerate(jobs, 1):
+                if self.cancelled:
+                    break
+
+                job = CrawlPlanJob(query=config.query, court_name=config.court_name,
+                                   start_date=config.start_date, end_date=config.end_date)
                 if config.progress_callback:
                     config.progress_callback(
-                        f"Initial page load timeout after {page_load_time:.1f} seconds - search results may not be fully loaded")
-                logging.warning(
-                    "Initial page load timeout after 2 minutes - search results may not be available")
+                        f"Planning {index}/{len(jobs)}: {config.court_name or 'All Courts'}")
 
-            if config.generate_report:
-                self.page_load_times.append(page_load_time)
+                try:
+                    first_page = self.cached_search_page(config, 0, want_total=True)
+                    if first_page is None:
+                        self.driver.get(self.build_search_url(config))
+                        self.wait_for_search_results(self.wait)
+                        first_page = self.extract_search_page(config, 0, want_total=True)
+
+                    job.links_on_first_page = len(first_page.links)
+                    job.total_pages = first_page.total_pages if first_page.links else 0
+                    job.estimated_links = job.links_on_first_page * job.total_pages
+                    job.estimated_search_seconds = round(
+                        job.total_pages * history.page_seconds / max(1, config.search_workers), 1)
+                    if config.download_pdfs:
+                        job.estimated_download_seconds = round(
+                            job.estimated_links * history.seconds_per_download, 1)
+                    job.estimated_total_seconds = round(
+                        job.estimated_search_seconds + job.estimated_download_seconds, 1)
+                    job.over_budget = bool(max_job_hours) and \
+                        job.estimated_total_seconds > max_job_hours * 3600
+                except Exception as e:
+                    logging.warning(f"Could not plan {config.query} ({config.court_name}): {e}")
+                    job.error = str(e)
 
-            # Wait for page content to be fully loaded
-            try:
-                self.wait.until(
-                    lambda driver: driver.execute_script(
-                        "return document.readyState") == "complete"
-                )
-                # Wait for search results to be present
-                self.wait.until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, "div.result.no-alt"))
-                )
-            except TimeoutException:
-                logging.warning(
-                    "Page content may not be fully loaded after timeout")
+                planned.append(job)
+        finally:
+            self.cleanup()
 
-            # Check for and dismiss any popups on the first page
-            self.dismiss_popup_if_present()
+        return {
+            'generated': datetime.now().isoformat(),
+            'timing_basis': {
+                'page_seconds': round(history.page_seconds, 2),
+                'download_seconds': round(history.seconds_per_download, 2),
+                'measured_pages': history.search_pages,
+                'measured_downloads': history.downloads
+            },
+            'max_job_hours': max_job_hours,
+            'total_pages': sum(job.total_pages for job in planned),
+            'estimated_links': sum(job.estimated_links for job in planned),
+            'estimated_total_seconds': round(sum(job.estimated_total_seconds for job in planned), 1),
+            # Cheapest first, so small jobs can be batched ahead of the long ones
+            'jobs': [asdict(job) for job in sorted(planned, key=lambda job: job.estimated_total_seconds)]
+        }
 
-            # Extract links from first page
-            links = self.extract_links_from_page()
-            all_links.extend(links)
-            seen_links.update(links)
+    def export_crawl_plan(self, plan: Dict, filename: Optional[str] = None) -> str:
+        """Write a crawl plan to a JSON file and return its name"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"jade_scraper_plan_{timestamp}.json"
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, indent=2)
+        logging.info(f"Crawl plan saved to {filename}")
+        return filename
+
+    def plan_date_shards(self, config: SearchConfig,
+                         whole_query: Optional[SearchPageResult] = None) -> List[Tuple[SearchConfig, SearchPageResult]]:
+        """Bisect the query's date range until every window fits within shard_max_pages"""
+        start = datetime.strptime(
+            config.start_date or SHARD_EARLIEST_DATE, "%Y-%m-%d").date()
+        end = datetime.strptime(config.end_date, "%Y-%m-%d").date() \
+            if config.end_date else date.today()
+
+        # The whole-query probe only matches the first window if it used the same dates
+        if not (config.start_date and config.end_date):
+            whole_query = None
+
+        pending = [(start, end, whole_query)]
+        shards = []
+        probes = 0
+
+        while pending and not self.cancelled:
+            window_start, window_end, probe = pending.pop()
+            shard_config = replace(
+                config,
+                start_date=window_start.isoformat(),
+                end_date=window_end.isoformat(),
+                shard_max_pages=0
+            )
 
-            # Get total pages for pagination
-            total_pages = self.get_total_pages()
-            logging.info(f"Found {total_pages} pages of results")
+            if probe is None:
+                probe = self.fetch_search_page(shard_config, 0, want_total=True)
+                probes += 1
+                if not probe.loaded:
+                    # A timed-out probe looks like an empty window; give it one more try
+                    probe = self.fetch_search_page(shard_config, 0, want_total=True)
+                    probes += 1
+                if not probe.loaded:
+                    label = self.describe_subquery(shard_config)
+                    logging.warning(f"Could not load first page for {label}")
+                    if config.progress_callback:
+                        config.progress_callback(f"Skipping {label} - first page failed to load")
+                    self.failed_subqueries.append(label)
+                    continue
 
-            if config.progress_callback:
-                config.progress_callback(
-                    f"Found {total_pages} pages to process...")
+            if probe.total_pages <= config.shard_max_pages or window_start >= window_end:
+                # Empty windows are dropped from the plan
+                if probe.links:
+                    shards.append((shard_config, probe))
+                continue
+
+            middle = window_start + (window_end - window_start) // 2
+            pending.append((window_start, middle, None))
+            pending.append((middle + timedelta(days=1), window_end, None))
+
+        # Newest window first, matching the default result ordering
+        shards.sort(key=lambda shard: shard[0].start_date, reverse=True)
+
+        logging.info(
+            f"Planned {len(shards)} date shards with {probes} probe requests")
+        if config.progress_callback:
+            total = sum(probe.total_pages for _, probe in shards)
+            config.progress_callback(
+                f"Split query into {len(shards)} date windows ({total} pages in total)")
+        return shards
+
+    @staticmethod
+    def describe_subquery(config: SearchConfig) -> str:
+        """Name a court or date-window sub-query for log and progress messages"""
+        label = config.court_name or "All Courts"
+        if config.start_date:
+            label += f" {config.start_date} to {config.end_date}"
+        return label
+
+    def scrape_subqueries(self, config: SearchConfig,
+                          subqueries: List[Tuple[SearchConfig, SearchPageResult]],
+                          seen_links: LinkStore) -> List[str]:
+        """Fetch the remaining pages of probed sub-queries concurrently and merge their new links"""
+        page_links: Dict[Tuple[int, int], List[str]] = {}
+        jobs = []
+        for index, (sub_config, first_page) in enumerate(subqueries):
+            page_links[(index, 0)] = first_page.links
+            jobs.extend((index, page) for page in range(1, first_page.total_pages or 1))
+            self.publish_links(link for link in first_page.links if link not in seen_links)
+
+        total_jobs = len(jobs)
+
+        def handle(driver, wait, job):
+            index, page = job
+            return self.fetch_search_page(subqueries[index][0], page, driver, wait)
+
+        def on_result(job, result):
+            links = result.links
+            with self.progress_lock:
+                page_links[job] = links
+                self.operation_count += 1
+                if config.progress_callback:
+                    config.progress_callback(
+                        f"Processed {len(page_links) - len(subqueries)}/{total_jobs} sub-query pages")
 
-            # Process remaining pages
-            for page in range(1, total_pages):
-                try:
-                    # Check for cancellation
-                    if self.cancelled:
-                        if config.progress_callback:
-                            config.progress_callback(
-                                "Operation cancelled by user")
-                        return all_links, ["Operation cancelled by user"]
+            self.publish_links(link for link in links if link not in seen_links)
 
-                    # Check if browser needs restart
-                    if self.should_restart_browser():
-                        if not self.restart_browser(config):
-                            logging.error(
-                                "Failed to restart browser, stopping pagination")
-                            break
+        if jobs:
+            pool = BrowserPool(self, config, config.search_workers, shared_driver=self.driver)
+            _, failed_jobs = pool.run(jobs, handle, on_result,
+                                      succeeded=lambda result: result.loaded,
+                                      retry_unsuccessful=True)
 
+            # Give the sub-queries that timed out a second pass on their own
+            if failed_jobs and not self.cancelled:
+                if config.progress_callback:
+                    config.progress_callback(
+                        f"Retrying {len(failed_jobs)} failed sub-query pages...")
+                _, failed_jobs = pool.run(failed_jobs, handle, on_result,
+                                          succeeded=lambda result: result.loaded,
+                                          retry_unsuccessful=True)
+
+            if failed_jobs:
+                failed_by_query: Dict[int, int] = {}
+                for index, _ in failed_jobs:
+                    failed_by_query[index] = failed_by_query.get(index, 0) + 1
+                for index, count in failed_by_query.items():
+                    label = self.describe_subquery(subqueries[index][0])
+                    self.failed_subqueries.append(label)
+                    logging.warning(f"Failed to fetch {count} pages for {label}")
                     if config.progress_callback:
-                        elapsed = TimingInfo(
-                            self.search_timer.start_time).elapsed_str
                         config.progress_callback(
-                            f"Processing page {page + 1}/{total_pages} - {elapsed} elapsed")
+                            f"{count} pages could not be fetched for {label}")
+
+        new_links = merge_page_links(page_links, seen_links)
+        seen_links.update(new_links)
+        return new_links
+
+    def scrape_date_shards(self, config: SearchConfig, seen_links: LinkStore,
+                           whole_query: Optional[SearchPageResult] = None) -> List[str]:
+        """Split a large query into date windows and scrape them concurrently"""
+        if config.progress_callback:
+            config.progress_callback(
+                f"Planning date shards of at most {config.shard_max_pages} pages...")
+
+        shards = self.plan_date_shards(config, whole_query)
+        return self.scrape_subqueries(config, shards, seen_links)
+
+    def scrape_court_fan_out(self, config: SearchConfig, seen_links: LinkStore) -> List[str]:
+        """Run a parent court entry as one sub-query per child court and merge the links"""
+        courts = expand_court_filter(config.court_name)
+        sub_configs = [
+            replace(config, court_name=court, fan_out_courts=False) for court in courts]
+
+        if config.progress_callback:
+            config.progress_callback(
+                f"Fanning out over {len(courts)} courts with {config.search_workers} workers...")
+
+        # Probe every court's first page concurrently to learn its size
+        def probe(driver, wait, index):
+            return self.fetch_search_page(sub_configs[index], 0, driver, wait, want_total=True)
+
+        pool = BrowserPool(self, config, config.search_workers, shared_driver=self.driver)
+        probes, failed_probes = pool.run(list(range(len(sub_configs))), probe,
+                                         succeeded=lambda result: result.loaded,
+                                         retry_unsuccessful=True)
+
+        # Courts that timed out or errored get one more pass on their own
+        if failed_probes and not self.cancelled:
+            if config.progress_callback:
+                config.progress_callback(f"Retrying {len(failed_probes)} courts that failed to load...")
+            retried, failed_probes = pool.run(failed_probes, probe,
+                                              succeeded=lambda result: result.loaded,
+                                              retry_unsuccessful=True)
+            probes.update(retried)
+
+        for index in failed_probes:
+            logging.warning(f"Could not load first page for {courts[index]}")
+            if config.progress_callback:
+                config.progress_callback(f"Skipping {courts[index]} - first page failed to load")
+            self.failed_subqueries.append(self.describe_subquery(sub_configs[index]))
+
+        subqueries = []
+        for index in sorted(probes):
+            first_page = probes[index]
+            if not first_page.links:
+                continue
+            if config.shard_max_pages and first_page.total_pages > config.shard_max_pages:
+                # Courts that are still too large are split by date as well
+                subqueries.extend(self.plan_date_shards(sub_configs[index], first_page))
+            else:
+                subqueries.append((sub_configs[index], first_page))
 
-                    url = self.build_search_url(config, page)
-                    page_load_start = time.time()
-                    self.driver.get(url)
+        if config.progress_callback:
+            config.progress_callback(
+                f"{len(subqueries)} court sub-queries have results "
+                f"({sum(p.total_pages for _, p in subqueries)} pages in total)")
 
-                    # Wait for page content to be fully loaded
-                    try:
-                        self.wait.until(
-                            lambda driver: driver.execute_script(
-                                "return document.readyState") == "complete"
-                        )
-                        # Wait for search results to be present
-                        self.wait.until(
-                            EC.presence_of_element_located(
-                                (By.CSS_SELECTOR, "div.result.no-alt"))
-                        )
-                    except TimeoutException:
-                        logging.warning(
-                            f"Page {page + 1} content may not be fully loaded after timeout")
+        return self.scrape_subqueries(config, subqueries, seen_links)
 
-                    if config.generate_report:
-                        page_load_time = time.time() - page_load_start
-                        self.page_load_times.append(page_load_time)
+    async def fetch_search_page_async(self, engine: AsyncCrawlEngine, config: SearchConfig, page: int,
+                                      want_total: bool = False) -> Optional[SearchPageResult]:
+        """Fetch a search results page with the async engine; None means it needs a browser"""
+        if self.cancelled:
+            return None
 
-                    # Check for and dismiss any popups on each page
-                    self.dismiss_popup_if_present()
+        cached = self.cached_search_page(config, page, want_total)
+        if cached is not None:
+            return cached
 
-                    links = self.extract_links_from_page()
-                    new_links = [
-                        link for link in links if link not in seen_links]
+        if not await asyncio.to_thread(self.wait_for_site, config):
+            return None
 
-                    if not new_links:
-                        logging.info(
-                            f"No new links found on page {page + 1}, stopping pagination")
-                        break
+        url = self.build_search_url(config, page)
+        page_load_start = time.time()
+        try:
+            html = await engine.fetch_text(url)
+        except Exception:
+            self.circuit_breaker.record(False)
+            raise
+        if config.generate_report:
+            self.page_load_times.append(time.time() - page_load_start)
 
-                    all_links.extend(new_links)
-                    seen_links.update(new_links)
-                    
-                    # Update progress state
-                    self.progress_state.all_links = all_links
-                    self.progress_state.processed_pages = page + 1
-                    self.progress_state.total_pages = total_pages
-                    
-                    # Save progress periodically
-                    self.operation_count += 1
-                    if self.operation_count % self.save_interval == 0:
-                        self.save_progress_state()
-                        if config.progress_callback:
-                            config.progress_callback(f"Progress saved (page {page + 1})")
+        # Only the breaker hears about plain HTTP results; they say nothing about the browser.
+        # An error response counts against the site, a page that needs rendering does not
+        self.circuit_breaker.record(html is not None)
+        if not html:
+            return None
+        with self.progress_lock:
+            self.search_pages_fetched += 1
 
-                    logging.info(
-                        f"Processed page {page + 1}/{total_pages}, found {len(new_links)} new links")
+        # Parse off the event loop so other requests keep flowing
+        result = await asyncio.to_thread(self.parse_search_html, html, page, want_total)
+        self.store_search_page(config, result)
+        return result
+
+    async def scrape_case_links_async(self, config: SearchConfig) -> Tuple[List[str], List[str]]:
+        """Asyncio variant of scrape_case_links that fetches search pages and PDFs concurrently"""
+        self.cancelled = False
+
+        if config.generate_report:
+            self.report_data = ReportData(total_time=timedelta())
+            self.page_load_times = []
+            self.download_times = []
+            self.wait_step_times = {}
+
+        self.total_timer = TimingInfo(datetime.now())
+
+        # The browser is only used for session cookies, rendering fallbacks and UI downloads
+        if not await asyncio.to_thread(self.setup_driver, config):
+            error_msg = "Failed to initialize browser"
+            self.generate_error_report(
+                config, "BROWSER_INIT_ERROR", error_msg, "Driver setup failed")
+            return [], [error_msg]
 
-                except Exception as e:
-                    logging.warning(f"Error processing page {page + 1}: {e}")
-                    # Save progress before breaking
-                    self.save_progress_state()
-                    break
+        # Incremental runs treat cases returned by earlier runs as seen
+        seen_index = SeenCaseIndex.for_config(config) if config.incremental else None
+        seen_links = seen_index.links.copy() if seen_index else LinkStore()
+        stop_at_known = seen_index is not None and not (config.start_date and config.end_date)
+        search_incomplete = False
+        self.failed_search_pages = []
+        self.failed_subqueries = []
+        self.search_pages_fetched = 0
 
-            # End search timer
-            self.search_timer.end_time = datetime.now()
-            
-            # Update progress state - search phase completed
-            self.progress_state.search_completed = True
-            self.progress_state.all_links = all_links
-            self.progress_state.current_phase = 'download' if config.download_pdfs else 'completed'
-            self.save_progress_state()
+        all_links = []
+        failed_downloads = []
+        self.progress_state = ProgressState(
+            search_config=self.config_to_dict(config),
+            all_links=[],
+            processed_pages=0,
+            total_pages=1,
+            downloaded_links=[],
+            failed_downloads=[],
+            current_phase='search',
+            timestamp=datetime.now().isoformat(),
+            search_completed=False
+        )
 
+        try:
+            self.search_timer = TimingInfo(datetime.now())
             if config.progress_callback:
-                config.progress_callback(
-                    f"Search completed in {self.search_timer.elapsed_str} - Found {len(all_links)} links")
+                config.progress_callback("Starting async search...")
 
-            # Download PDFs if requested
-            if config.download_pdfs and config.download_dir:
-                logging.info(
-                    f"Starting PDF downloads for {len(all_links)} links")
+            await asyncio.to_thread(self.driver.get, "https://jade.io/")
+            engine = AsyncCrawlEngine.from_driver(
+                self.driver,
+                max_concurrency=config.async_concurrency,
+                host_rate_limit=config.host_rate_limit
+            )
 
-                if config.progress_callback:
+            async with engine:
+                first_page = await self.fetch_search_page_async(engine, config, 0, want_total=True)
+                if first_page is None:
+                    first_page = await asyncio.to_thread(
+                        self.fetch_search_page, config, 0, want_total=True)
+
+                total_pages = first_page.total_pages or 1
+                page_links = {0: first_page.links}
+                self.progress_state.total_pages = total_pages
+                self.progress_state.completed_pages = [0]
+
+                pages = list(range(1, total_pages))
+                if stop_at_known and all(link in seen_links for link in first_page.links):
+                    logging.info("First page has only previously seen cases, skipping pagination")
+                    pages = []
+                elif config.progress_callback:
                     config.progress_callback(
-                        f"Starting PDF downloads for {len(all_links)} links...")
+                        f"Found {total_pages} pages - fetching with up to "
+                        f"{engine.max_concurrency} concurrent requests...")
 
-                download_start_time = datetime.now()
-                successful_downloads = 0
-                failed_download_objects = []
-
-                for i, link in enumerate(all_links, 1):
-                    # Check for cancellation
+                # Pages go out in batches so progress is checkpointed as the search runs and
+                # incremental runs can stop at the first batch that reaches known cases
+                batch_size = engine.max_concurrency
+                for start in range(0, len(pages), batch_size):
                     if self.cancelled:
-                        if config.progress_callback:
-                            config.progress_callback(
-                                "PDF downloads cancelled by user")
-                        failed_downloads.append(
-                            "Remaining downloads cancelled by user")
+                        search_incomplete = True
                         break
 
-                    # Check if browser needs restart during downloads
-                    if self.should_restart_browser():
-                        if not self.restart_browser(config):
-                            logging.error(
-                                "Failed to restart browser during downloads")
-                            failed_downloads.append(
-                                f"Link {i}: {link} - Browser restart failed")
-                            failed_download_objects.append(FailedDownload(
-                                link=link,
-                                error_message="Browser restart failed",
-                                timestamp=datetime.now().isoformat()
-                            ))
+                    batch = pages[start:start + batch_size]
+                    results = await asyncio.gather(
+                        *(self.fetch_search_page_async(engine, config, page) for page in batch),
+                        return_exceptions=True)
+
+                    reached_known = False
+                    for page, result in zip(batch, results):
+                        if not isinstance(result, SearchPageResult):
+                            if isinstance(result, Exception):
+                                logging.warning(f"Async fetch failed for page {page + 1}: {result}")
+                            # Pages that need rendering or failed are loaded in the browser
+                            try:
+                                result = await asyncio.to_thread(
+                                    self.fetch_search_page, config, page, use_http=False)
+                            except Exception as e:
+                                logging.warning(f"Browser fetch failed for page {page + 1}: {e}")
+                                result = SearchPageResult(page=page, links=[], loaded=False)
+                        if not result.loaded:
+                            # Left out of completed_pages so a resume fetches it
+                            self.failed_search_pages.append(page)
                             continue
 
-                    success, result_msg = self.download_pdf(
-                        link, config, i, len(all_links))
+                        page_links[page] = result.links
+                        self.progress_state.completed_pages.append(page)
+                        if stop_at_known and all(link in seen_links for link in result.links):
+                            reached_known = True
 
-                    if success:
-                        successful_downloads += 1
-                        self.progress_state.downloaded_links.append(link)
-                    else:
-                        failed_downloads.append(
-                            f"Link {i}: {link} - {result_msg}")
-                        failed_download_objects.append(FailedDownload(
-                            link=link,
-                            error_message=result_msg,
-                            timestamp=datetime.now().isoformat()
-                        ))
-                        self.progress_state.failed_downloads.append({
-                            'link': link,
-                            'error_message': result_msg,
-                            'timestamp': datetime.now().isoformat()
-                        })
-
-                    # Save progress periodically during downloads
-                    self.operation_count += 1
-                    if self.operation_count % self.save_interval == 0:
-                        self.save_progress_state()
-                        if config.progress_callback:
-                            config.progress_callback(f"Progress saved ({i}/{len(all_links)} downloads)")
-
-                    # Update overall download progress
-                    if config.progress_callback and i % 5 == 0:  # Update every 5 downloads
-                        download_elapsed = (
-                            datetime.now() - download_start_time).total_seconds()
-                        avg_time_per_download = download_elapsed / i
-                        estimated_remaining = avg_time_per_download * \
-                            (len(all_links) - i)
-
-                        remaining_str = str(
-                            timedelta(seconds=int(estimated_remaining)))
+                    self.progress_state.all_links = LinkStore(merge_page_links(page_links, seen_links))
+                    self.progress_state.processed_pages = len(self.progress_state.completed_pages)
+                    self.save_progress_state()
+                    if config.progress_callback:
                         config.progress_callback(
-                            f"Downloads: {successful_downloads}/{i} successful - "
-                            f"Est. remaining: {remaining_str}"
-                        )
+                            f"Processed {self.progress_state.processed_pages}/{total_pages} pages")
 
-                download_total_time = datetime.now() - download_start_time
-                download_time_str = str(
-                    timedelta(seconds=int(download_total_time.total_seconds())))
+                    if reached_known:
+                        logging.info("Reached previously seen cases, stopping pagination")
+                        break
 
+            all_links = merge_page_links(page_links, seen_links)
+            self.search_timer.end_time = datetime.now()
+            if self.failed_search_pages:
+                logging.warning(f"Failed to fetch pages: {sorted(p + 1 for p in self.failed_search_pages)}")
                 if config.progress_callback:
                     config.progress_callback(
-                        f"Downloads completed in {download_time_str} - "
-                        f"{successful_downloads}/{len(all_links)} successful"
-                    )
-
-                # Save failed downloads to file
-                if failed_download_objects:
-                    self.save_failed_downloads(failed_download_objects)
-                    if config.progress_callback:
-                        config.progress_callback(
-                            f"Saved {len(failed_download_objects)} failed downloads for later retry")
-
-                # Auto-retry failed downloads if enabled
-                if config.auto_retry_failed and failed_download_objects and not self.cancelled:
-                    if config.progress_callback:
-                        config.progress_callback(
-                            f"Auto-retrying {len(failed_download_objects)} failed downloads...")
+                        f"{len(self.failed_search_pages)} pages could not be fetched "
+                        f"and will be retried on resume")
 
-                    # Wait a moment before retrying
-                    time.sleep(2)
+            if self.cancelled:
+                return all_links, ["Operation cancelled by user"]
 
-                    # Attempt to retry failed downloads
-                    retry_successful, retry_still_failed = self.retry_failed_downloads(
-                        config)
+            # Remember this run's cases unless pages are missing
+            if seen_index:
+                if search_incomplete or self.search_has_gaps():
+                    logging.warning("Search was cut short, seen-case index not updated")
+                else:
+                    seen_index.add(all_links)
+                    seen_index.save()
+                if config.progress_callback:
+                    config.progress_callback(f"Incremental mode: {len(all_links)} new cases")
 
-                    if retry_successful:
-                        if config.progress_callback:
-                            config.progress_callback(
-                                f"Auto-retry successful for {len(retry_successful)} downloads")
+            self.progress_state.all_links = LinkStore(all_links)
+            self.progress_state.search_completed = not self.search_has_gaps()
+            if self.progress_state.search_completed:
+                self.progress_state.current_phase = 'download' if config.download_pdfs else 'completed'
+            self.save_progress_state()
 
-                        # Update failed downloads list to remove successful retries
-                        failed_downloads = [f for f in failed_downloads
-                                            if not any(link in f for link in retry_successful)]
+            if config.progress_callback:
+                config.progress_callback(
+                    f"Search completed in {self.search_timer.elapsed_str} - Found {len(all_links)} links")
 
-                    if retry_still_failed:
-                        if config.progress_callback:
-                            config.progress_callback(
-                                f"Auto-retry still failed for {len(retry_still_failed)} downloads")
+            # Download PDFs if requested
+            if config.download_pdfs and config.download_dir:
+                failed_downloads = await self.download_links_async(config, all_links)
 
-        except TimeoutException:
-            error_msg = "Page timed out"
-            self.log_error("TIMEOUT_ERROR", error_msg,
-                           f"Query: {config.query}")
-            error_report_file = self.generate_error_report(
-                config, "TIMEOUT_ERROR", error_msg, f"Query: {config.query}")
-            if config.progress_callback and error_report_file:
-                config.progress_callback(
-                    f"Error report generated: {error_report_file}")
-            return [], [error_msg]
         except Exception as e:
-            error_msg = f"Unexpected error during scraping: {e}"
+            error_msg = f"Unexpected error during async scraping: {e}"
             logging.error(error_msg)
             self.log_error("SCRAPING_ERROR", str(e), f"Query: {config.query}")
             error_report_file = self.generate_error_report(
@@ -1175,20 +4356,14 @@ class JadeScraper:
                     f"Error report generated: {error_report_file}")
             return [], ["Scraper stopped abruptly"]
         finally:
-            # End total timer and generate report if requested
-            if self.total_timer:
-                self.total_timer.end_time = datetime.now()
-                if config.progress_callback:
-                    config.progress_callback(
-                        f"Total operation completed in {self.total_timer.elapsed_str}")
-
-                # Generate report if requested
-                if config.generate_report:
-                    self.generate_performance_report(
-                        config, all_links, failed_downloads)
+            self.total_timer.end_time = datetime.now()
+            if config.generate_report:
+                self.generate_performance_report(
+                    config, all_links, failed_downloads)
 
-            # Clean up progress file on successful completion
-            self.cleanup_progress_file()
+            # Clean up progress file on successful completion; keep it while pages are pending
+            if not self.search_has_gaps():
+                self.cleanup_progress_file()
             self.cleanup()
 
         # Convert relative links to absolute URLs
@@ -1199,39 +4374,478 @@ class JadeScraper:
 
         return absolute_links, failed_downloads
 
-    def should_restart_browser(self) -> bool:
-        """Check if browser should be restarted based on elapsed time"""
-        if not self.browser_start_time:
+    async def download_links_async(self, config: SearchConfig, all_links: List[str]) -> List[str]:
+        """Fetch PDFs concurrently through the learned direct endpoint; anything that fails
+        there goes through download_links (UI path, retries, validation)"""
+        links = list(all_links)
+        if config.pdf_download_mode != "direct" or not links:
+            return await asyncio.to_thread(self.download_links, config, links)
+
+        if not self.pdf_url_template:
+            # One download through the UI teaches the endpoint
+            success, _ = await asyncio.to_thread(self.download_pdf, links[0], config, 1, len(links))
+            if success:
+                self.record_download_result(links[0], 1, True, "", [], [])
+                links = links[1:]
+            if not self.pdf_url_template:
+                return await asyncio.to_thread(self.download_links, config, links)
+
+        if config.progress_callback:
+            config.progress_callback(
+                f"Downloading {len(links)} PDFs with up to {config.async_concurrency} concurrent requests...")
+
+        os.makedirs(config.download_dir, exist_ok=True)
+        engine = AsyncCrawlEngine.from_driver(
+            self.driver, max_concurrency=config.async_concurrency,
+            host_rate_limit=config.host_rate_limit)
+        async with engine:
+            results = await asyncio.gather(
+                *(self.download_pdf_async(engine, config, link) for link in links),
+                return_exceptions=True)
+
+        remaining = []
+        for i, (link, result) in enumerate(zip(links, results), 1):
+            if result is True:
+                self.record_download_result(link, i, True, "", [], [])
+            else:
+                if isinstance(result, Exception):
+                    logging.warning(f"Async download failed for {link}: {result}")
+                remaining.append(link)
+
+        if config.progress_callback:
+            config.progress_callback(
+                f"Async downloads: {len(links) - len(remaining)}/{len(links)} successful")
+        if remaining:
+            return await asyncio.to_thread(self.download_links, config, remaining)
+        return await asyncio.to_thread(self.finish_downloads, config, [], [])
+
+    async def download_pdf_async(self, engine: AsyncCrawlEngine, config: SearchConfig,
+                                 link: str) -> bool:
+        """Download one case PDF through the direct endpoint; False hands it to the browser path"""
+        full_url = link if link.startswith('http') else f"https://jade.io{link}"
+        url_number = self.extract_number_from_url(full_url)
+        if not url_number or self.cancelled:
+            return False
+        if await asyncio.to_thread(self.find_existing_download, config, url_number):
+            return True
+        if not await asyncio.to_thread(self.wait_for_site, config):
             return False
 
-        elapsed = (datetime.now() - self.browser_start_time).total_seconds()
-        return elapsed >= self.browser_restart_interval
+        url = self.pdf_url_template.replace("{article_id}", url_number)
+        temp_path = os.path.join(config.download_dir, f".{url_number}.pdf.part")
+        download_timer = TimingInfo(datetime.now())
+        try:
+            suggested_name = await engine.fetch_to_file(url, temp_path)
+        except HttpStatusError as e:
+            # A missing case still means the site is up; throttling counts against it
+            self.circuit_breaker.record(e.status not in THROTTLED_HTTP_STATUSES)
+            raise
+        except Exception:
+            self.circuit_breaker.record(False)
+            raise
+        self.circuit_breaker.record(True)
+
+        # A login or error page comes back as HTML rather than a PDF
+        with open(temp_path, 'rb') as f:
+            is_pdf = f.read(5) == b'%PDF-'
+        if not is_pdf:
+            os.remove(temp_path)
+            raise IOError("response is not a PDF")
+
+        original_file = suggested_name if suggested_name.lower().endswith('.pdf') else "case.pdf"
+        with self.download_lock:
+            final_path = self.numbered_download_path(config.download_dir, url_number, original_file)
+            os.replace(temp_path, final_path)
+        self.validate_download(link, url_number, final_path)
+
+        download_timer.end_time = datetime.now()
+        with self.progress_lock:
+            self.download_times.append(download_timer.elapsed.total_seconds())
+            self.pdfs_downloaded += 1
+        if config.progress_callback:
+            config.progress_callback(f"Downloaded {download_timer.elapsed_str} - {full_url}")
+        return True
 
-    def restart_browser(self, config: SearchConfig) -> bool:
-        """Restart the browser to prevent memory issues"""
+    def publish_links(self, links: Iterable[str]):
+        """Hand newly found links to the download pipeline when pipelined mode is active"""
+        if self.download_pipeline:
+            self.download_pipeline.publish(links)
+
+    def finish_pipelined_downloads(self, config: SearchConfig, all_links: LinkStore) -> List[str]:
+        """Drain the download pipeline once the search is done and return the failure messages"""
+        pipeline = self.download_pipeline
+        # Anything found by a path that did not publish as it went is queued now
+        pipeline.publish(all_links)
+
+        if config.progress_callback:
+            config.progress_callback(
+                f"Search finished - waiting for {pipeline.queue.qsize()} queued downloads...")
+
+        failed_downloads = pipeline.finish()
+        self.download_pipeline = None
+
+        if pipeline.failed:
+            # The workers never started or died; fall back to downloading after the search
+            if pipeline.failed_download_objects:
+                self.save_failed_downloads(pipeline.failed_download_objects)
+            remaining = [link for link in all_links if link not in pipeline.attempted]
+            return failed_downloads + self.download_links(config, remaining)
+
+        if config.progress_callback:
+            config.progress_callback(
+                f"Pipelined downloads completed - "
+                f"{len(pipeline.attempted) - len(pipeline.failed_download_objects)}"
+                f"/{len(pipeline.attempted)} successful")
+
+        return self.finish_downloads(config, failed_downloads, pipeline.failed_download_objects)
+
+    def download_links_parallel(self, config: SearchConfig, all_links: List[str]) -> List[str]:
+        """Download PDFs with a pool of browsers, each saving into its own staging folder"""
+        links = list(all_links)
+        failed_downloads = []
+        failed_download_objects = []
+        staging_dirs: Dict[int, str] = {}  # Keyed by id() of the worker's driver
+        created_dirs: List[str] = []
+        completed = [0, 0]  # attempted, successful
+        download_start_time = datetime.now()
+
+        if config.progress_callback:
+            config.progress_callback(
+                f"Starting PDF downloads for {len(links)} links with "
+                f"{config.download_workers} download workers...")
+
+        def start_worker(index):
+            driver, staging_dir = self.create_download_worker(config, index)
+            staging_dirs[id(driver)] = staging_dir
+            created_dirs.append(staging_dir)
+            return driver
+
+        def handle(driver, wait, job):
+            index, link = job
+            # Retries that have come due go first, on this worker's browser
+            self.run_due_retries(config, failed_downloads, failed_download_objects,
+                                 driver, wait, staging_dirs[id(driver)])
+            return self.download_pdf(link, config, index, len(links), driver, wait,
+                                     staging_dir=staging_dirs[id(driver)])
+
+        def on_result(job, result):
+            index, link = job
+            success, result_msg = result
+            self.record_download_result(
+                link, index, success, result_msg, failed_downloads, failed_download_objects,
+                retry=config.auto_retry_failed)
+            with self.progress_lock:
+                completed[0] += 1
+                completed[1] += 1 if success else 0
+                if config.progress_callback and completed[0] % 5 == 0:
+                    elapsed = (datetime.now() - download_start_time).total_seconds()
+                    remaining = timedelta(seconds=int(
+                        elapsed / completed[0] * (len(links) - completed[0])))
+                    config.progress_callback(
+                        f"Downloads: {completed[1]}/{completed[0]} successful - "
+                        f"Est. remaining: {remaining}")
+
+        pool = BrowserPool(self, config, config.download_workers, driver_factory=start_worker)
         try:
+            _, failed_jobs = pool.run(list(enumerate(links, 1)), handle, on_result,
+                                      succeeded=lambda result: result[0])
+        finally:
+            for staging_dir in created_dirs:
+                self.release_staging_dir(staging_dir, config.download_dir)
+
+        for index, link in failed_jobs:
+            failed_downloads.append(
+                f"Link {index}: {link} - " +
+                ("Cancelled by user" if self.cancelled else "Download worker failed"))
+
+        if config.progress_callback:
+            download_time_str = str(timedelta(
+                seconds=int((datetime.now() - download_start_time).total_seconds())))
+            config.progress_callback(
+                f"Downloads completed in {download_time_str} - "
+                f"{completed[1]}/{len(links)} successful")
+
+        return self.finish_downloads(config, failed_downloads, failed_download_objects)
+
+    def download_links(self, config: SearchConfig, all_links: List[str]) -> List[str]:
+        """Download PDFs for all links and return the failure messages"""
+        if config.download_workers > 1:
+            return self.download_links_parallel(config, all_links)
+
+        failed_downloads = []
+
+        logging.info(
+            f"Starting PDF downloads for {len(all_links)} links")
+
+        if config.progress_callback:
+            config.progress_callback(
+                f"Starting PDF downloads for {len(all_links)} links...")
+
+        download_start_time = datetime.now()
+        successful_downloads = 0
+        failed_download_objects = []
+
+        for i, link in enumerate(all_links, 1):
+            # Check for cancellation
+            if self.cancelled:
+                if config.progress_callback:
+                    config.progress_callback(
+                        "PDF downloads cancelled by user")
+                failed_downloads.append(
+                    "Remaining downloads cancelled by user")
+                break
+
+            # Check if browser needs restart during downloads
+            if self.should_restart_browser(config):
+                if not self.restart_browser(config):
+                    logging.error(
+                        "Failed to restart browser during downloads")
+                    failed_downloads.append(
+                        f"Link {i}: {link} - Browser restart failed")
+                    failed_download_objects.append(FailedDownload(
+                        link=link,
+                        error_message="Browser restart failed",
+                        timestamp=datetime.now().isoformat()
+                    ))
+                    continue
+
+            success, result_msg = self.download_pdf(
+                link, config, i, len(all_links))
+
+            if success:
+                successful_downloads += 1
+            saved = self.record_download_result(
+                link, i, success, result_msg, failed_downloads, failed_download_objects,
+                retry=config.auto_retry_failed)
+            if saved and config.progress_callback:
+                config.progress_callback(f"Progress saved ({i}/{len(all_links)} downloads)")
+            self.run_due_retries(config, failed_downloads, failed_download_objects)
+
+            # Update overall download progress
+            if config.progress_callback and i % 5 == 0:  # Update every 5 downloads
+                download_elapsed = (
+                    datetime.now() - download_start_time).total_seconds()
+                avg_time_per_download = download_elapsed / i
+                estimated_remaining = avg_time_per_download * \
+                    (len(all_links) - i)
+
+                remaining_str = str(
+                    timedelta(seconds=int(estimated_remaining)))
+                config.progress_callback(
+                    f"Downloads: {successful_downloads}/{i} successful - "
+                    f"Est. remaining: {remaining_str}"
+                )
+
+        download_total_time = datetime.now() - download_start_time
+        download_time_str = str(
+            timedelta(seconds=int(download_total_time.total_seconds())))
+
+        if config.progress_callback:
+            config.progress_callback(
+                f"Downloads completed in {download_time_str} - "
+                f"{successful_downloads}/{len(all_links)} successful"
+            )
+
+        return self.finish_downloads(config, failed_downloads, failed_download_objects)
+
+    def record_download_result(self, link: str, index: int, success: bool, result_msg: str,
+                               failed_downloads: List[str],
+                               failed_download_objects: List[FailedDownload],
+                               retry: bool = False) -> bool:
+        """Record a download outcome; returns True if the progress state was checkpointed.
+        With retry, failures are scheduled for another attempt instead of recorded straight away"""
+        with self.progress_lock:
+            if success:
+                self.mark_downloaded(link)
+            else:
+                self.fail_or_reschedule(
+                    self.download_failure(link, result_msg),
+                    failed_downloads, failed_download_objects, f"Link {index}", retry)
+
+            # Save progress periodically during downloads
+            self.operation_count += 1
+            if self.operation_count % self.save_interval == 0:
+                self.save_progress_state()
+                return True
+        return False
+
+    def mark_downloaded(self, link: str):
+        """Add a link to the downloaded set unless its file has already failed validation.
+        Call with progress_lock held; reject_download removes links rejected later"""
+        if not any(failed.link == link for failed in self.invalid_downloads):
+            self.progress_state.downloaded_links.append(link)
+
+    def download_failure(self, link: str, error_message: str, attempt_count: int = 1) -> FailedDownload:
+        """Describe a failed attempt, with the HTTP status that caused it if there was one"""
+        with self.progress_lock:
+            http_status = self.download_http_statuses.pop(link, None)
+        return FailedDownload(link=link, error_message=error_message,
+                              timestamp=datetime.now().isoformat(),
+                              attempt_count=attempt_count, http_status=http_status)
+
+    def fail_or_reschedule(self, failed: FailedDownload, failed_downloads: List[str],
+                           failed_download_objects: List[FailedDownload], label: str,
+                           retry: bool = True):
+        """Schedule a failed download for a later attempt, or record it as failed"""
+        if retry and self.retry_scheduler.schedule(failed):
+            logging.info(f"Will retry {failed.link} ({failed.error_class}, "
+                         f"attempt {failed.attempt_count}): {failed.error_message}")
+            return
+
+        failed.error_class = classify_download_error(failed.http_status)
+        with self.progress_lock:
+            failed_downloads.append(f"{label}: {failed.link} - {failed.error_message}")
+            failed_download_objects.append(failed)
+            if self.progress_state:
+                self.progress_state.failed_downloads.append({
+                    'link': failed.link,
+                    'error_message': failed.error_message,
+                    'timestamp': failed.timestamp
+                })
+
+    def run_due_retries(self, config: SearchConfig, failed_downloads: List[str],
+                        failed_download_objects: List[FailedDownload], driver=None,
+                        wait: Optional[WebDriverWait] = None, staging_dir: Optional[str] = None,
+                        wait_for_all: bool = False, retry: bool = True) -> List[str]:
+        """Download the scheduled retries that are due and return the links that succeeded.
+        With wait_for_all, keep waiting for later retries until none are left"""
+        successful_links = []
+        attempted = 0
+        while not self.cancelled:
+            failed = self.retry_scheduler.pop_due()
+            if failed is None:
+                delay = self.retry_scheduler.seconds_until_due()
+                if not wait_for_all or delay is None:
+                    break
+                time.sleep(min(1.0, delay))
+                continue
+
+            attempted += 1
+            with self.progress_lock:
+                # Lets a file rejected by validation carry this attempt's number
+                self.download_attempts[failed.link] = failed.attempt_count + 1
+            if config.progress_callback:
+                config.progress_callback(
+                    f"Retrying ({failed.error_class}, attempt {failed.attempt_count + 1}): "
+                    f"{failed.link}")
+            success, result_msg = self.download_pdf(
+                failed.link, config, attempted, attempted + len(self.retry_scheduler),
+                driver, wait, staging_dir)
+
+            if success:
+                successful_links.append(failed.link)
+                with self.progress_lock:
+                    if self.progress_state:
+                        self.mark_downloaded(failed.link)
+            else:
+                self.fail_or_reschedule(
+                    self.download_failure(failed.link, result_msg, failed.attempt_count + 1),
+                    failed_downloads, failed_download_objects, "Retry", retry)
+        return successful_links
+
+    def finish_downloads(self, config: SearchConfig, failed_downloads: List[str],
+                         failed_download_objects: List[FailedDownload]) -> List[str]:
+        """Run the retries still scheduled, then save the remaining failures for later"""
+        failed_downloads = list(failed_downloads)
+        failed_download_objects = list(failed_download_objects)
+
+        # Retries still waiting run now; files that failed validation get their own
+        while not self.cancelled:
+            if len(self.retry_scheduler) and config.progress_callback:
+                config.progress_callback(
+                    f"Waiting on {len(self.retry_scheduler)} scheduled retries...")
+            retry_successful = self.run_due_retries(
+                config, failed_downloads, failed_download_objects, wait_for_all=True,
+                retry=config.auto_retry_failed)
+            if retry_successful and config.progress_callback:
+                config.progress_callback(f"Retries succeeded for {len(retry_successful)} downloads")
+
+            invalid_downloads = self.take_invalid_downloads()
+            if not invalid_downloads:
+                break
+            if config.progress_callback:
+                config.progress_callback(
+                    f"{len(invalid_downloads)} downloaded files failed PDF validation")
+            for failed in invalid_downloads:
+                # A case that keeps arriving corrupt is parked once it has used its attempts
+                self.fail_or_reschedule(
+                    failed, failed_downloads, failed_download_objects, "Invalid",
+                    config.auto_retry_failed and failed.attempt_count < MAX_DOWNLOAD_ATTEMPTS)
+
+        # Retries abandoned by a cancel count as failures
+        for failed in self.retry_scheduler.take_all():
+            self.fail_or_reschedule(failed, failed_downloads, failed_download_objects,
+                                    "Retry", retry=False)
+        with self.progress_lock:
+            self.download_attempts.clear()
+
+        for index in (self.download_index, self.pdf_store):
+            if index:
+                index.save()
+
+        # Save failed downloads to file
+        if failed_download_objects:
+            self.save_failed_downloads(failed_download_objects)
             if config.progress_callback:
-                config.progress_callback("Restarting browser after 1 hour...")
+                parked = sum(1 for fd in failed_download_objects if fd.error_class == "permanent")
+                config.progress_callback(
+                    f"Saved {len(failed_download_objects)} failed downloads for later retry"
+                    + (f" ({parked} permanent)" if parked else ""))
 
-            logging.info("Restarting browser after half hour of operation")
+        return failed_downloads
 
-            # Clean up current driver
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except Exception as e:
-                    logging.warning(f"Error closing old driver: {e}")
+    def should_restart_browser(self, config: Optional[SearchConfig] = None) -> bool:
+        """Check whether the main browser's memory use or error rate calls for a fresh one,
+        warming a spare in the background as either approaches its limit"""
+        if not self.driver:
+            return False
+
+        reason, warm_spare = self.browser_recycler.check(self.driver)
+        if warm_spare and config is not None:
+            self.browser_recycler.prepare_spare(lambda: self.create_spare_driver(config))
+        self.recycle_reason = reason
+        return reason is not None
+
+    def create_spare_driver(self, config: SearchConfig):
+        """Start a browser configured like the main one, with jade.io already loaded"""
+        driver = self.create_worker_driver(
+            config, config.download_dir if config.download_pdfs else None,
+            self.main_browser_downloads(config))
+        try:
+            driver.get(BREAKER_PROBE_URL)
+        except Exception as e:
+            logging.debug(f"Spare browser could not preload jade.io: {e}")
+        return driver
+
+    def quit_driver(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Error closing old driver: {e}")
 
-            # Wait a moment for cleanup
-            time.sleep(2)
+    def restart_browser(self, config: SearchConfig) -> bool:
+        """Swap in a fresh browser, the warm spare if one is ready, and retire the old one"""
+        reason = self.recycle_reason or "requested"
+        try:
+            if config.progress_callback:
+                config.progress_callback(f"Recycling browser ({reason})...")
+            logging.info(f"Recycling browser: {reason}")
 
-            # Setup new driver
-            success = self.setup_driver(config)
+            new_driver = self.browser_recycler.take_spare() or self.create_spare_driver(config)
+            old_driver = self.driver
+            self.driver = new_driver
+            self.wait = WebDriverWait(new_driver, config.wait_time)
+            self.browser_start_time = datetime.now()
+            self.browser_recycler.reset()
+            self.recycle_reason = None
 
-            if success and config.progress_callback:
-                config.progress_callback("Browser restarted successfully")
+            # The old browser shuts down in the background so work resumes straight away
+            if old_driver:
+                threading.Thread(target=self.quit_driver, args=(old_driver,), daemon=True).start()
 
-            return success
+            if config.progress_callback:
+                config.progress_callback("Browser recycled successfully")
+            return True
 
         except Exception as e:
             logging.error(f"Error restarting browser: {e}")
@@ -1281,63 +4895,129 @@ class JadeScraper:
             logging.warning(f"Error extracting number from URL {url}: {e}")
             return None
 
-    def wait_and_rename_downloaded_file(self, download_dir: str, files_before: set, url_number: str):
-        """Wait for download to complete and rename the file with URL number prefix"""
-        try:
-            # Wait up to 60 seconds for a new file to appear
-            max_wait_time = 60
-            wait_interval = 1
-            elapsed_time = 0
+    def numbered_download_path(self, download_dir: str, url_number: str, original_file: str) -> str:
+        """Build a free path for a download, prefixed with the case number"""
+        new_path = os.path.join(download_dir, f"{url_number}_{original_file}")
+
+        # Handle filename conflicts
+        counter = 1
+        while os.path.exists(new_path):
+            name_part, ext = os.path.splitext(original_file)
+            new_path = os.path.join(download_dir, f"{url_number}_{name_part}_{counter}{ext}")
+            counter += 1
+        return new_path
+
+    def learn_pdf_url_template(self, href: Optional[str], url_number: str):
+        """Derive the PDF endpoint pattern from a case's download button link"""
+        url = urljoin("https://jade.io/", href) if href and not href.startswith(
+            ('#', 'javascript:')) else ""
+        # The ID must appear as a whole path segment or parameter value
+        template, count = re.subn(
+            rf"(?<=[/=]){re.escape(url_number)}(?=[/?&.#]|$)", "{article_id}", url, count=1)
+        if not count:
+            logging.debug(f"PDF button link cannot be reused as a template: {href}")
+            return
+        self.pdf_url_template = template
+        self.direct_pdf_failures = 0
+        logging.info(f"Learned direct PDF endpoint: {self.pdf_url_template}")
+
+    def get_pdf_http_client(self, driver) -> Optional[JadeHttpClient]:
+        """Return the pooled HTTP client for PDFs, created from a driver already on jade.io"""
+        with self.progress_lock:
+            if self.pdf_http_client is None:
+                try:
+                    if not (driver.current_url or "").startswith("https://jade.io"):
+                        return None
+                    self.pdf_http_client = JadeHttpClient(driver, pool_size=4)
+                except Exception as e:
+                    logging.warning(f"Could not create HTTP client for PDF downloads: {e}")
+                    return None
+            return self.pdf_http_client
+
+    def download_pdf_direct(self, url_number: str, download_dir: str, driver=None) -> Optional[str]:
+        """Stream a case PDF straight to disk; returns the saved path or None to use the UI path.
+        Raises HttpStatusError when the case is gone or the site is throttling"""
+        client = self.get_pdf_http_client(driver or self.driver)
+        if not client or not download_dir:
+            return None
 
-            while elapsed_time < max_wait_time:
-                time.sleep(wait_interval)
-                elapsed_time += wait_interval
+        url = self.pdf_url_template.replace("{article_id}", url_number)
+        temp_path = os.path.join(download_dir, f".{url_number}.pdf.part")
+        try:
+            os.makedirs(download_dir, exist_ok=True)
+            suggested_name = client.download_to_file(url, temp_path)
+
+            # A login or error page comes back as HTML rather than a PDF
+            with open(temp_path, 'rb') as f:
+                if f.read(5) != b'%PDF-':
+                    client.discard_partial(temp_path)
+                    raise IOError("response is not a PDF")
+
+            original_file = suggested_name if suggested_name.lower().endswith('.pdf') \
+                else "case.pdf"
+            with self.download_lock:
+                final_path = self.numbered_download_path(download_dir, url_number, original_file)
+                os.replace(temp_path, final_path)
+            self.direct_pdf_failures = 0
+            return final_path
 
-                if not os.path.exists(download_dir):
-                    continue
+        except Exception as e:
+            status = e.status if isinstance(e, HttpStatusError) else None
+            # Keep the bytes received so far so a retry can resume, unless the
+            # transfer finished and the content was wrong or the case is gone
+            if status in GONE_HTTP_STATUSES or not os.path.exists(temp_path + ".json"):
+                client.discard_partial(temp_path)
+
+            if status in THROTTLED_HTTP_STATUSES:
+                # The endpoint works but the site wants us to back off; the UI would be refused too
+                raise
+
+            self.direct_pdf_failures += 1
+            if self.direct_pdf_failures >= MAX_DIRECT_PDF_FAILURES:
+                # The learned endpoint no longer works; relearn it from the next UI download
+                logging.warning("Direct PDF endpoint keeps failing, reverting to UI downloads")
+                self.pdf_url_template = None
+            elif status in GONE_HTTP_STATUSES:
+                raise
+
+            logging.warning(f"Direct PDF download failed for {url_number}, using the UI: {e}")
+            return None
 
-                current_files = set(os.listdir(download_dir))
-                new_files = current_files - files_before
-
-                # Look for completed PDF files (not .crdownload or .tmp files)
-                completed_pdfs = [f for f in new_files
-                                  if f.endswith('.pdf') and
-                                  not f.endswith('.crdownload') and
-                                  not f.endswith('.tmp')]
-
-                if completed_pdfs:
-                    # Found a completed PDF, rename it
-                    original_file = completed_pdfs[0]  # Take the first one
-                    original_path = os.path.join(download_dir, original_file)
-
-                    # Create new filename with number prefix
-                    new_filename = f"{url_number}_{original_file}"
-                    new_path = os.path.join(download_dir, new_filename)
-
-                    # Handle filename conflicts
-                    counter = 1
-                    while os.path.exists(new_path):
-                        name_part, ext = os.path.splitext(original_file)
-                        new_filename = f"{url_number}_{name_part}_{counter}{ext}"
-                        new_path = os.path.join(download_dir, new_filename)
-                        counter += 1
-
-                    # Rename the file
-                    os.rename(original_path, new_path)
-                    logging.info(
-                        f"Renamed downloaded file: {original_file} -> {new_filename}")
-                    return
+    def wait_and_rename_downloaded_file(self, watcher: DownloadWatcher, url_number: str,
+                                        target_dir: Optional[str] = None) -> Optional[str]:
+        """Wait for download to complete and move it into target_dir with a URL number prefix;
+        returns the new path, or None if no file arrived"""
+        download_dir = watcher.watch_dir
+        target_dir = target_dir or download_dir
+        try:
+            wait_start = time.time()
+            original_file = watcher.wait(DOWNLOAD_WAIT_TIMEOUT)
+            self.wait_step_times.setdefault(
+                f"download_{watcher.mode}", []).append(time.time() - wait_start)
 
-            # If we get here, no completed PDF was found within the timeout
-            logging.warning(
-                f"No completed PDF found within {max_wait_time} seconds for URL number {url_number}")
+            if not original_file:
+                logging.warning(
+                    f"No completed PDF found within {DOWNLOAD_WAIT_TIMEOUT} seconds for URL number {url_number}")
+                return None
+
+            # Create new filename with number prefix and move it in one step
+            original_path = os.path.join(download_dir, original_file)
+            with self.download_lock:
+                new_path = self.numbered_download_path(target_dir, url_number, original_file)
+                new_filename = os.path.basename(new_path)
+                os.replace(original_path, new_path)
+            logging.info(
+                f"Renamed downloaded file: {original_file} -> {new_filename}")
+            return new_path
 
         except Exception as e:
             logging.warning(
                 f"Error renaming downloaded file for URL number {url_number}: {e}")
+            return None
 
-    def _is_element_visible_and_clickable(self, element) -> bool:
+    def _is_element_visible_and_clickable(self, element, driver=None) -> bool:
         """Check if an element is visible and clickable using JavaScript"""
+        driver = driver or self.driver
         try:
             # Check if element is displayed and enabled
             if not element.is_displayed() or not element.is_enabled():
@@ -1360,7 +5040,7 @@ class JadeScraper:
             return inViewport && isClickable && rect.width > 0 && rect.height > 0;
             """
 
-            return self.driver.execute_script(script, element)
+            return driver.execute_script(script, element)
 
         except Exception as e:
             logging.warning(f"Error checking element visibility: {e}")
@@ -1418,7 +5098,9 @@ class JadeScraper:
                 "download_pdfs": config.download_pdfs,
                 "download_directory": config.download_dir or "N/A",
                 "auto_retry_failed": config.auto_retry_failed,
-                "generate_report": config.generate_report
+                "generate_report": config.generate_report,
+                "search_workers": config.search_workers,
+                "fetch_mode": config.fetch_mode
             }
 
             # Read existing error log content
@@ -1456,6 +5138,8 @@ Download PDFs: {settings['download_pdfs']}
 Download Directory: {settings['download_directory']}
 Auto-retry Failed Downloads: {settings['auto_retry_failed']}
 Generate Performance Report: {settings['generate_report']}
+Search Workers: {settings['search_workers']}
+Fetch Mode: {settings['fetch_mode']}
 
 === TIMING INFORMATION ===
 """
@@ -1529,9 +5213,12 @@ Generate Performance Report: {settings['generate_report']}
             for failed in failed_downloads:
                 if failed.link in existing_dict:
                     # Increment attempt count for existing failures
-                    existing_dict[failed.link].attempt_count += 1
-                    existing_dict[failed.link].error_message = failed.error_message
-                    existing_dict[failed.link].timestamp = failed.timestamp
+                    existing = existing_dict[failed.link]
+                    existing.attempt_count = max(existing.attempt_count + 1, failed.attempt_count)
+                    existing.error_message = failed.error_message
+                    existing.timestamp = failed.timestamp
+                    existing.error_class = failed.error_class
+                    existing.http_status = failed.http_status
                 else:
                     # Add new failure
                     existing_dict[failed.link] = failed
@@ -1540,12 +5227,7 @@ Generate Performance Report: {settings['generate_report']}
             all_failed = list(existing_dict.values())
 
             with open(self.failed_downloads_file, 'w', encoding='utf-8') as f:
-                json.dump([{
-                    'link': fd.link,
-                    'error_message': fd.error_message,
-                    'timestamp': fd.timestamp,
-                    'attempt_count': fd.attempt_count
-                } for fd in all_failed], f, indent=2)
+                json.dump([asdict(fd) for fd in all_failed], f, indent=2)
 
             logging.info(
                 f"Saved {len(failed_downloads)} failed downloads to {self.failed_downloads_file}")
@@ -1574,7 +5256,9 @@ Generate Performance Report: {settings['generate_report']}
                 link=item['link'],
                 error_message=item['error_message'],
                 timestamp=item['timestamp'],
-                attempt_count=item.get('attempt_count', 1)
+                attempt_count=item.get('attempt_count', 1),
+                error_class=item.get('error_class') or classify_download_error(item.get('http_status')),
+                http_status=item.get('http_status')
             ) for item in data]
 
         except Exception as e:
@@ -1601,47 +5285,40 @@ Generate Performance Report: {settings['generate_report']}
 
         successful_links = []
         still_failed = []
+        still_failed_messages = []
 
         try:
+            # The user asked for these now, so backoff only decides the order; permanent
+            # failures stay parked in the file
+            for failed_download in failed_downloads:
+                if not self.retry_scheduler.schedule(failed_download, since=0.0, capped=False):
+                    still_failed.append(failed_download)
+
             if config.progress_callback:
                 config.progress_callback(
-                    f"Retrying {len(failed_downloads)} failed downloads...")
-
-            for i, failed_download in enumerate(failed_downloads, 1):
-                # Check for cancellation
-                if self.cancelled:
-                    if config.progress_callback:
-                        config.progress_callback(
-                            "Retry operation cancelled by user")
-                    # Add remaining items back to still_failed
-                    still_failed.extend(failed_downloads[i-1:])
-                    break
-
-                if config.progress_callback:
-                    config.progress_callback(
-                        f"Retrying {i}/{len(failed_downloads)}: {failed_download.link}")
-
-                success, result_msg = self.download_pdf(
-                    failed_download.link, config, i, len(failed_downloads))
-
-                if success:
-                    successful_links.append(failed_download.link)
-                    logging.info(
-                        f"Successfully retried: {failed_download.link}")
-                else:
-                    # Update the failed download with new error info
-                    updated_failed = FailedDownload(
-                        link=failed_download.link,
-                        error_message=result_msg,
-                        timestamp=datetime.now().isoformat(),
-                        attempt_count=failed_download.attempt_count + 1
-                    )
-                    still_failed.append(updated_failed)
+                    f"Retrying {len(self.retry_scheduler)} failed downloads"
+                    + (f" ({len(still_failed)} permanent failures skipped)" if still_failed else "")
+                    + "...")
+
+            successful_links = self.run_due_retries(
+                config, still_failed_messages, still_failed, wait_for_all=True, retry=False)
+            if self.cancelled and config.progress_callback:
+                config.progress_callback("Retry operation cancelled by user")
+
+            # Retried files that still fail validation stay in the retry queue
+            attempts = {fd.link: fd.attempt_count for fd in failed_downloads}
+            for invalid in self.take_invalid_downloads():
+                if invalid.link in successful_links:
+                    successful_links.remove(invalid.link)
+                invalid.attempt_count = attempts.get(invalid.link, 0) + 1
+                still_failed.append(invalid)
 
         except Exception as e:
             logging.error(f"Error during retry operation: {e}")
 
         finally:
+            # Retries not reached before a cancel stay as they were
+            still_failed.extend(self.retry_scheduler.take_all())
             self.cleanup()
 
         # Update the failed downloads file
@@ -1649,12 +5326,7 @@ Generate Performance Report: {settings['generate_report']}
             # Overwrite the file with only the still failed downloads
             try:
                 with open(self.failed_downloads_file, 'w', encoding='utf-8') as f:
-                    json.dump([{
-                        'link': fd.link,
-                        'error_message': fd.error_message,
-                        'timestamp': fd.timestamp,
-                        'attempt_count': fd.attempt_count
-                    } for fd in still_failed], f, indent=2)
+                    json.dump([asdict(fd) for fd in still_failed], f, indent=2)
                 logging.info(
                     f"Updated failed downloads file with {len(still_failed)} remaining failures")
             except Exception as e:
@@ -1732,7 +5404,9 @@ Generate Performance Report: {settings['generate_report']}
                 "headless_mode": config.headless,
                 "wait_time_seconds": config.wait_time,
                 "download_pdfs": config.download_pdfs,
-                "download_directory": config.download_dir or "N/A"
+                "download_directory": config.download_dir or "N/A",
+                "search_workers": config.search_workers,
+                "fetch_mode": config.fetch_mode
             }
 
             # Generate report content
@@ -1747,7 +5421,8 @@ Generate Performance Report: {settings['generate_report']}
                 internet_speed=internet_speed,
                 memory_usage=memory_usage,
                 cpu_usage=cpu_usage,
-                settings=settings
+                settings=settings,
+                wait_step_times=self.wait_step_times
             )
 
             # Save report to file
@@ -1770,7 +5445,8 @@ Generate Performance Report: {settings['generate_report']}
 
     def format_report(self, total_time, search_time, total_links, successful_downloads,
                       failed_downloads, avg_download_time, avg_page_load_time,
-                      internet_speed, memory_usage, cpu_usage, settings) -> str:
+                      internet_speed, memory_usage, cpu_usage, settings,
+                      wait_step_times: Optional[Dict[str, List[float]]] = None) -> str:
         """Format the performance report as a readable string"""
 
         def format_time(td):
@@ -1796,7 +5472,7 @@ Search Phase Time: {format_time(search_time)}
 Average Page Load Time: {f"{avg_page_load_time:.2f}s" if avg_page_load_time else "N/A"}
 Average Download Time: {f"{avg_download_time:.2f}s" if avg_download_time else "N/A"}
 
-=== RESULTS SUMMARY ===
+{self.format_wait_breakdown(wait_step_times)}=== RESULTS SUMMARY ===
 Total Links Found: {total_links}
 Successful Downloads: {successful_downloads}
 Failed Downloads: {failed_downloads}
@@ -1816,6 +5492,8 @@ Headless Mode: {settings['headless_mode']}
 Wait Time: {settings['wait_time_seconds']} seconds
 Download PDFs: {settings['download_pdfs']}
 Download Directory: {settings['download_directory']}
+Search Workers: {settings['search_workers']}
+Fetch Mode: {settings['fetch_mode']}
 
 === RECOMMENDATIONS ===
 """
@@ -1843,12 +5521,26 @@ Download Directory: {settings['download_directory']}
 
         return report
 
+    def format_wait_breakdown(self, wait_step_times: Optional[Dict[str, List[float]]]) -> str:
+        """Format per-step wait times recorded during downloads"""
+        if not wait_step_times:
+            return ""
+
+        breakdown = "=== WAIT BREAKDOWN ===\n"
+        for step, times in sorted(wait_step_times.items()):
+            breakdown += (f"{step}: avg {sum(times) / len(times):.2f}s, "
+                          f"total {sum(times):.1f}s over {len(times)} waits\n")
+        return breakdown + "\n"
+
     def save_progress_state(self):
         """Save current progress state to file"""
         try:
             if self.progress_state:
+                # Downloads may be recorded from the pipeline worker while saving
+                with self.progress_lock:
+                    data = self.progress_state.to_dict()
                 with open(self.progress_save_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.progress_state.to_dict(), f, indent=2)
+                    json.dump(data, f, indent=2)
                 logging.debug(f"Progress saved to {self.progress_save_file}")
         except Exception as e:
             logging.error(f"Error saving progress state: {e}")
@@ -1886,7 +5578,25 @@ Download Directory: {settings['download_directory']}
             'download_pdfs': config.download_pdfs,
             'download_dir': config.download_dir,
             'generate_report': config.generate_report,
-            'auto_retry_failed': config.auto_retry_failed
+            'auto_retry_failed': config.auto_retry_failed,
+            'search_workers': config.search_workers,
+            'download_workers': config.download_workers,
+            'fetch_mode': config.fetch_mode,
+            'async_concurrency': config.async_concurrency,
+            'host_rate_limit': config.host_rate_limit,
+            'shard_max_pages': config.shard_max_pages,
+            'fan_out_courts': config.fan_out_courts,
+            'extraction_mode': config.extraction_mode,
+            'pipeline_downloads': config.pipeline_downloads,
+            'pipeline_queue_size': config.pipeline_queue_size,
+            'incremental': config.incremental,
+            'cache_ttl_hours': config.cache_ttl_hours,
+            'cache_max_entries': config.cache_max_entries,
+            'pdf_download_mode': config.pdf_download_mode,
+            'adaptive_concurrency': config.adaptive_concurrency,
+            'skip_existing': config.skip_existing,
+            'shared_store': config.shared_store,
+            'pdf_store_dir': config.pdf_store_dir
         }
 
     def dict_to_config(self, data: Dict, progress_callback: Optional[Callable[[str], None]] = None) -> SearchConfig:
@@ -1904,7 +5614,25 @@ Download Directory: {settings['download_directory']}
             progress_callback=progress_callback,
             generate_report=data.get('generate_report', False),
             auto_retry_failed=data.get('auto_retry_failed', False),
-            resume_from_save=True
+            resume_from_save=True,
+            search_workers=data.get('search_workers', DEFAULT_SEARCH_WORKERS),
+            download_workers=data.get('download_workers', DEFAULT_DOWNLOAD_WORKERS),
+            fetch_mode=data.get('fetch_mode', DEFAULT_FETCH_MODE),
+            async_concurrency=data.get('async_concurrency', DEFAULT_ASYNC_CONCURRENCY),
+            host_rate_limit=data.get('host_rate_limit', DEFAULT_HOST_RATE_LIMIT),
+            shard_max_pages=data.get('shard_max_pages', 0),
+            fan_out_courts=data.get('fan_out_courts', False),
+            extraction_mode=data.get('extraction_mode', DEFAULT_EXTRACTION_MODE),
+            pipeline_downloads=data.get('pipeline_downloads', False),
+            pipeline_queue_size=data.get('pipeline_queue_size', DEFAULT_PIPELINE_QUEUE_SIZE),
+            incremental=data.get('incremental', False),
+            cache_ttl_hours=data.get('cache_ttl_hours', DEFAULT_CACHE_TTL_HOURS),
+            cache_max_entries=data.get('cache_max_entries', DEFAULT_CACHE_MAX_ENTRIES),
+            pdf_download_mode=data.get('pdf_download_mode', DEFAULT_PDF_DOWNLOAD_MODE),
+            adaptive_concurrency=data.get('adaptive_concurrency', False),
+            skip_existing=data.get('skip_existing', True),
+            shared_store=data.get('shared_store', True),
+            pdf_store_dir=data.get('pdf_store_dir')
         )
 
     def resume_scraping(self, config: SearchConfig, progress_state: ProgressState) -> Tuple[List[str], List[str]]:
@@ -1926,7 +5654,7 @@ Download Directory: {settings['download_directory']}
                 failed_downloads.append(f"Link: {failed_dict['link']} - {failed_dict['error_message']}")
 
             # If search phase was not completed, continue searching
-            if not progress_state.search_completed and progress_state.current_phase == 'search':
+            if not progress_state.search_completed and progress_state.current_phase in ('search', 'search+download'):
                 if config.progress_callback:
                     config.progress_callback("Continuing search phase...")
 
@@ -1946,18 +5674,19 @@ Download Directory: {settings['download_directory']}
 
                 if not self.setup_driver(config):
                     error_msg = "Failed to initialize browser for downloads"
-                    return all_links, failed_downloads + [error_msg]
+                    return list(all_links), failed_downloads + [error_msg]
 
                 # Get links that haven't been downloaded yet
-                downloaded_links = set(progress_state.downloaded_links)
+                downloaded_links = progress_state.downloaded_links
                 remaining_links = [link for link in all_links if link not in downloaded_links]
 
                 if remaining_links:
                     download_failures = self.continue_downloads_from_progress(config, remaining_links)
                     failed_downloads.extend(download_failures)
 
-            # Clean up progress file on successful resume completion
-            self.cleanup_progress_file()
+            # Clean up progress file on successful resume completion; keep it while pages are pending
+            if progress_state.search_completed:
+                self.cleanup_progress_file()
             self.cleanup()
 
             # Convert relative links to absolute URLs
@@ -1979,42 +5708,58 @@ Download Directory: {settings['download_directory']}
         """Continue search phase from saved progress"""
         additional_links = []
         failed_downloads = []
-        seen_links = set(progress_state.all_links)
+        seen_links = progress_state.all_links.copy()
+        self.failed_search_pages = []
+        self.failed_subqueries = []
 
         try:
-            # Start from the next page after the last processed page
-            start_page = progress_state.processed_pages
+            if config.fetch_mode in ("http", "async"):
+                self.start_http_client(config)
+
+            # Only fetch the pages that were not completed before the save
+            pending_pages = progress_state.pending_pages()
             total_pages = progress_state.total_pages
 
+            if config.fan_out_courts and expand_court_filter(config.court_name):
+                # Court sub-query pages are not tracked individually, so rerun and skip known links
+                additional_links = self.scrape_court_fan_out(config, seen_links)
+                self.progress_state.all_links.extend(additional_links)
+                pending_pages = []
+            elif config.shard_max_pages and total_pages > config.shard_max_pages:
+                # Shard pages are not tracked individually, so re-plan and skip known links
+                additional_links = self.scrape_date_shards(config, seen_links)
+                self.progress_state.all_links.extend(additional_links)
+                pending_pages = []
+
             if config.progress_callback:
-                config.progress_callback(f"Continuing search from page {start_page + 1}/{total_pages}")
+                config.progress_callback(
+                    f"Continuing search - {len(pending_pages)} of {total_pages} pages remaining")
+
+            if config.search_workers > 1 and len(pending_pages) > 1:
+                additional_links = self.scrape_pages_parallel(config, pending_pages, seen_links)
+                self.progress_state.all_links.extend(additional_links)
+                pending_pages = []
 
-            for page in range(start_page, total_pages):
+            for page in pending_pages:
                 if self.cancelled:
                     break
 
-                url = self.build_search_url(config, page)
-                self.driver.get(url)
-
-                # Wait for page content
-                try:
-                    self.wait.until(
-                        lambda driver: driver.execute_script("return document.readyState") == "complete"
-                    )
-                except TimeoutException:
-                    logging.warning(f"Page {page + 1} content may not be fully loaded")
-
-                self.dismiss_popup_if_present()
-                links = self.extract_links_from_page()
-                new_links = [link for link in links if link not in seen_links]
+                result = self.fetch_search_page(config, page)
+                if not result.loaded:
+                    # Stays pending so the next resume tries it again
+                    logging.warning(f"Resumed page {page + 1} timed out")
+                    self.failed_search_pages.append(page)
+                    continue
+                new_links = [link for link in result.links if link not in seen_links]
+                self.progress_state.completed_pages.append(page)
+                self.progress_state.processed_pages = len(self.progress_state.completed_pages)
 
                 if new_links:
                     additional_links.extend(new_links)
                     seen_links.update(new_links)
 
-                    # Update progress state with new links and current page
+                    # Update progress state with new links
                     self.progress_state.all_links.extend(new_links)
-                    self.progress_state.processed_pages = page + 1
 
                     # Save progress periodically
                     self.operation_count += 1
@@ -2026,9 +5771,10 @@ Download Directory: {settings['download_directory']}
                 if config.progress_callback:
                     config.progress_callback(f"Resumed page {page + 1}/{total_pages}, found {len(new_links)} new links")
 
-            # Mark search as completed and save final state
-            self.progress_state.search_completed = True
-            self.progress_state.current_phase = 'download' if config.download_pdfs else 'completed'
+            # Mark search as completed (unless pages are still pending) and save final state
+            self.progress_state.search_completed = not self.search_has_gaps()
+            if self.progress_state.search_completed:
+                self.progress_state.current_phase = 'download' if config.download_pdfs else 'completed'
             self.save_progress_state()
             
             if config.progress_callback:
@@ -2055,32 +5801,8 @@ Download Directory: {settings['download_directory']}
             self.progress_state.current_phase = 'download'
             self.save_progress_state()
 
-            for i, link in enumerate(remaining_links, 1):
-                if self.cancelled:
-                    break
-
-                success, result_msg = self.download_pdf(link, config, i, len(remaining_links))
-
-                if success:
-                    self.progress_state.downloaded_links.append(link)
-                    if config.progress_callback:
-                        total_downloaded = len(self.progress_state.downloaded_links)
-                        total_links = len(self.progress_state.all_links)
-                        config.progress_callback(f"Downloaded {total_downloaded}/{total_links} PDFs")
-                else:
-                    failed_downloads.append(f"Link {i}: {link} - {result_msg}")
-                    self.progress_state.failed_downloads.append({
-                        'link': link,
-                        'error_message': result_msg,
-                        'timestamp': datetime.now().isoformat()
-                    })
-
-                # Save progress periodically during downloads
-                self.operation_count += 1
-                if self.operation_count % self.save_interval == 0:
-                    self.save_progress_state()
-                    if config.progress_callback:
-                        config.progress_callback(f"Progress saved ({len(self.progress_state.downloaded_links)} downloads completed)")
+            # Same path as a fresh run: download workers, scheduled retries and PDF validation
+            failed_downloads.extend(self.download_links(config, remaining_links))
 
             # Mark downloads as completed
             self.progress_state.current_phase = 'completed'
@@ -2097,6 +5819,28 @@ Download Directory: {settings['download_directory']}
 
     def cleanup(self):
         """Clean up resources"""
+        if self.http_client:
+            self.http_client.close()
+            self.http_client = None
+
+        if self.pdf_http_client:
+            self.pdf_http_client.close()
+            self.pdf_http_client = None
+
+        if self.probe_pool:
+            self.probe_pool.clear()
+            self.probe_pool = None
+
+        self.browser_recycler.discard_spare()
+
+        if self.pdf_validator:
+            self.pdf_validator.close()
+            self.pdf_validator = None
+
+        for index in (self.download_index, self.pdf_store):
+            if index:
+                index.save()
+
         if self.driver:
             try:
                 self.driver.quit()
@@ -2169,6 +5913,47 @@ class JadeScraperGUI:
         ttk.Checkbutton(self.frame, text="Auto-retry Failed Downloads",
                         variable=self.auto_retry_var).grid(row=row, column=1, sticky="w", pady=2)
 
+        self.http_mode_var = tk.BooleanVar()
+        ttk.Checkbutton(self.frame, text="Direct HTTP Search Mode",
+                        variable=self.http_mode_var).grid(row=row, column=2, sticky="w", pady=2)
+
+        row += 1
+
+        # Checkboxes row 3
+        self.pipeline_var = tk.BooleanVar()
+        ttk.Checkbutton(self.frame, text="Download While Searching",
+                        variable=self.pipeline_var).grid(row=row, column=0, sticky="w", pady=2)
+
+        self.incremental_var = tk.BooleanVar()
+        ttk.Checkbutton(self.frame, text="Only New Cases Since Last Run",
+                        variable=self.incremental_var).grid(row=row, column=1, sticky="w", pady=2)
+
+        self.direct_pdf_var = tk.BooleanVar(value=DEFAULT_PDF_DOWNLOAD_MODE == "direct")
+        ttk.Checkbutton(self.frame, text="Direct PDF Downloads",
+                        variable=self.direct_pdf_var).grid(row=row, column=2, sticky="w", pady=2)
+
+        row += 1
+
+        # Checkboxes row 4
+        self.skip_existing_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(self.frame, text="Skip Already Downloaded",
+                        variable=self.skip_existing_var).grid(row=row, column=0, sticky="w", pady=2)
+
+        self.shared_store_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(self.frame, text="Share PDFs Across Queries",
+                        variable=self.shared_store_var).grid(row=row, column=1, sticky="w", pady=2)
+
+        self.adaptive_var = tk.BooleanVar()
+        ttk.Checkbutton(self.frame, text="Adaptive Worker Count",
+                        variable=self.adaptive_var).grid(row=row, column=2, sticky="w", pady=2)
+
+        row += 1
+
+        # Checkboxes row 5
+        self.async_mode_var = tk.BooleanVar()
+        ttk.Checkbutton(self.frame, text="Async Search and Downloads",
+                        variable=self.async_mode_var).grid(row=row, column=0, sticky="w", pady=2)
+
         row += 1
 
         # Download folder selection
@@ -2199,6 +5984,11 @@ class JadeScraperGUI:
 
         row += 1
 
+        self.fan_out_courts_var = tk.BooleanVar()
+        ttk.Checkbutton(self.frame, text="Query each court in a group separately",
+                        variable=self.fan_out_courts_var).grid(row=row, column=1, sticky="w", pady=2)
+        row += 1
+
         # Date filters
         date_frame = ttk.Frame(self.frame)
         date_frame.grid(row=row, column=0, columnspan=3, sticky="ew", pady=5)
@@ -2220,6 +6010,30 @@ class JadeScraperGUI:
         self.wait_time_var = tk.StringVar(value="5")
         ttk.Entry(date_frame, textvariable=self.wait_time_var,
                   width=10).grid(row=0, column=5, padx=5)
+
+        ttk.Label(date_frame, text="Search Workers:").grid(
+            row=0, column=6, sticky="w", padx=5)
+        self.search_workers_var = tk.StringVar(value=str(DEFAULT_SEARCH_WORKERS))
+        ttk.Entry(date_frame, textvariable=self.search_workers_var,
+                  width=5).grid(row=0, column=7, padx=5)
+
+        ttk.Label(date_frame, text="Shard Above (pages, 0 = off):").grid(
+            row=1, column=0, sticky="w", padx=5)
+        self.shard_max_pages_var = tk.StringVar(value="0")
+        ttk.Entry(date_frame, textvariable=self.shard_max_pages_var,
+                  width=15).grid(row=1, column=1, padx=5)
+
+        ttk.Label(date_frame, text="Cache Pages (hours, 0 = off):").grid(
+            row=1, column=2, sticky="w", padx=5)
+        self.cache_ttl_var = tk.StringVar(value="0")
+        ttk.Entry(date_frame, textvariable=self.cache_ttl_var,
+                  width=15).grid(row=1, column=3, padx=5)
+
+        ttk.Label(date_frame, text="Download Workers:").grid(
+            row=1, column=4, sticky="w", padx=5)
+        self.download_workers_var = tk.StringVar(value=str(DEFAULT_DOWNLOAD_WORKERS))
+        ttk.Entry(date_frame, textvariable=self.download_workers_var,
+                  width=10).grid(row=1, column=5, padx=5)
         row += 1
 
         # Search and Cancel buttons
@@ -2245,6 +6059,10 @@ class JadeScraperGUI:
         self.clear_progress_button = ttk.Button(
             button_frame, text="Clear Saved Progress", command=self.clear_saved_progress)
         self.clear_progress_button.grid(row=0, column=4, padx=5)
+
+        self.plan_button = ttk.Button(
+            button_frame, text="Plan (Dry Run)", command=self.run_plan)
+        self.plan_button.grid(row=0, column=5, padx=5)
         row += 1
 
         self.current_row = row
@@ -2611,6 +6429,17 @@ class JadeScraperGUI:
         except ValueError:
             wait_time = DEFAULT_WAIT_TIME
 
+        search_workers = int(self.search_workers_var.get().strip()) if self.search_workers_var.get(
+        ).strip().isdigit() else DEFAULT_SEARCH_WORKERS
+        download_workers = int(self.download_workers_var.get().strip()) if self.download_workers_var.get(
+        ).strip().isdigit() else DEFAULT_DOWNLOAD_WORKERS
+        shard_max_pages = int(self.shard_max_pages_var.get().strip()) if self.shard_max_pages_var.get(
+        ).strip().isdigit() else 0
+        try:
+            cache_ttl_hours = max(0.0, float(self.cache_ttl_var.get().strip() or 0))
+        except ValueError:
+            cache_ttl_hours = DEFAULT_CACHE_TTL_HOURS
+
         # Get the actual court name for search (map display name to actual name)
         selected_court = self.court_var.get()
         actual_court_name = None
@@ -2638,7 +6467,20 @@ class JadeScraperGUI:
             progress_callback=self.update_progress_log,
             generate_report=self.generate_report_var.get(),
             auto_retry_failed=self.auto_retry_var.get(),
-            resume_from_save=False
+            resume_from_save=False,
+            search_workers=max(1, search_workers),
+            download_workers=max(1, download_workers),
+            fetch_mode=("async" if self.async_mode_var.get()
+                        else "http" if self.http_mode_var.get() else "browser"),
+            shard_max_pages=shard_max_pages,
+            fan_out_courts=self.fan_out_courts_var.get(),
+            pipeline_downloads=self.pipeline_var.get(),
+            incremental=self.incremental_var.get(),
+            cache_ttl_hours=cache_ttl_hours,
+            pdf_download_mode="direct" if self.direct_pdf_var.get() else "browser",
+            adaptive_concurrency=self.adaptive_var.get(),
+            skip_existing=self.skip_existing_var.get(),
+            shared_store=self.shared_store_var.get()
         )
 
     def run_scraper(self):
@@ -2738,6 +6580,51 @@ class JadeScraperGUI:
         # Start scraper in background thread
         threading.Thread(target=scraper_task, daemon=True).start()
 
+    def run_plan(self):
+        """Estimate the cost of the current search without crawling it"""
+        config = self.get_search_config()
+        if not self.validate_inputs(config):
+            return
+
+        def plan_task():
+            try:
+                plan = self.scraper.plan_crawl([config])
+                plan_file = self.scraper.export_crawl_plan(plan)
+
+                self.output_box.delete("1.0", tk.END)
+                self.output_box.insert(tk.END, "=== CRAWL PLAN ===\n")
+                for job in plan['jobs']:
+                    label = job['court_name'] or "All Courts"
+                    if job['error']:
+                        self.output_box.insert(tk.END, f"• {label}: failed - {job['error']}\n")
+                        continue
+                    estimate = str(timedelta(seconds=int(job['estimated_total_seconds'])))
+                    self.output_box.insert(
+                        tk.END, f"• {label}: {job['total_pages']} pages, "
+                                f"~{job['estimated_links']} links, est. {estimate}\n")
+                total = str(timedelta(seconds=int(plan['estimated_total_seconds'])))
+                self.output_box.insert(
+                    tk.END, f"\nTotal: {plan['total_pages']} pages, ~{plan['estimated_links']} links, "
+                            f"est. {total}\nPlan saved to: {plan_file}\n")
+            except Exception as e:
+                logging.error(f"Planning error: {e}")
+                messagebox.showerror("Error", f"Planning failed: {e}")
+            finally:
+                self.progress_bar.stop()
+                self.status_label.config(text="Done")
+                self.search_button.config(state="normal")
+                self.plan_button.config(state="normal")
+                self.cancel_button.config(state="disabled")
+
+        self.output_box.delete("1.0", tk.END)
+        self.status_label.config(text="Planning...")
+        self.progress_bar.start()
+        self.search_button.config(state="disabled")
+        self.plan_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+
+        threading.Thread(target=plan_task, daemon=True).start()
+
     def run(self):
         """Start the GUI application"""
         self.root.mainloop()
@@ -2745,6 +6632,23 @@ class JadeScraperGUI:
 
 def main():
     """Main entry point"""
+    # Parser micro-benchmark: python "Jade Case Scraper.py" --benchmark-parsers page1.html ...
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark-parsers":
+        benchmark_parsers(sys.argv[2:])
+        return
+
+    # Headless link export: python "Jade Case Scraper.py" --stream-links out.jsonl "search terms"
+    if len(sys.argv) > 1 and sys.argv[1] == "--stream-links":
+        if len(sys.argv) < 4:
+            print('Usage: --stream-links OUTPUT(.jsonl|.csv) "search terms"')
+            return
+        scraper = JadeScraper()
+        count = scraper.stream_case_links(
+            SearchConfig(query=" ".join(sys.argv[3:]), progress_callback=print),
+            [open_link_sink(sys.argv[2])])
+        print(f"Wrote {count} links to {sys.argv[2]}")
+        return
+
     app = JadeScraperGUI()
     app.run()
 
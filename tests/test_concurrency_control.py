@@ -0,0 +1,114 @@
+"""Worker limits follow AIMD and the circuit breaker opens, probes and closes as the site fails and recovers"""
+import importlib.util
+import os
+
+import pytest
+
+for module in ("selenium", "bs4", "urllib3", "aiohttp", "psutil", "tkinter"):
+    pytest.importorskip(module)
+
+SCRAPER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "Jade Case Scraper.py")
+
+
+@pytest.fixture
+def jade():
+    spec = importlib.util.spec_from_file_location("jade_case_scraper", SCRAPER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_window(jade, controller, seconds=1.0, failures=0):
+    for n in range(jade.AIMD_WINDOW):
+        assert controller.acquire(lambda: False)
+        controller.release(seconds, ok=n >= failures)
+
+
+def test_fixed_controller_never_adjusts(jade):
+    controller = jade.ConcurrencyController(4)
+    assert controller.limit == 4
+    run_window(jade, controller, failures=jade.AIMD_WINDOW)
+    assert controller.limit == 4
+
+
+def test_adaptive_limit_increases_additively_up_to_max(jade):
+    controller = jade.ConcurrencyController(8, adaptive=True)
+    assert controller.limit == 4
+    for expected in (5, 6, 7, 8, 8):
+        run_window(jade, controller)
+        assert controller.limit == expected
+
+
+def test_adaptive_limit_halves_on_errors_or_slow_jobs(jade):
+    controller = jade.ConcurrencyController(16, adaptive=True)
+    run_window(jade, controller)
+    assert controller.limit == 9
+
+    run_window(jade, controller, failures=jade.AIMD_WINDOW // 2)
+    assert controller.limit == 4
+
+    run_window(jade, controller, seconds=jade.AIMD_LATENCY_FACTOR * 10)
+    assert controller.limit == 2
+    run_window(jade, controller, failures=jade.AIMD_WINDOW)
+    run_window(jade, controller, failures=jade.AIMD_WINDOW)
+    assert controller.limit == 1
+
+
+def test_acquire_gives_up_when_stopped_at_the_limit(jade):
+    controller = jade.ConcurrencyController(1)
+    assert controller.acquire(lambda: False)
+    assert not controller.acquire(lambda: True)
+    controller.release()
+    assert controller.acquire(lambda: True)
+
+
+def test_breaker_opens_after_consecutive_failures_only(jade):
+    breaker = jade.CircuitBreaker(lambda: True, threshold=3, window=60)
+    breaker.record(False)
+    breaker.record(False)
+    breaker.record(True)
+    breaker.record(False)
+    breaker.record(False)
+    assert not breaker.open
+    breaker.record(False)
+    assert breaker.open and breaker.trips == 1
+
+
+def test_breaker_ignores_failures_outside_the_window(jade, monkeypatch):
+    breaker = jade.CircuitBreaker(lambda: True, threshold=3, window=60)
+    clock = [1000.0]
+    monkeypatch.setattr(jade.time, "time", lambda: clock[0])
+    breaker.record(False)
+    breaker.record(False)
+    clock[0] += 120
+    breaker.record(False)
+    assert not breaker.open
+
+
+def test_breaker_probes_until_the_site_recovers(jade, monkeypatch):
+    monkeypatch.setattr(jade, "BREAKER_PROBE_BASE_DELAY", 0.01)
+    probes = []
+
+    def probe():
+        probes.append(len(probes))
+        if len(probes) == 1:
+            raise OSError("connection refused")
+        return len(probes) >= 3
+
+    breaker = jade.CircuitBreaker(probe, threshold=1)
+    assert breaker.wait_until_closed(lambda: False)  # Closed breakers do not probe
+    assert not probes
+
+    breaker.record(False)
+    assert breaker.open
+    assert breaker.wait_until_closed(lambda: False)
+    assert len(probes) == 3
+    assert not breaker.open and not breaker.probing and breaker.failures == []
+
+
+def test_breaker_wait_stops_when_cancelled(jade):
+    breaker = jade.CircuitBreaker(lambda: False, threshold=1)
+    breaker.record(False)
+    assert not breaker.wait_until_closed(lambda: True)
+    assert breaker.open and not breaker.probing
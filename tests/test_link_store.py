@@ -0,0 +1,66 @@
+"""LinkStore keeps insertion order, deduplicates by article ID and survives serialisation"""
+import importlib.util
+import os
+
+import pytest
+
+for module in ("selenium", "bs4", "urllib3", "aiohttp", "psutil", "tkinter"):
+    pytest.importorskip(module)
+
+SCRAPER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "Jade Case Scraper.py")
+
+
+@pytest.fixture
+def jade():
+    spec = importlib.util.spec_from_file_location("jade_case_scraper", SCRAPER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_round_trip_keeps_order_and_membership(jade):
+    links = ["/article/42", "/article/7", "https://jade.io/article/99", "/article/42",
+             "/no-id/here", f"/article/{2 ** 30}", f"/article/{2 ** 33}"]
+    store = jade.LinkStore(links)
+    expected = ["/article/42", "/article/7", "https://jade.io/article/99",
+                "/no-id/here", f"/article/{2 ** 30}", f"/article/{2 ** 33}"]
+    assert list(store) == expected
+
+    restored = jade.LinkStore.from_dict(store.to_dict())
+    assert list(restored) == expected
+    for link in expected:
+        assert link in restored
+    assert "/article/8" not in restored
+    assert not restored.append("/article/7")
+
+
+def test_plain_list_loads_as_store(jade):
+    assert list(jade.LinkStore.from_dict(["/article/1", "/article/1", "/article/2"])) == \
+        ["/article/1", "/article/2"]
+    assert len(jade.LinkStore.from_dict(None)) == 0
+
+
+def test_prefix_overflow_links_are_stored_verbatim_and_still_deduplicated(jade):
+    links = [f"/court{n}/article/{n}" for n in range(jade.LinkStore.EXTRA_MARKER + 5)]
+    store = jade.LinkStore(links)
+    assert list(store) == links
+
+    overflow = links[-1]
+    assert overflow in store._extra
+    # The same case under another prefix is recognised by its article ID
+    assert not store.append(f"/article/{jade.LinkStore.EXTRA_MARKER + 4}")
+
+    restored = jade.LinkStore.from_dict(store.to_dict())
+    assert list(restored) == links
+    assert f"/other/{jade.LinkStore.EXTRA_MARKER + 4}" in restored
+
+
+def test_remove_drops_the_case_and_keeps_the_rest(jade):
+    store = jade.LinkStore(["/article/1", "/article/2", "/no-id/here", "/article/3"])
+    assert store.remove("/article/2")
+    assert store.remove("/no-id/here")
+    assert not store.remove("/article/2")
+    assert list(store) == ["/article/1", "/article/3"]
+    assert "/article/2" not in store
+    assert store.append("/article/2")
@@ -0,0 +1,60 @@
+"""Downloads that keep failing PDF validation are parked after MAX_DOWNLOAD_ATTEMPTS"""
+import importlib.util
+import os
+
+import pytest
+
+for module in ("selenium", "bs4", "urllib3", "aiohttp", "psutil", "tkinter"):
+    pytest.importorskip(module)
+
+SCRAPER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "Jade Case Scraper.py")
+
+
+@pytest.fixture
+def jade():
+    spec = importlib.util.spec_from_file_location("jade_case_scraper", SCRAPER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_link_failing_validation_is_parked_after_max_attempts(jade, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(jade, "RETRY_BASE_DELAY", 0.01)
+    download_dir = tmp_path / "downloads"
+    download_dir.mkdir()
+
+    scraper = jade.JadeScraper()
+    config = jade.SearchConfig(query="test", download_pdfs=True, download_dir=str(download_dir),
+                               auto_retry_failed=True, skip_existing=False, shared_store=False)
+    scraper.progress_state = jade.ProgressState(
+        search_config={}, all_links=[], processed_pages=1, total_pages=1, downloaded_links=[],
+        failed_downloads=[], current_phase="download", timestamp="")
+
+    link = "/article/123456"
+    calls = []
+
+    def download_pdf(link, config, index=0, total=0, driver=None, wait=None, staging_dir=None):
+        calls.append(link)
+        if len(calls) > jade.MAX_DOWNLOAD_ATTEMPTS * 2:
+            scraper.cancelled = True  # Fail the test instead of looping forever
+        path = os.path.join(config.download_dir, "123456.pdf")
+        with open(path, "wb") as f:
+            f.write(b"<html>Session expired</html>")
+        scraper.validate_download(link, "123456", path)
+        return True, "Success (0s)"
+
+    monkeypatch.setattr(scraper, "download_pdf", download_pdf)
+
+    try:
+        failed = scraper.download_links(config, [link])
+    finally:
+        scraper.cleanup()
+
+    assert not scraper.cancelled
+    assert len(calls) == jade.MAX_DOWNLOAD_ATTEMPTS
+    assert len(failed) == 1 and link in failed[0] and "Invalid PDF" in failed[0]
+    assert not os.listdir(download_dir)
+    assert link not in scraper.progress_state.downloaded_links
+    assert len(scraper.retry_scheduler) == 0
@@ -0,0 +1,82 @@
+"""Failed downloads are classified by HTTP status and retried in due order with backoff"""
+import importlib.util
+import os
+
+import pytest
+
+for module in ("selenium", "bs4", "urllib3", "aiohttp", "psutil", "tkinter"):
+    pytest.importorskip(module)
+
+SCRAPER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "Jade Case Scraper.py")
+
+
+@pytest.fixture
+def jade():
+    spec = importlib.util.spec_from_file_location("jade_case_scraper", SCRAPER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def failure(jade, link, attempt_count=1, http_status=None):
+    return jade.FailedDownload(link=link, error_message="failed", timestamp="",
+                               attempt_count=attempt_count, http_status=http_status)
+
+
+@pytest.mark.parametrize("status, expected", [
+    (None, "transient"), (500, "transient"), (429, "throttled"), (503, "throttled"),
+    (401, "permanent"), (403, "permanent"), (404, "permanent"), (410, "permanent"),
+])
+def test_classify_download_error(jade, status, expected):
+    assert jade.classify_download_error(status) == expected
+
+
+def test_backoff_grows_per_attempt_and_is_capped(jade, monkeypatch):
+    monkeypatch.setattr(jade.random, "uniform", lambda low, high: 1.0)
+    delays = [jade.RetryScheduler.retry_delay(failure(jade, "/a", attempt))
+              for attempt in range(1, 5)]
+    assert delays == [jade.RETRY_BASE_DELAY * 2 ** n for n in range(4)]
+    assert jade.RetryScheduler.retry_delay(failure(jade, "/a", 30)) == jade.RETRY_MAX_DELAY
+
+    throttled = failure(jade, "/a", http_status=429)
+    throttled.error_class = jade.classify_download_error(429)
+    assert jade.RetryScheduler.retry_delay(throttled) == jade.RETRY_THROTTLED_BASE_DELAY
+
+
+def test_jitter_stays_within_half_to_one_and_a_half(jade):
+    for _ in range(50):
+        delay = jade.RetryScheduler.retry_delay(failure(jade, "/a"))
+        assert 0.5 * jade.RETRY_BASE_DELAY <= delay <= 1.5 * jade.RETRY_BASE_DELAY
+
+
+def test_retries_come_out_in_due_order(jade, monkeypatch):
+    monkeypatch.setattr(jade.random, "uniform", lambda low, high: 1.0)
+    scheduler = jade.RetryScheduler()
+    now = 1000.0
+    assert scheduler.schedule(failure(jade, "/late", attempt_count=3), since=now)
+    assert scheduler.schedule(failure(jade, "/early"), since=now)
+    assert scheduler.schedule(failure(jade, "/throttled", http_status=429), since=now)
+    assert len(scheduler) == 3
+
+    monkeypatch.setattr(jade.time, "time", lambda: now + 5)
+    assert scheduler.pop_due() is None
+    assert scheduler.seconds_until_due() == jade.RETRY_BASE_DELAY - 5
+
+    monkeypatch.setattr(jade.time, "time", lambda: now + 1000)
+    assert [scheduler.pop_due().link for _ in range(3)] == ["/early", "/late", "/throttled"]
+    assert scheduler.pop_due() is None and scheduler.seconds_until_due() is None
+
+
+def test_permanent_and_exhausted_failures_are_parked(jade):
+    scheduler = jade.RetryScheduler()
+    gone = failure(jade, "/gone", http_status=404)
+    assert not scheduler.schedule(gone)
+    assert gone.error_class == "permanent"
+
+    exhausted = failure(jade, "/tired", attempt_count=jade.MAX_DOWNLOAD_ATTEMPTS + 2)
+    assert not scheduler.schedule(exhausted)
+    assert exhausted.attempt_count == jade.MAX_DOWNLOAD_ATTEMPTS
+    assert scheduler.schedule(failure(jade, "/manual", jade.MAX_DOWNLOAD_ATTEMPTS), capped=False)
+    assert [f.link for f in scheduler.take_all()] == ["/manual"]
+    assert len(scheduler) == 0
@@ -0,0 +1,69 @@
+"""Cached search pages expire after their TTL and the least recently used are evicted first"""
+import importlib.util
+import json
+import os
+
+import pytest
+
+for module in ("selenium", "bs4", "urllib3", "aiohttp", "psutil", "tkinter"):
+    pytest.importorskip(module)
+
+SCRAPER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "Jade Case Scraper.py")
+
+
+@pytest.fixture
+def jade():
+    spec = importlib.util.spec_from_file_location("jade_case_scraper", SCRAPER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def search_url(page):
+    return f"https://jade.io/search/query=negligence:page={page}"
+
+
+def test_hit_and_equivalent_url(jade, tmp_path):
+    cache = jade.SearchPageCache(str(tmp_path), ttl_hours=1)
+    cache.put("https://jade.io/search/query=x:court=HCA", ["/article/1"], total_pages=3)
+    assert cache.get("https://JADE.io/search/court=HCA:query=x:page=0", want_total=True) == \
+        (["/article/1"], 3)
+    assert cache.get(search_url(9)) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_expire_after_ttl(jade, tmp_path):
+    cache = jade.SearchPageCache(str(tmp_path), ttl_hours=1)
+    cache.put(search_url(1), ["/article/1"])
+    path = cache._path(search_url(1))
+    with open(path, encoding="utf-8") as f:
+        entry = json.load(f)
+    entry["fetched_at"] -= 2 * 3600
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    assert cache.get(search_url(1)) is None
+
+
+def test_want_total_misses_entries_without_page_count(jade, tmp_path):
+    cache = jade.SearchPageCache(str(tmp_path), ttl_hours=1)
+    cache.put(search_url(1), ["/article/1"])
+    assert cache.get(search_url(1), want_total=True) is None
+    assert cache.get(search_url(1)) == (["/article/1"], None)
+
+
+def test_least_recently_used_entries_are_evicted(jade, tmp_path):
+    cache = jade.SearchPageCache(str(tmp_path), ttl_hours=1, max_entries=10)
+    for page in range(10):
+        cache.put(search_url(page), [f"/article/{page}"])
+        os.utime(cache._path(search_url(page)), (1000 + page, 1000 + page))
+
+    # Reading page 0 makes it the most recently used, so pages 1 and 2 go first
+    assert cache.get(search_url(0)) is not None
+    cache.put(search_url(10), ["/article/10"])
+
+    assert len(os.listdir(tmp_path)) == 9
+    assert cache.get(search_url(0)) is not None
+    assert cache.get(search_url(1)) is None
+    assert cache.get(search_url(2)) is None
+    assert cache.get(search_url(10)) is not None
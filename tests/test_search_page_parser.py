@@ -0,0 +1,59 @@
+"""The lxml and html.parser backends extract the same links and page counts from saved result pages"""
+import glob
+import importlib.util
+import logging
+import os
+
+import pytest
+
+for module in ("selenium", "bs4", "urllib3", "aiohttp", "psutil", "tkinter"):
+    pytest.importorskip(module)
+
+SCRAPER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "Jade Case Scraper.py")
+FIXTURES = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                         "fixtures", "search_page_*.html")))
+
+
+@pytest.fixture
+def jade():
+    spec = importlib.util.spec_from_file_location("jade_case_scraper", SCRAPER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("name, link_count, total_pages", [
+    ("search_page_first.html", 20, 37),
+    ("search_page_middle.html", 20, 37),
+    ("search_page_single.html", 6, None),
+])
+def test_html_parser_extracts_links_and_page_count(jade, name, link_count, total_pages):
+    path = os.path.join(os.path.dirname(FIXTURES[0]), name)
+    hrefs, total = jade.SearchPageParser("html.parser").parse(read(path))
+    assert len(hrefs) == link_count
+    assert all(href.startswith("/article/") for href in hrefs)
+    assert total == total_pages
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=os.path.basename)
+def test_backends_agree(jade, path):
+    pytest.importorskip("lxml")
+    html = read(path)
+    assert jade.SearchPageParser("lxml").parse(html) == \
+        jade.SearchPageParser("html.parser").parse(html)
+
+
+def test_benchmark_reports_through_logging(jade, caplog, capsys):
+    messages = []
+    with caplog.at_level(logging.INFO):
+        results = jade.benchmark_parsers(FIXTURES, iterations=1, progress_callback=messages.append)
+    assert "html.parser" in results and "legacy double parse" in results
+    assert len(messages) == len(results)
+    assert all("ms/page" in record.getMessage() for record in caplog.records)
+    assert capsys.readouterr().out == ""